@@ -0,0 +1,163 @@
+"""
+경쟁 상품 통계 엔진 벤치마크
+기존 list/dict + if/elif 구현과 컬럼형 엔진(compute_competitor_stats)의 실행 시간 비교
+
+실행: python benchmarks/bench_competitor_stats.py [상품 수 ...]
+"""
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from genesis_ai.core.analysis import ListingTable, compute_competitor_stats  # noqa: E402
+
+_BRANDS = [f"브랜드{i}" for i in range(300)] + [""] * 50
+_MALLS = [f"판매처{i}" for i in range(800)]
+_CATEGORIES = [
+    ("생활/건강", "생활용품", "해충퇴치용품", sub)
+    for sub in ("살충제", "모기향", "끈끈이", "기피제", "")
+] + [("생활/건강", "세제/세정제", "주방세제", "")]
+
+
+def _make_products(count: int, seed: int = 7) -> list[dict]:
+    """실제 검색 결과와 비슷한 분포의 가짜 상품"""
+    rng = random.Random(seed)
+    products = []
+    for i in range(count):
+        category = rng.choice(_CATEGORIES)
+        products.append({
+            "product_id": str(i),
+            "price": int(rng.lognormvariate(10, 0.8)) if rng.random() > 0.02 else 0,
+            "brand": rng.choice(_BRANDS),
+            "mall": rng.choice(_MALLS),
+            "category1": category[0],
+            "category2": category[1],
+            "category3": category[2],
+            "category4": category[3],
+        })
+    return products
+
+
+def legacy_analyze_competitors(products: list[dict]) -> dict:
+    """리팩토링 전 list/dict + if/elif 구현"""
+    if not products:
+        return {
+            "total_products": 0, "min_price": 0, "max_price": 0, "avg_price": 0,
+            "top_brands": [], "top_malls": [], "price_distribution": {},
+        }
+
+    prices = [p["price"] for p in products if p.get("price", 0) > 0]
+    if not prices:
+        return {
+            "total_products": len(products), "min_price": 0, "max_price": 0, "avg_price": 0,
+            "top_brands": [], "top_malls": [], "price_distribution": {},
+        }
+
+    brand_counts: dict[str, int] = {}
+    mall_counts: dict[str, int] = {}
+    for p in products:
+        brand = p.get("brand", "")
+        mall = p.get("mall", "")
+        if brand:
+            brand_counts[brand] = brand_counts.get(brand, 0) + 1
+        if mall:
+            mall_counts[mall] = mall_counts.get(mall, 0) + 1
+
+    top_brands = sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_malls = sorted(mall_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+
+    price_ranges = {"0-10000": 0, "10000-30000": 0, "30000-50000": 0, "50000-100000": 0, "100000+": 0}
+    for price in prices:
+        if price < 10000:
+            price_ranges["0-10000"] += 1
+        elif price < 30000:
+            price_ranges["10000-30000"] += 1
+        elif price < 50000:
+            price_ranges["30000-50000"] += 1
+        elif price < 100000:
+            price_ranges["50000-100000"] += 1
+        else:
+            price_ranges["100000+"] += 1
+
+    return {
+        "total_products": len(products),
+        "min_price": min(prices),
+        "max_price": max(prices),
+        "avg_price": sum(prices) // len(prices),
+        "top_brands": [b[0] for b in top_brands],
+        "top_malls": [m[0] for m in top_malls],
+        "price_distribution": price_ranges,
+    }
+
+
+def naive_full_stats(products: list[dict]) -> dict:
+    """엔진과 같은 지표를 dict/list로 직접 계산한 구현 (동일 지표 비교용)"""
+    stats = legacy_analyze_competitors(products)
+    prices = sorted(p["price"] for p in products if p.get("price", 0) > 0)
+
+    def _quantile(values: list[int], q: float) -> float:
+        position = (len(values) - 1) * q
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    stats["quantiles"] = {f"p{round(q * 100)}": round(_quantile(prices, q)) for q in (0.1, 0.25, 0.5, 0.75, 0.9)}
+    for field in ("brand", "mall"):
+        groups: dict[str, list[int]] = {}
+        for p in products:
+            if p.get(field) and p.get("price", 0) > 0:
+                groups.setdefault(p[field], []).append(p["price"])
+        stats[f"{field}_stats"] = {
+            name: {"min": min(v), "max": max(v), "avg": sum(v) // len(v), "median": _quantile(sorted(v), 0.5)}
+            for name, v in groups.items()
+        }
+    for level in range(1, 5):
+        totals: dict[str, list[int]] = {}
+        for p in products:
+            path = " > ".join(p.get(f"category{i}", "") for i in range(1, level + 1))
+            total = totals.setdefault(path, [0, 0])
+            total[0] += 1
+            total[1] += p.get("price", 0)
+        stats[f"category{level}"] = sorted(totals.items(), key=lambda item: -item[1][0])[:5]
+    return stats
+
+
+def _measure(func, repeat: int = 7) -> float:
+    """반복 실행 중앙값(ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    print(
+        f"{'상품 수':>8} {'기존(7개 지표)':>14} {'dict 직접(동일 지표)':>18} "
+        f"{'엔진(dict 입력)':>16} {'엔진(테이블 재사용)':>18}"
+    )
+    for size in sizes:
+        products = _make_products(size)
+        table = ListingTable.from_products(products)
+
+        legacy = legacy_analyze_competitors(products)
+        engine = compute_competitor_stats(products)
+        assert all(engine[key] == value for key, value in legacy.items()), "기존 결과와 불일치"
+
+        legacy_ms = _measure(lambda: legacy_analyze_competitors(products))
+        naive_ms = _measure(lambda: naive_full_stats(products))
+        engine_ms = _measure(lambda: compute_competitor_stats(products))
+        table_ms = _measure(lambda: compute_competitor_stats(table))
+        print(
+            f"{size:>8} {legacy_ms:>12.2f}ms {naive_ms:>16.2f}ms "
+            f"{engine_ms:>14.2f}ms {table_ms:>16.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
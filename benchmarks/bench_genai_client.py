@@ -0,0 +1,151 @@
+"""
+공용 genai 클라이언트 벤치마크
+로컬 가짜 Vertex AI 서버를 띄워 호출마다 genai.Client를 새로 만드는 방식과 GenaiClientProvider 공용
+클라이언트(연결 풀 공유)의 첫 호출(cold)/이후 호출(warm) 지연 시간 비교
+
+실행: python benchmarks/bench_genai_client.py [요청 수] [--tls]
+  --tls: openssl로 자체 서명 인증서를 만들어 HTTPS로 측정 (실제 API와 같은 TLS 핸드셰이크 포함)
+"""
+import json
+import logging
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from google import genai
+from google.genai import types
+from google.oauth2.credentials import Credentials
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from genesis_ai.infrastructure.clients.genai_provider import GenaiClientProvider  # noqa: E402
+from genesis_ai.utils.logger import get_logger  # noqa: E402
+
+_PROJECT, _LOCATION, _MODEL = "bench-project", "us-central1", "gemini-2.5-flash"
+
+# generateContent 응답과 같은 모양의 가짜 응답
+_PAYLOAD = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": "벌레 싹! 오늘 끝내세요"}]}}],
+    "usageMetadata": {"promptTokenCount": 1200, "candidatesTokenCount": 40, "totalTokenCount": 1240},
+}).encode("utf-8")
+
+
+class _FakeVertexHandler(BaseHTTPRequestHandler):
+    """keep-alive를 지원하는 가짜 generateContent 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_PAYLOAD)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _summarize(label: str, samples: list[float]) -> None:
+    """지연 시간 통계 출력 (ms)"""
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[max(0, int(len(samples_ms) * 0.95) - 1)]
+    print(
+        f"{label:<30} n={len(samples_ms):<5} mean={statistics.mean(samples_ms):8.3f}ms "
+        f"p50={statistics.median(samples_ms):8.3f}ms p95={p95:8.3f}ms"
+    )
+
+
+def _call(client) -> float:
+    """generate_content 1회 지연 시간"""
+    start = time.perf_counter()
+    client.models.generate_content(model=_MODEL, contents="훅 문구를 만들어 주세요")
+    return time.perf_counter() - start
+
+
+def _bench_per_call(base_url: str, count: int) -> list[float]:
+    """기존 방식: 호출마다 genai.Client 생성 (연결 풀/인증 정보 재생성)"""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        client = genai.Client(
+            vertexai=True,
+            project=_PROJECT,
+            location=_LOCATION,
+            credentials=Credentials(token="bench"),
+            http_options=types.HttpOptions(base_url=base_url),
+        )
+        _call(client)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _bench_shared(base_url: str, count: int, workers: int) -> tuple[float, list[float], list[float]]:
+    """개선 방식: GenaiClientProvider 공용 클라이언트 → (cold, 순차 warm, 동시 warm)"""
+    provider = GenaiClientProvider(credentials=Credentials(token="bench"), base_url=base_url)
+    start = time.perf_counter()
+    _call(provider.get(_PROJECT, _LOCATION))
+    cold = time.perf_counter() - start
+
+    warm = [_call(provider.get(_PROJECT, _LOCATION)) for _ in range(count)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        concurrent = list(pool.map(lambda _: _call(provider.get(_PROJECT, _LOCATION)), range(count)))
+    provider.close()
+    return cold, warm, concurrent
+
+
+def _enable_tls(server: ThreadingHTTPServer, workdir: str) -> None:
+    """자체 서명 인증서로 서버 소켓을 TLS로 감싸고 httpx가 신뢰하도록 설정"""
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    os.environ["SSL_CERT_FILE"] = cert
+
+
+def main() -> None:
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    count = int(args[0]) if args else 200
+    use_tls = "--tls" in sys.argv
+
+    get_logger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeVertexHandler)
+        if use_tls:
+            _enable_tls(server, workdir)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        scheme = "https" if use_tls else "http"
+        base_url = f"{scheme}://127.0.0.1:{server.server_address[1]}/"
+
+        print(f"generate_content {count}회 (로컬 {scheme.upper()} 서버)")
+        _summarize("호출마다 genai.Client 생성", _bench_per_call(base_url, count))
+        cold, warm, concurrent = _bench_shared(base_url, count, workers=8)
+        _summarize("공용 클라이언트 첫 호출(cold)", [cold])
+        _summarize("공용 클라이언트 순차(warm)", warm)
+        _summarize("공용 클라이언트 8스레드(warm)", concurrent)
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
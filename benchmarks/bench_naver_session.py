@@ -0,0 +1,141 @@
+"""
+NaverClient 연결 풀 벤치마크
+로컬 가짜 네이버 쇼핑 서버를 띄워 요청마다 새 연결(requests.get) vs 풀링 세션 지연 시간 비교
+
+실행: python benchmarks/bench_naver_session.py [요청 수] [--tls]
+  --tls: openssl로 자체 서명 인증서를 만들어 HTTPS로 측정 (실제 API와 같은 TLS 핸드셰이크 포함)
+"""
+import json
+import logging
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from genesis_ai.infrastructure.clients.naver_client import NaverClient  # noqa: E402
+from genesis_ai.utils.logger import get_logger  # noqa: E402
+
+# 실제 API 응답과 비슷한 크기의 가짜 상품 목록
+_PAYLOAD = json.dumps({
+    "items": [
+        {
+            "productId": str(i),
+            "title": f"<b>살충제</b> 상품 {i}",
+            "lprice": str(10000 + i * 100),
+            "mallName": "스마트스토어",
+            "brand": "블루가드",
+        }
+        for i in range(10)
+    ]
+}).encode("utf-8")
+
+
+class _FakeNaverHandler(BaseHTTPRequestHandler):
+    """keep-alive를 지원하는 가짜 쇼핑 API 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더/본문을 나눠 쓰는 http.server 특성상 Nagle이 켜져 있으면 keep-alive 연결에서
+    # 지연 ACK와 맞물려 ~40ms 지연이 생기므로 실제 서버처럼 즉시 전송
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_PAYLOAD)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _summarize(label: str, samples: list[float]) -> None:
+    """지연 시간 통계 출력 (ms)"""
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{label:<28} mean={statistics.mean(samples_ms):7.3f}ms "
+        f"p50={statistics.median(samples_ms):7.3f}ms p95={p95:7.3f}ms"
+    )
+
+
+def _bench_legacy(url: str, count: int) -> list[float]:
+    """기존 방식: 요청마다 모듈 레벨 requests.get + 헤더 재구성"""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        headers = {"X-Naver-Client-Id": "id", "X-Naver-Client-Secret": "secret"}
+        response = requests.get(url, headers=headers, params={"query": "살충제", "display": 10}, timeout=10)
+        response.json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _bench_pooled(url: str, count: int) -> list[float]:
+    """개선 방식: NaverClient 풀링 세션"""
+    # 호출 한도 대기/캐시 적중이 지연 시간에 섞이지 않도록 제한과 캐시를 끔
+    client = NaverClient(
+        "id", "secret", api_url=url, rate_limit_qps=1e6, daily_call_limit=None, cache_ttl=0
+    )
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        client.search_shopping("살충제", display=10)
+        samples.append(time.perf_counter() - start)
+    client.close()
+    return samples
+
+
+def _enable_tls(server: ThreadingHTTPServer, workdir: str) -> None:
+    """자체 서명 인증서로 서버 소켓을 TLS로 감싸고 requests가 신뢰하도록 설정"""
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    os.environ["REQUESTS_CA_BUNDLE"] = cert
+
+
+def main() -> None:
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    count = int(args[0]) if args else 300
+    use_tls = "--tls" in sys.argv
+
+    # 검색 로그 출력 비용이 측정에 섞이지 않도록 경고 이상만 출력
+    get_logger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeNaverHandler)
+        if use_tls:
+            _enable_tls(server, workdir)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        scheme = "https" if use_tls else "http"
+        url = f"{scheme}://127.0.0.1:{server.server_address[1]}/v1/search/shop.json"
+
+        print(f"요청 {count}회 (로컬 {scheme.upper()} 서버)")
+        _summarize("requests.get (연결 재생성)", _bench_legacy(url, count))
+        _summarize("NaverClient (keep-alive 풀)", _bench_pooled(url, count))
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,9 @@ THUMBNAIL_STYLES: Final[list[str]] = [
     "자연",
 ]
 
+# 다중 썸네일 생성 시 훅 문구에 차례로 적용하는 기본 스타일
+MULTI_THUMBNAIL_STYLES: Final[list[str]] = THUMBNAIL_STYLES[:3]
+
 # 색상 스킴
 COLOR_SCHEMES: Final[list[str]] = [
     "블루 그라디언트",
@@ -92,7 +95,155 @@ DEFAULT_VIDEO_RESOLUTION: Final[str] = "720p"
 DEFAULT_YOUTUBE_COUNT: Final[int] = 3
 DEFAULT_NAVER_COUNT: Final[int] = 10
 MAX_YOUTUBE_COUNT: Final[int] = 10
-MAX_NAVER_COUNT: Final[int] = 30
+MAX_NAVER_COUNT: Final[int] = 1000
+
+# 댓글 페인/게인 포인트 키워드
+PAIN_KEYWORDS: Final[list[str]] = [
+    "안됨", "안돼", "효과없", "효과 없", "별로", "실망", "냄새", "불편",
+    "어려", "비싸", "오래", "느리", "힘들", "짜증", "못", "안 ", "없어",
+    "부족", "문제", "고장", "AS", "환불", "반품",
+]
+GAIN_KEYWORDS: Final[list[str]] = [
+    "좋아", "최고", "효과", "추천", "만족", "대박", "잘", "빠르",
+    "확실", "깨끗", "사라", "없어졌", "해결", "굿", "완전", "감사", "찐",
+]
+MAX_KEYWORD_POINTS: Final[int] = 10
+KEYWORD_POINT_TEXT_LENGTH: Final[int] = 200
+MAX_CO_OCCURRENCE_PAIRS: Final[int] = 10
+PROMPT_SAMPLE_POINTS: Final[int] = 3      # 프롬프트에 넣을 페인/게인 예시 댓글 수 (종류별)
+PROMPT_SAMPLE_COMMENTS: Final[int] = 5    # 프롬프트에 넣을 인기 댓글 수
+PROMPT_MAX_PRODUCTS: Final[int] = 20      # 프롬프트에 넣을 네이버 상위 상품 수 (나머지는 competitor_stats로 요약)
+PROMPT_TOKEN_BUDGET: Final[int] = 4000    # 수집 데이터 프롬프트 토큰 예산 (추정치 기준)
+PROMPT_COMMENT_CHARS: Final[int] = 120    # 프롬프트에 넣을 댓글 최대 글자 수
+PROMPT_TRANSCRIPT_CHARS: Final[int] = 300  # 프롬프트에 넣을 영상 자막 최대 글자 수
+
+# 유사 중복 댓글 탐지 (MinHash/LSH)
+DEDUP_SHINGLE_SIZE: Final[int] = 3       # 문자 n-gram 길이
+DEDUP_SIGNATURE_SIZE: Final[int] = 64    # MinHash 시그니처 길이
+DEDUP_LSH_BANDS: Final[int] = 16         # 밴드 수 (밴드당 행 = 64 / 16 = 4)
+DEDUP_SIMILARITY_THRESHOLD: Final[float] = 0.7
+
+# 증분 댓글 수집
+COMMENT_BLOOM_CAPACITY: Final[int] = 5000     # 비디오당 기억할 댓글 ID 수
+COMMENT_BLOOM_ERROR_RATE: Final[float] = 0.01
+MAX_INCREMENTAL_COMMENT_PAGES: Final[int] = 5  # 새 댓글 조회 시 최대 페이지 수 (페이지당 100개)
+
+# 네이버 API HTTP 설정
+NAVER_HTTP_POOL_SIZE: Final[int] = 10     # keep-alive 연결 풀 크기
+NAVER_REQUEST_TIMEOUT: Final[float] = 10.0
+NAVER_PAGE_SIZE: Final[int] = 100         # API display 최대값
+NAVER_MAX_START: Final[int] = 1000        # API start 최대값
+NAVER_MAX_CONCURRENCY: Final[int] = 4     # 다중 페이지 동시 요청 수
+NAVER_QUERY_CONCURRENCY: Final[int] = 3   # 다중 검색어 동시 실행 수
+
+# 네이버 검색 결과 캐시 (TTL + stale-while-revalidate)
+NAVER_CACHE_TTL: Final[float] = 600.0           # 신선 구간(초)
+NAVER_CACHE_STALE_TTL: Final[float] = 3600.0    # 이전 값 즉시 반환 + 백그라운드 갱신 구간(초)
+NAVER_CACHE_MAX_ENTRIES: Final[int] = 512
+NAVER_CACHE_MAX_BYTES: Final[int] = 32 * 1024 * 1024
+
+# 공통 재시도 정책 (decorrelated jitter + 실행 단위 재시도 예산)
+RETRY_MAX_ATTEMPTS: Final[int] = 4         # 첫 시도 포함 최대 시도 수
+RETRY_BASE_DELAY: Final[float] = 0.5
+RETRY_MAX_DELAY: Final[float] = 20.0
+RETRY_BUDGET_RATIO: Final[float] = 0.2     # 첫 시도 대비 허용 재시도 비율
+RETRY_BUDGET_MIN: Final[int] = 10          # 호출이 적을 때도 허용하는 최소 재시도 수
+RETRYABLE_STATUS_CODES: Final[frozenset[int]] = frozenset({408, 429, 500, 502, 503, 504})
+
+# 모델 엔드포인트별 적응형 동시 호출 제한 (AIMD)
+CONCURRENCY_INITIAL_LIMIT: Final[int] = 4
+CONCURRENCY_MIN_LIMIT: Final[int] = 1
+CONCURRENCY_MAX_LIMIT: Final[int] = 16
+CONCURRENCY_DECREASE_FACTOR: Final[float] = 0.5     # 429 수신 시 한도에 곱하는 값
+CONCURRENCY_ACQUIRE_TIMEOUT: Final[float] = 300.0   # 자리 대기 최대 시간(초)
+
+# 공용 genai 클라이언트 (GeminiClient/VeoClient가 공유하는 연결 풀)
+GENAI_MAX_CONNECTIONS: Final[int] = 32     # 모델별 동시 호출 한도 합 + 헤지 요청 여유
+GENAI_MAX_KEEPALIVE: Final[int] = 16
+GENAI_AUTH_SCOPES: Final[tuple[str, ...]] = ("https://www.googleapis.com/auth/cloud-platform",)
+
+# 요청 헤징 (멱등 텍스트 호출의 꼬리 지연 단축)
+HEDGE_QUANTILE: Final[float] = 0.9          # 이 분위 지연을 넘기면 헤지 요청 전송
+HEDGE_BUDGET_RATIO: Final[float] = 0.05     # 전체 요청 대비 허용 헤지 비율
+HEDGE_MIN_SAMPLES: Final[int] = 20          # 헤징을 시작할 최소 지연 표본 수
+HEDGE_MIN_DELAY: Final[float] = 1.0         # 헤지 대기 시간 하한(초)
+HEDGE_LATENCY_WINDOW: Final[int] = 200      # 키별로 유지할 최근 지연 표본 수
+HEDGE_MAX_WORKERS: Final[int] = 16
+
+# 모델 캐스케이드 (빠른 모델 먼저, 필요할 때만 pro 모델로 상향)
+QUALITY_LEVELS: Final[tuple[str, ...]] = ("auto", "final")  # auto: 캐스케이드, final: pro 모델만
+CASCADE_MIN_HOOKS: Final[int] = 3      # 분석 결과 품질 검사: 최소 훅 문구 수
+CASCADE_MIN_KEYWORDS: Final[int] = 3   # 분석 결과 품질 검사: 최소 키워드 수
+
+# 다중 썸네일 동시 생성 수
+THUMBNAIL_CONCURRENCY: Final[int] = 3
+
+# 썸네일 후처리 (트랜스코딩/리사이즈 변형, 변형별 용량 예산)
+THUMBNAIL_FORMATS: Final[tuple[str, ...]] = ("webp", "jpeg")
+THUMBNAIL_VARIANT_SIZES: Final[dict[str, tuple[int, int] | None]] = {  # None이면 원본 크기
+    "preview": (480, 270),   # UI 미리보기
+    "hd": (1280, 720),       # 업로드
+    "original": None,
+}
+THUMBNAIL_MAX_BYTES: Final[dict[str, int]] = {
+    "preview": 60 * 1024,
+    "hd": 300 * 1024,
+    "original": 1024 * 1024,
+}
+THUMBNAIL_MIN_QUALITY: Final[int] = 40     # 용량 예산을 맞추려 품질을 낮출 때의 하한
+THUMBNAIL_QUALITY_STEP: Final[int] = 10
+
+# Gemini 응답 디스크 캐시
+GEMINI_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+GEMINI_CACHE_MAX_ENTRIES: Final[int] = 2000
+GEMINI_CACHE_TTLS: Final[dict[str, float]] = {  # 호출 유형별 TTL(초), 0이면 캐시하지 않음
+    "text": 24 * 3600.0,
+    "analysis": 6 * 3600.0,   # 검색 그라운딩 결과가 섞이므로 짧게
+    "image": 7 * 24 * 3600.0,
+}
+
+# 모델 호출 추정 단가 (USD, 토큰은 100만 개당, 2026년 공개 가격 기준 추정치)
+# prompt 단가는 캐시되지 않은 입력, cached는 컨텍스트 캐시 적중 입력, output은 출력+추론 토큰
+GEMINI_PRICING: Final[dict[str, dict[str, float]]] = {
+    "gemini-3-pro-preview": {"prompt": 2.0, "cached": 0.2, "output": 12.0},
+    "gemini-3-pro-image-preview": {"prompt": 2.0, "cached": 0.2, "output": 120.0},
+    "gemini-2.5-pro": {"prompt": 1.25, "cached": 0.125, "output": 10.0},
+    "gemini-2.5-flash": {"prompt": 0.3, "cached": 0.03, "output": 2.5},
+    "gemini-2.5-flash-lite": {"prompt": 0.1, "cached": 0.01, "output": 0.4},
+}
+VEO_PRICE_PER_SECOND: Final[dict[str, float]] = {  # 오디오 포함 생성 영상 1초당
+    "veo-3.1-generate-001": 0.4,
+    "veo-3.1-fast-generate-001": 0.15,
+}
+
+# 실행별 사용량 보고서
+USAGE_REPORT_WINDOW: Final[int] = 20           # 집계에 쓰는 최근 실행 수
+USAGE_REGRESSION_RATIO: Final[float] = 1.2     # 호출당 입력 토큰이 기준(이전 실행 중앙값)의 몇 배를 넘으면 경고
+USAGE_REGRESSION_MIN_RUNS: Final[int] = 3      # 기준을 만들 최소 이전 실행 수
+
+# 가격 스냅샷 저장소
+PRICE_INDEX_SHARDS: Final[int] = 64  # 상품 ID 색인 파일 분할 수
+
+# 경쟁 상품 통계
+COMPETITOR_PRICE_BIN_EDGES: Final[list[int]] = [10000, 30000, 50000, 100000]  # 기본 가격 구간 경계(원)
+COMPETITOR_AUTO_MAX_BINS: Final[int] = 12      # 자동 구간 최대 개수
+COMPETITOR_QUANTILES: Final[list[float]] = [0.1, 0.25, 0.5, 0.75, 0.9]
+COMPETITOR_TOP_GROUPS: Final[int] = 5          # 브랜드/판매처 상위 개수
+COMPETITOR_TOP_CATEGORIES: Final[int] = 5      # 카테고리 단계별 상위 개수
+
+# 경쟁 상품 수집용 검색어 템플릿 (제품 dict의 name/target/category로 채움)
+NAVER_QUERY_TEMPLATES: Final[list[str]] = [
+    "{name}",
+    "{target} 퇴치",
+    "{category}",
+]
+
+# 네이버 API 호출 제한 및 재시도
+NAVER_RATE_LIMIT_QPS: Final[float] = 10.0   # 초당 호출 한도
+NAVER_DAILY_CALL_LIMIT: Final[int] = 25000  # 일일 호출 한도 (KST 자정 초기화)
+NAVER_MAX_RETRIES: Final[int] = 3           # 429/5xx 재시도 횟수
+NAVER_RETRY_BASE_DELAY: Final[float] = 0.5  # 지수 백오프 기본 대기(초)
+NAVER_RETRY_MAX_DELAY: Final[float] = 8.0   # 백오프 최대 대기(초)
 
 # 카메라 모션 (비디오 생성용)
 CAMERA_MOTIONS: Final[list[str]] = [
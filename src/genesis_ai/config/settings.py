@@ -41,6 +41,11 @@ class NaverSettings(BaseSettings):
 
     client_id: SecretStr = Field(..., validation_alias="NAVER_CLIENT_ID")
     client_secret: SecretStr = Field(..., validation_alias="NAVER_CLIENT_SECRET")
+    pool_size: int = Field(default=10, validation_alias="NAVER_POOL_SIZE")
+    rate_limit_qps: float = Field(default=10.0, validation_alias="NAVER_RATE_LIMIT_QPS")
+    daily_call_limit: int = Field(default=25000, validation_alias="NAVER_DAILY_CALL_LIMIT")
+    cache_ttl: float = Field(default=600.0, validation_alias="NAVER_CACHE_TTL")
+    cache_stale_ttl: float = Field(default=3600.0, validation_alias="NAVER_CACHE_STALE_TTL")
 
 
 class AIModelSettings(BaseSettings):
@@ -56,9 +61,35 @@ class AIModelSettings(BaseSettings):
     gemini_image_model: str = Field(
         default="gemini-3-pro-image-preview", validation_alias="GEMINI_IMAGE_MODEL"
     )
+    # 캐스케이드 1단계(빠른) 모델, 빈 값이면 항상 gemini_text_model만 사용
+    gemini_fast_model: str = Field(
+        default="gemini-2.5-flash", validation_alias="GEMINI_FAST_MODEL"
+    )
     veo_model_id: str = Field(
         default="veo-3.1-fast-generate-001", validation_alias="VEO_MODEL_ID"
     )
+    prompt_token_budget: int = Field(
+        default=4000, validation_alias="GEMINI_PROMPT_TOKEN_BUDGET"
+    )
+    gemini_cache_enabled: bool = Field(
+        default=True, validation_alias="GEMINI_CACHE_ENABLED"
+    )
+    thumbnail_concurrency: int = Field(
+        default=3, validation_alias="GEMINI_THUMBNAIL_CONCURRENCY"
+    )
+    # 썸네일 후처리: 출력 포맷(webp/jpeg), 인코딩 품질, 프로세스 풀 크기(0이면 호출 스레드에서 처리)
+    thumbnail_format: str = Field(default="webp", validation_alias="THUMBNAIL_FORMAT")
+    thumbnail_quality: int = Field(default=80, validation_alias="THUMBNAIL_QUALITY")
+    thumbnail_process_workers: int = Field(default=2, validation_alias="THUMBNAIL_PROCESS_WORKERS")
+    # 모델별 적응형 동시 호출 한도의 상한
+    max_concurrency: int = Field(default=16, validation_alias="MODEL_MAX_CONCURRENCY")
+    # 텍스트 생성/마케팅 분석 요청 헤징 (p90 지연을 넘기면 같은 요청을 한 번 더 전송)
+    gemini_hedging_enabled: bool = Field(
+        default=False, validation_alias="GEMINI_HEDGING_ENABLED"
+    )
+    gemini_hedge_budget_ratio: float = Field(
+        default=0.05, validation_alias="GEMINI_HEDGE_BUDGET_RATIO"
+    )
 
 
 class AppSettings(BaseSettings):
@@ -71,6 +102,8 @@ class AppSettings(BaseSettings):
     app_name: str = "Genesis AI Studio"
     debug: bool = Field(default=False, validation_alias="DEBUG")
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+    # 댓글 코퍼스/캐시 등 로컬 영속 데이터를 저장할 디렉토리
+    cache_dir: str = Field(default=".genesis_cache", validation_alias="GENESIS_CACHE_DIR")
 
 
 class Settings:
@@ -0,0 +1,66 @@
+"""
+분석 엔진 패키지
+외부 의존성 없이 수집 데이터를 가공하는 순수 로직
+"""
+from .comment_batch import CommentBatch, StringColumn
+from .competitor_stats import (
+    DictionaryColumn,
+    ListingTable,
+    auto_bin_edges,
+    compute_competitor_stats,
+    price_bins,
+    quantile,
+)
+from .listing_canonicalizer import (
+    canonical_key,
+    canonicalize_listings,
+    clean_title,
+    normalize_title,
+)
+from .prompt_packer import estimate_tokens, pack_collected_data
+from .dedup import NearDuplicateClusterer, collapse_near_duplicates, normalize_comment
+from .keyword_extractor import (
+    analyze_gain_points,
+    analyze_keywords,
+    analyze_pain_points,
+    extract_gain_points,
+    extract_keyword_points,
+    extract_pain_points,
+    match_first_keywords,
+    scan_keywords,
+    summarize_keyword_hits,
+)
+
+__all__ = [
+    # Comments
+    "CommentBatch",
+    "StringColumn",
+    "scan_keywords",
+    "match_first_keywords",
+    "extract_keyword_points",
+    "extract_pain_points",
+    "extract_gain_points",
+    "summarize_keyword_hits",
+    "analyze_keywords",
+    "analyze_pain_points",
+    "analyze_gain_points",
+    # Dedup
+    "NearDuplicateClusterer",
+    "collapse_near_duplicates",
+    "normalize_comment",
+    # Competitors
+    "DictionaryColumn",
+    "ListingTable",
+    "compute_competitor_stats",
+    "auto_bin_edges",
+    "price_bins",
+    "quantile",
+    # Listings
+    "canonicalize_listings",
+    "canonical_key",
+    "clean_title",
+    "normalize_title",
+    # Prompt
+    "pack_collected_data",
+    "estimate_tokens",
+]
@@ -0,0 +1,241 @@
+"""
+댓글 컬럼형 배치
+수만 개 댓글을 dict 리스트 대신 연속 문자열 버퍼 + 타입 배열로 보관
+"""
+import heapq
+import math
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
+
+# 행 구분자 - 키워드가 두 댓글에 걸쳐 매칭되지 않도록 각 행 끝에 붙임
+ROW_SEPARATOR = "\x00"
+
+
+def parse_timestamp(value: Any) -> float:
+    """ISO 8601 문자열/datetime → epoch 초 (값이 없거나 형식 오류면 NaN)"""
+    if not value:
+        return math.nan
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        # Python 3.10의 fromisoformat은 'Z' 접미사를 지원하지 않으므로 치환
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return math.nan
+
+
+def format_timestamp(value: float) -> str:
+    """epoch 초 → YouTube API와 같은 ISO 8601 UTC 문자열 (NaN이면 빈 문자열)"""
+    if math.isnan(value):
+        return ""
+    return datetime.fromtimestamp(value, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class StringColumn:
+    """문자열 컬럼 (연속 버퍼 + 오프셋 배열)"""
+
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self, buffer: str, offsets: array) -> None:
+        # offsets[i]는 i번째 행의 시작 위치, offsets[-1]은 버퍼 전체 길이
+        self._buffer = buffer
+        self._offsets = offsets
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "StringColumn":
+        """문자열 목록으로 컬럼 생성"""
+        offsets = array("q", [0])
+        parts: list[str] = []
+        position = 0
+        for value in values:
+            clean = (value or "").replace(ROW_SEPARATOR, "")
+            parts.append(clean)
+            position += len(clean) + 1
+            offsets.append(position)
+        buffer = ROW_SEPARATOR.join(parts) + ROW_SEPARATOR if parts else ""
+        return cls(buffer, offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        return self._buffer[self._offsets[row] : self._offsets[row + 1] - 1]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    @property
+    def nbytes(self) -> int:
+        """버퍼 + 오프셋이 차지하는 대략적인 메모리 (바이트)"""
+        return len(self._buffer.encode("utf-8")) + self._offsets.itemsize * len(self._offsets)
+
+    def rows_containing(self, needle: str) -> list[int]:
+        """needle을 포함하는 행 번호 목록 (오름차순, 중복 없음)
+
+        행마다 `in` 검사를 반복하는 대신 버퍼 전체를 str.find로 훑고,
+        매치 위치를 오프셋 이진 탐색으로 행 번호로 변환합니다.
+        """
+        if not needle:
+            return list(range(len(self)))
+        if ROW_SEPARATOR in needle:
+            return []
+
+        buffer, offsets = self._buffer, self._offsets
+        rows: list[int] = []
+        position = buffer.find(needle)
+        while position != -1:
+            row = bisect_right(offsets, position) - 1
+            rows.append(row)
+            # 같은 행 안의 추가 매치는 의미가 없으므로 다음 행 시작점부터 다시 탐색
+            position = buffer.find(needle, offsets[row + 1])
+        return rows
+
+    def take(self, rows: Sequence[int]) -> "StringColumn":
+        """지정한 행만 골라 새 컬럼 생성"""
+        return StringColumn.from_values(self[row] for row in rows)
+
+    @classmethod
+    def concat(cls, columns: Sequence["StringColumn"]) -> "StringColumn":
+        """여러 컬럼을 하나로 이어 붙이기"""
+        offsets = array("q", [0])
+        base = 0
+        for column in columns:
+            offsets.extend(base + o for o in column._offsets[1:])
+            base += len(column._buffer)
+        return cls("".join(c._buffer for c in columns), offsets)
+
+
+class CommentBatch:
+    """댓글 컬럼형 배치 (텍스트/작성자 버퍼 + 좋아요/작성시각 타입 배열)"""
+
+    __slots__ = ("texts", "authors", "likes", "timestamps")
+
+    def __init__(
+        self,
+        texts: StringColumn,
+        authors: StringColumn,
+        likes: array,
+        timestamps: array,
+    ) -> None:
+        self.texts = texts
+        self.authors = authors
+        self.likes = likes
+        self.timestamps = timestamps
+
+    @classmethod
+    def empty(cls) -> "CommentBatch":
+        """빈 배치"""
+        return cls(
+            StringColumn.from_values([]),
+            StringColumn.from_values([]),
+            array("q"),
+            array("d"),
+        )
+
+    @classmethod
+    def from_dicts(cls, comments: Iterable[dict]) -> "CommentBatch":
+        """기존 dict 리스트(text, likes, author, published_at)를 배치로 변환"""
+        texts: list[str] = []
+        authors: list[str] = []
+        likes = array("q")
+        timestamps = array("d")
+        for comment in comments:
+            texts.append(comment.get("text", ""))
+            authors.append(comment.get("author", ""))
+            likes.append(int(comment.get("likes") or 0))
+            timestamps.append(parse_timestamp(comment.get("published_at")))
+        return cls(
+            StringColumn.from_values(texts),
+            StringColumn.from_values(authors),
+            likes,
+            timestamps,
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence["CommentBatch"]) -> "CommentBatch":
+        """여러 배치를 하나로 합치기 (비디오별 수집 결과 병합용)"""
+        if not batches:
+            return cls.empty()
+        likes = array("q")
+        timestamps = array("d")
+        for batch in batches:
+            likes.extend(batch.likes)
+            timestamps.extend(batch.timestamps)
+        return cls(
+            StringColumn.concat([b.texts for b in batches]),
+            StringColumn.concat([b.authors for b in batches]),
+            likes,
+            timestamps,
+        )
+
+    def __len__(self) -> int:
+        return len(self.likes)
+
+    @property
+    def nbytes(self) -> int:
+        """배치 전체가 차지하는 대략적인 메모리 (바이트)"""
+        return (
+            self.texts.nbytes
+            + self.authors.nbytes
+            + self.likes.itemsize * len(self.likes)
+            + self.timestamps.itemsize * len(self.timestamps)
+        )
+
+    def text(self, row: int) -> str:
+        """댓글 본문"""
+        return self.texts[row]
+
+    def to_dict(self, row: int) -> dict:
+        """한 행을 기존 dict 형식으로 변환 (UI/프롬프트 호환용)"""
+        return {
+            "text": self.texts[row],
+            "likes": self.likes[row],
+            "author": self.authors[row],
+            "published_at": format_timestamp(self.timestamps[row]),
+        }
+
+    def to_dicts(self, rows: Iterable[int] | None = None) -> list[dict]:
+        """여러 행을 dict 리스트로 변환 (rows 생략 시 전체)"""
+        if rows is None:
+            rows = range(len(self))
+        return [self.to_dict(row) for row in rows]
+
+    def take(self, rows: Sequence[int]) -> "CommentBatch":
+        """지정한 행만 골라 새 배치 생성"""
+        return CommentBatch(
+            self.texts.take(rows),
+            self.authors.take(rows),
+            array("q", (self.likes[row] for row in rows)),
+            array("d", (self.timestamps[row] for row in rows)),
+        )
+
+    def top_indices(self, k: int) -> list[int]:
+        """좋아요 상위 k개 행 번호 (동점이면 먼저 수집된 순서 유지)"""
+        return heapq.nlargest(k, range(len(self)), key=self.likes.__getitem__)
+
+    def stats(self) -> dict:
+        """좋아요/작성시각 기본 통계"""
+        count = len(self)
+        if count == 0:
+            return {
+                "count": 0,
+                "total_likes": 0,
+                "avg_likes": 0.0,
+                "max_likes": 0,
+                "first_published_at": "",
+                "last_published_at": "",
+            }
+
+        total_likes = sum(self.likes)
+        valid_times = [t for t in self.timestamps if not math.isnan(t)]
+        return {
+            "count": count,
+            "total_likes": total_likes,
+            "avg_likes": round(total_likes / count, 2),
+            "max_likes": max(self.likes),
+            "first_published_at": format_timestamp(min(valid_times)) if valid_times else "",
+            "last_published_at": format_timestamp(max(valid_times)) if valid_times else "",
+        }
@@ -0,0 +1,313 @@
+"""
+경쟁 상품 통계 엔진
+상품 dict 리스트를 가격 배열 + 사전 인코딩 코드 배열로 한 번 변환한 뒤 분위수/가격 구간/
+브랜드·판매처별 가격 통계/카테고리 집계를 정렬된 배열 위에서 계산
+"""
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import compress
+from typing import Hashable, Iterable, Sequence
+
+from ...config.constants import (
+    COMPETITOR_AUTO_MAX_BINS,
+    COMPETITOR_PRICE_BIN_EDGES,
+    COMPETITOR_QUANTILES,
+    COMPETITOR_TOP_CATEGORIES,
+    COMPETITOR_TOP_GROUPS,
+)
+
+CATEGORY_LEVELS = 4
+_CATEGORY_SEPARATOR = " > "
+
+
+class DictionaryColumn:
+    """사전 인코딩 컬럼 (값 → 정수 코드, 첫 등장 순서대로 번호 부여)
+
+    빈 값도 하나의 코드로 인코딩하고, 집계 단계에서 빈 값 코드를 건너뜁니다.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: array, values: list[Hashable]) -> None:
+        self.codes = codes
+        self.values = values
+
+    @classmethod
+    def from_values(cls, values: Iterable[Hashable]) -> "DictionaryColumn":
+        """값 목록 인코딩"""
+        lookup: dict[Hashable, int] = {}
+        setdefault = lookup.setdefault
+        codes = array("i", [setdefault(value, len(lookup)) for value in values])
+        return cls(codes, list(lookup))
+
+    def counts(self) -> list[int]:
+        """코드별 행 수"""
+        counter = Counter(self.codes)
+        return [counter[code] for code in range(len(self.values))]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class ListingTable:
+    """네이버 상품 목록의 컬럼형 표현"""
+
+    __slots__ = ("prices", "brands", "malls", "categories")
+
+    def __init__(
+        self,
+        prices: array,
+        brands: DictionaryColumn,
+        malls: DictionaryColumn,
+        categories: DictionaryColumn,
+    ) -> None:
+        self.prices = prices
+        self.brands = brands
+        self.malls = malls
+        # 카테고리는 (category1, ..., category4) 전체 경로 하나로 인코딩 (상위 단계는 경로에서 파생)
+        self.categories = categories
+
+    @classmethod
+    def from_products(cls, products: Sequence[dict]) -> "ListingTable":
+        """상품 dict 목록 → 컬럼형 테이블"""
+        prices = array("q", [p.get("price", 0) or 0 for p in products])
+        brands = DictionaryColumn.from_values([p.get("brand", "") for p in products])
+        malls = DictionaryColumn.from_values([p.get("mall", "") for p in products])
+        categories = DictionaryColumn.from_values([
+            (
+                p.get("category1", ""),
+                p.get("category2", ""),
+                p.get("category3", ""),
+                p.get("category4", ""),
+            )
+            for p in products
+        ])
+        return cls(prices, brands, malls, categories)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+def quantile(sorted_values: Sequence[int], q: float) -> float:
+    """정렬된 값의 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _nice_width(raw: float) -> int:
+    """1/2/5 × 10^k 중 raw 이상인 가장 작은 폭"""
+    if raw <= 1:
+        return 1
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for step in (1, 2, 5, 10):
+        if step * magnitude >= raw:
+            return int(step * magnitude)
+    return int(10 * magnitude)
+
+
+def auto_bin_edges(sorted_prices: Sequence[int], max_bins: int = COMPETITOR_AUTO_MAX_BINS) -> list[int]:
+    """Freedman-Diaconis 규칙으로 가격 구간 경계 자동 산출 (보기 좋은 단위로 반올림)"""
+    if len(sorted_prices) < 2 or sorted_prices[0] == sorted_prices[-1]:
+        return []
+    low, high = sorted_prices[0], sorted_prices[-1]
+    iqr = quantile(sorted_prices, 0.75) - quantile(sorted_prices, 0.25)
+    width = 2 * iqr / len(sorted_prices) ** (1 / 3) if iqr > 0 else 0
+    # 구간 수가 너무 많거나(IQR이 작음) 0이면 전체 범위를 max_bins로 나눔
+    width = max(width, (high - low) / max_bins)
+    width = _nice_width(width)
+
+    start = (low // width) * width
+    edges = []
+    edge = start + width
+    while edge <= high:
+        edges.append(int(edge))
+        edge += width
+    return edges
+
+
+def _bin_label(lower: int | None, upper: int | None) -> str:
+    """가격 구간 이름 (기존 price_distribution 키 형식)"""
+    if upper is None:
+        return f"{lower or 0}+"
+    return f"{lower or 0}-{upper}"
+
+
+def price_bins(sorted_prices: Sequence[int], edges: Sequence[int]) -> list[dict]:
+    """경계 목록으로 구간별 개수 계산 ([lower, upper) 구간, 정렬 배열 이진 탐색)"""
+    bounds: list[int | None] = [None, *edges, None]
+    bins = []
+    for lower, upper in zip(bounds, bounds[1:]):
+        start = bisect_left(sorted_prices, lower) if lower is not None else 0
+        end = bisect_left(sorted_prices, upper) if upper is not None else len(sorted_prices)
+        bins.append({
+            "label": _bin_label(lower, upper),
+            "lower": lower or 0,
+            "upper": upper,
+            "count": end - start,
+        })
+    return bins
+
+
+def _group_stats(
+    column: DictionaryColumn,
+    sorted_prices: Sequence[int],
+    sorted_codes: Sequence[int],
+    limit: int,
+) -> list[dict]:
+    """그룹(브랜드/판매처)별 상품 수와 가격 통계, 상품 수 상위 limit개
+
+    sorted_codes는 가격 오름차순으로 정렬한 행의 그룹 코드이므로 그룹별로 모은 가격 목록은
+    이미 정렬되어 있어 최소/최대/중앙값을 바로 읽을 수 있습니다.
+    가격이 0 이하인 상품은 개수에만 포함됩니다.
+    """
+    counts = column.counts()
+    values = column.values
+
+    # 개수 내림차순, 같으면 첫 등장 순 (기존 top_brands/top_malls 순서와 동일)
+    top_codes = sorted(
+        (code for code, count in enumerate(counts) if values[code]),
+        key=lambda code: -counts[code],
+    )[:limit]
+
+    stats = []
+    for code in top_codes:
+        # compress/map은 C 수준에서 돌기 때문에 그룹당 한 번씩 훑어도 파이썬 루프보다 빠름
+        group_prices = list(compress(sorted_prices, map(code.__eq__, sorted_codes)))
+        entry = {"name": values[code], "count": counts[code]}
+        if group_prices:
+            entry.update({
+                "min_price": group_prices[0],
+                "max_price": group_prices[-1],
+                "avg_price": sum(group_prices) // len(group_prices),
+                "median_price": round(quantile(group_prices, 0.5)),
+            })
+        stats.append(entry)
+    return stats
+
+
+def _category_rollups(
+    column: DictionaryColumn,
+    sorted_prices: Sequence[int],
+    sorted_codes: Sequence[int],
+    limit: int,
+) -> dict[str, list[dict]]:
+    """category1~4 단계별 상품 수/평균 가격 (상위 limit개)
+
+    서로 다른 전체 경로 수는 상품 수보다 훨씬 적으므로 경로 단위로 먼저 합산한 뒤
+    상위 단계로 말아 올립니다.
+    """
+    path_counts = column.counts()
+    path_sums = [0] * len(column.values)
+    path_priced = [0] * len(column.values)
+    for price, code in zip(sorted_prices, sorted_codes):
+        path_sums[code] += price
+        path_priced[code] += 1
+
+    rollups: dict[str, list[dict]] = {}
+    for level in range(1, CATEGORY_LEVELS + 1):
+        totals: dict[tuple, list[int]] = {}
+        for code, path in enumerate(column.values):
+            prefix = path[:level]
+            if not prefix[-1]:
+                continue
+            total = totals.setdefault(prefix, [0, 0, 0])
+            total[0] += path_counts[code]
+            total[1] += path_sums[code]
+            total[2] += path_priced[code]
+        ranked = sorted(totals.items(), key=lambda item: -item[1][0])[:limit]
+        rollups[f"category{level}"] = [
+            {
+                "path": _CATEGORY_SEPARATOR.join(prefix),
+                "count": count,
+                "avg_price": price_sum // priced if priced else 0,
+            }
+            for prefix, (count, price_sum, priced) in ranked
+        ]
+    return rollups
+
+
+def _empty_stats(total_products: int) -> dict:
+    """가격 정보가 없을 때의 결과 (기존 키 유지)"""
+    return {
+        "total_products": total_products,
+        "min_price": 0,
+        "max_price": 0,
+        "avg_price": 0,
+        "top_brands": [],
+        "top_malls": [],
+        "price_distribution": {},
+        "quantiles": {},
+        "price_bins": [],
+        "brand_stats": [],
+        "mall_stats": [],
+        "category_stats": {},
+    }
+
+
+def compute_competitor_stats(
+    products: Sequence[dict] | ListingTable,
+    bin_edges: Sequence[int] | str | None = None,
+    top_n: int = COMPETITOR_TOP_GROUPS,
+) -> dict:
+    """경쟁 상품 통계
+
+    bin_edges: 가격 구간 경계 목록, "auto"(Freedman-Diaconis), None(기본 5구간).
+    기존 analyze_competitors 결과 키(total_products, min/max/avg_price, top_brands,
+    top_malls, price_distribution)는 그대로 유지하고 분위수/구간/그룹/카테고리 통계를 추가합니다.
+    """
+    table = products if isinstance(products, ListingTable) else ListingTable.from_products(products)
+    if not len(table):
+        return _empty_stats(0)
+
+    prices = table.prices
+    # 가격 오름차순 행 번호 - 분위수, 구간, 그룹 중앙값 계산에 공통으로 사용
+    order = sorted(range(len(prices)), key=prices.__getitem__)
+    first_priced = bisect_left([prices[row] for row in order], 1)
+    order = order[first_priced:]
+    if not order:
+        return _empty_stats(len(table))
+    sorted_prices = array("q", [prices[row] for row in order])
+
+    if bin_edges == "auto":
+        edges = auto_bin_edges(sorted_prices)
+    else:
+        edges = list(bin_edges if bin_edges is not None else COMPETITOR_PRICE_BIN_EDGES)
+    bins = price_bins(sorted_prices, edges)
+
+    brand_codes = table.brands.codes
+    mall_codes = table.malls.codes
+    category_codes = table.categories.codes
+    brand_stats = _group_stats(
+        table.brands, sorted_prices, [brand_codes[row] for row in order], top_n
+    )
+    mall_stats = _group_stats(
+        table.malls, sorted_prices, [mall_codes[row] for row in order], top_n
+    )
+    category_stats = _category_rollups(
+        table.categories, sorted_prices, [category_codes[row] for row in order],
+        COMPETITOR_TOP_CATEGORIES,
+    )
+
+    return {
+        "total_products": len(table),
+        "min_price": sorted_prices[0],
+        "max_price": sorted_prices[-1],
+        "avg_price": sum(sorted_prices) // len(sorted_prices),
+        "top_brands": [s["name"] for s in brand_stats],
+        "top_malls": [s["name"] for s in mall_stats],
+        "price_distribution": {b["label"]: b["count"] for b in bins},
+        "quantiles": {
+            f"p{round(q * 100)}": round(quantile(sorted_prices, q)) for q in COMPETITOR_QUANTILES
+        },
+        "price_bins": bins,
+        "brand_stats": brand_stats,
+        "mall_stats": mall_stats,
+        "category_stats": category_stats,
+    }
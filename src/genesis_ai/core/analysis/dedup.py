@@ -0,0 +1,183 @@
+"""
+유사 중복 댓글 탐지
+문자 n-gram MinHash + LSH 밴딩으로 복붙/거의 같은 댓글을 하나로 묶음
+"""
+import hashlib
+import re
+from array import array
+
+from ...config.constants import (
+    DEDUP_LSH_BANDS,
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_SIGNATURE_SIZE,
+    DEDUP_SIMILARITY_THRESHOLD,
+)
+from .comment_batch import CommentBatch
+
+_HASH_SPACE = 1 << 64
+
+# 공백/문장부호/이모지 제거용 - "효과 좋아요!!"와 "효과좋아요"를 같은 문자열로 취급
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_comment(text: str) -> str:
+    """비교용 정규화 (소문자 + 문자/숫자만 남김)"""
+    normalized = _NON_WORD.sub("", text.lower())
+    # 이모지만 있는 댓글은 정규화하면 빈 문자열이 되므로 원문을 그대로 사용
+    return normalized or text.strip()
+
+
+class _DisjointSet:
+    """클러스터 병합용 Union-Find"""
+
+    def __init__(self, size: int) -> None:
+        self._parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 작은 번호를 루트로 유지해 클러스터 순서가 수집 순서를 따르도록 함
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self._parent[root_b] = root_a
+
+
+class NearDuplicateClusterer:
+    """MinHash/LSH 기반 유사 중복 댓글 클러스터러"""
+
+    def __init__(
+        self,
+        shingle_size: int = DEDUP_SHINGLE_SIZE,
+        signature_size: int = DEDUP_SIGNATURE_SIZE,
+        bands: int = DEDUP_LSH_BANDS,
+        threshold: float = DEDUP_SIMILARITY_THRESHOLD,
+        seed: int = 42,
+    ) -> None:
+        if signature_size % bands:
+            raise ValueError("signature_size는 bands로 나누어 떨어져야 합니다.")
+
+        self._shingle_size = shingle_size
+        self._signature_size = signature_size
+        self._bands = bands
+        self._rows_per_band = signature_size // bands
+        self._threshold = threshold
+        # 내장 hash()는 프로세스마다 달라지므로 고정 키를 쓴 blake2b로 결정적 해시 사용
+        self._hash_key = seed.to_bytes(8, "little")
+        # 빈 구간을 채울 때 이웃 구간 값과 겹치지 않도록 더하는 간격
+        self._densify_offset = _HASH_SPACE // signature_size + 1
+
+    def shingles(self, normalized: str) -> frozenset[int]:
+        """정규화된 문자열의 문자 n-gram 해시 집합 (64비트)"""
+        size = self._shingle_size
+        if len(normalized) <= size:
+            grams = {normalized}
+        else:
+            grams = {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+        key = self._hash_key
+        return frozenset(
+            int.from_bytes(
+                hashlib.blake2b(g.encode("utf-8"), digest_size=8, key=key).digest(),
+                "little",
+            )
+            for g in grams
+        )
+
+    def signature(self, shingles: frozenset[int]) -> tuple[int, ...]:
+        """MinHash 시그니처 (One Permutation Hashing + 회전 densification)
+
+        해시 함수를 시그니처 길이만큼 돌리면 n-gram 수 x 64번의 연산이 필요합니다.
+        대신 n-gram마다 해시를 한 번만 계산해 구간(bin)으로 나누고 구간별 최솟값을
+        취하면 댓글 하나당 n-gram 수에 비례하는 비용으로 시그니처를 만들 수 있습니다.
+        """
+        size = self._signature_size
+        empty = _HASH_SPACE
+        bins = [empty] * size
+        for h in shingles:
+            index, value = h % size, h // size
+            if value < bins[index]:
+                bins[index] = value
+
+        # 짧은 댓글은 빈 구간이 생기므로 오른쪽의 가장 가까운 값으로 채움 (모든 댓글에 동일 규칙)
+        signature = list(bins)
+        for index in range(size):
+            if bins[index] != empty:
+                continue
+            step = 1
+            while bins[(index + step) % size] == empty:
+                step += 1
+            signature[index] = bins[(index + step) % size] + step * self._densify_offset
+        return tuple(signature)
+
+    def cluster(self, batch: CommentBatch) -> list[list[int]]:
+        """유사 중복 클러스터 목록 (각 클러스터는 행 번호 오름차순, 첫 행 기준 정렬)"""
+        # 1단계: 정규화 결과가 완전히 같은 댓글은 MinHash 없이 바로 묶음
+        exact_groups: dict[str, list[int]] = {}
+        for row, text in enumerate(batch.texts):
+            exact_groups.setdefault(normalize_comment(text), []).append(row)
+
+        keys = list(exact_groups)
+        shingle_sets = [self.shingles(key) for key in keys]
+        clusters = _DisjointSet(len(keys))
+
+        # 2단계: LSH 밴드 버킷에서 만난 후보끼리만 실제 자카드 유사도 비교
+        buckets: dict[tuple, list[int]] = {}
+        width = self._rows_per_band
+        for index, shingles in enumerate(shingle_sets):
+            signature = self.signature(shingles)
+            # 여러 밴드에서 같은 후보를 만나도 한 번만 비교
+            candidates: set[int] = set()
+            for band in range(self._bands):
+                bucket_key = (band, signature[band * width : (band + 1) * width])
+                bucket = buckets.setdefault(bucket_key, [])
+                candidates.update(bucket)
+                bucket.append(index)
+
+            for other in candidates:
+                if clusters.find(index) == clusters.find(other):
+                    continue
+                if self._jaccard(shingles, shingle_sets[other]) >= self._threshold:
+                    clusters.union(index, other)
+
+        grouped: dict[int, list[int]] = {}
+        for index, key in enumerate(keys):
+            grouped.setdefault(clusters.find(index), []).extend(exact_groups[key])
+
+        result = [sorted(rows) for rows in grouped.values()]
+        result.sort(key=lambda rows: rows[0])
+        return result
+
+    def collapse(self, batch: CommentBatch) -> CommentBatch:
+        """클러스터마다 대표 댓글 하나만 남기고 좋아요 수는 합산"""
+        if len(batch) == 0:
+            return batch
+
+        clusters = self.cluster(batch)
+        likes = batch.likes
+        # 대표 댓글: 좋아요가 가장 많은 댓글 (동점이면 먼저 수집된 댓글)
+        representatives = [max(rows, key=lambda r: (likes[r], -r)) for rows in clusters]
+
+        collapsed = batch.take(representatives)
+        return CommentBatch(
+            collapsed.texts,
+            collapsed.authors,
+            array("q", (sum(likes[r] for r in rows) for rows in clusters)),
+            collapsed.timestamps,
+        )
+
+    @staticmethod
+    def _jaccard(a: frozenset[int], b: frozenset[int]) -> float:
+        """자카드 유사도"""
+        shared = len(a & b)
+        return shared / (len(a) + len(b) - shared)
+
+
+def collapse_near_duplicates(batch: CommentBatch) -> CommentBatch:
+    """기본 설정으로 유사 중복 댓글 병합"""
+    return NearDuplicateClusterer().collapse(batch)
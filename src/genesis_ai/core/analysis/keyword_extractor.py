@@ -0,0 +1,164 @@
+"""
+댓글 키워드 추출기
+CommentBatch 전체를 키워드 단위로 훑어 페인/게인 포인트와 키워드 빈도 통계를 추출
+"""
+from array import array
+from collections import Counter
+from itertools import combinations
+from typing import Sequence
+
+from ...config.constants import (
+    GAIN_KEYWORDS,
+    KEYWORD_POINT_TEXT_LENGTH,
+    MAX_CO_OCCURRENCE_PAIRS,
+    MAX_KEYWORD_POINTS,
+    PAIN_KEYWORDS,
+)
+from .comment_batch import CommentBatch
+
+
+def _as_batch(comments: CommentBatch | list[dict]) -> CommentBatch:
+    """dict 리스트가 들어오면 배치로 변환 (기존 호출부 호환)"""
+    if isinstance(comments, CommentBatch):
+        return comments
+    return CommentBatch.from_dicts(comments)
+
+
+def scan_keywords(batch: CommentBatch, keywords: Sequence[str]) -> list[list[int]]:
+    """키워드별로 해당 키워드를 포함하는 행 번호 목록 (버퍼 전체를 키워드당 한 번 스캔)"""
+    return [batch.texts.rows_containing(keyword) for keyword in keywords]
+
+
+def match_first_keywords(
+    batch: CommentBatch,
+    keywords: Sequence[str],
+    hits: list[list[int]] | None = None,
+) -> array:
+    """댓글별로 처음 매칭되는 키워드 인덱스 배열 (-1: 매칭 없음)
+
+    키워드 목록 순서대로 결과를 채우므로,
+    가장 먼저 기록된 인덱스가 곧 '목록에서 가장 앞선 키워드'가 됩니다.
+    """
+    if hits is None:
+        hits = scan_keywords(batch, keywords)
+    matched = array("i", [-1]) * len(batch)
+    for index, rows in enumerate(hits):
+        for row in rows:
+            if matched[row] < 0:
+                matched[row] = index
+    return matched
+
+
+def _collect_points(
+    batch: CommentBatch,
+    keywords: Sequence[str],
+    matched: array,
+    limit: int,
+) -> list[dict]:
+    """매칭된 댓글을 수집 순서대로 최대 limit개 dict로 변환"""
+    points: list[dict] = []
+    for row, index in enumerate(matched):
+        if index < 0:
+            continue
+        points.append({
+            "text": batch.text(row)[:KEYWORD_POINT_TEXT_LENGTH],
+            "keyword": keywords[index],
+            "likes": batch.likes[row],
+        })
+        if len(points) >= limit:
+            break
+    return points
+
+
+def summarize_keyword_hits(
+    batch: CommentBatch,
+    keywords: Sequence[str],
+    hits: list[list[int]],
+    matched: array,
+) -> dict:
+    """키워드별 출현 수/좋아요 가중 빈도/동시 출현 요약
+
+    ratio는 키워드가 하나라도 들어간 댓글 중 해당 키워드가 등장한 비율이고,
+    like_ratio는 같은 댓글 집합의 좋아요 합계 중 해당 키워드 댓글이 차지하는 비율입니다.
+    """
+    likes = batch.likes
+    matched_rows = [row for row, index in enumerate(matched) if index >= 0]
+    matched_count = len(matched_rows)
+    matched_likes = sum(likes[row] for row in matched_rows)
+
+    keyword_stats = []
+    row_keywords: dict[int, list[str]] = {}
+    for keyword, rows in zip(keywords, hits):
+        if not rows:
+            continue
+        keyword_likes = sum(likes[row] for row in rows)
+        keyword_stats.append({
+            "keyword": keyword,
+            "count": len(rows),
+            "ratio": round(len(rows) / matched_count, 3),
+            "likes": keyword_likes,
+            "like_ratio": round(keyword_likes / matched_likes, 3) if matched_likes else 0.0,
+        })
+        for row in rows:
+            row_keywords.setdefault(row, []).append(keyword)
+    keyword_stats.sort(key=lambda s: (s["count"], s["likes"]), reverse=True)
+
+    # 한 댓글에 함께 등장한 키워드 쌍 집계 ("냄새"+"환불" 같은 복합 불만 파악용)
+    pair_counts: Counter = Counter()
+    for row_keyword_list in row_keywords.values():
+        pair_counts.update(combinations(row_keyword_list, 2))
+
+    return {
+        "total_comments": len(batch),
+        "matched_comments": matched_count,
+        "keywords": keyword_stats,
+        "co_occurrence": [
+            {"keywords": list(pair), "count": count}
+            for pair, count in pair_counts.most_common(MAX_CO_OCCURRENCE_PAIRS)
+        ],
+    }
+
+
+def analyze_keywords(
+    comments: CommentBatch | list[dict],
+    keywords: Sequence[str],
+    limit: int = MAX_KEYWORD_POINTS,
+) -> dict:
+    """한 번의 스캔으로 샘플 댓글(points)과 빈도 요약(summary)을 함께 계산"""
+    batch = _as_batch(comments)
+    hits = scan_keywords(batch, keywords)
+    matched = match_first_keywords(batch, keywords, hits)
+    return {
+        "points": _collect_points(batch, keywords, matched, limit),
+        "summary": summarize_keyword_hits(batch, keywords, hits, matched),
+    }
+
+
+def extract_keyword_points(
+    comments: CommentBatch | list[dict],
+    keywords: Sequence[str],
+    limit: int = MAX_KEYWORD_POINTS,
+) -> list[dict]:
+    """키워드가 포함된 댓글을 수집 순서대로 최대 limit개 추출"""
+    batch = _as_batch(comments)
+    return _collect_points(batch, keywords, match_first_keywords(batch, keywords), limit)
+
+
+def extract_pain_points(comments: CommentBatch | list[dict]) -> list[dict]:
+    """댓글에서 페인포인트 추출"""
+    return extract_keyword_points(comments, PAIN_KEYWORDS)
+
+
+def extract_gain_points(comments: CommentBatch | list[dict]) -> list[dict]:
+    """댓글에서 게인포인트 추출"""
+    return extract_keyword_points(comments, GAIN_KEYWORDS)
+
+
+def analyze_pain_points(comments: CommentBatch | list[dict]) -> dict:
+    """페인포인트 샘플 + 키워드 빈도 요약"""
+    return analyze_keywords(comments, PAIN_KEYWORDS)
+
+
+def analyze_gain_points(comments: CommentBatch | list[dict]) -> dict:
+    """게인포인트 샘플 + 키워드 빈도 요약"""
+    return analyze_keywords(comments, GAIN_KEYWORDS)
@@ -0,0 +1,89 @@
+"""
+네이버 상품 정규화
+여러 판매처에 조금씩 다른 제목으로 올라온 같은 상품을 하나의 대표 상품 + 판매 목록(offers)으로 묶음
+"""
+import hashlib
+import html
+import re
+from typing import Sequence
+
+# HTML 태그 (<b> 강조 등)
+_TAG = re.compile(r"<[^>]+>")
+# 용량/수량 토큰: 500ml, 1.5L, 100g, 3개, 2개입, 10매, 30롤, x2, 1+1, 2종, 3팩 ...
+_QUANTITY = re.compile(
+    r"(?:\d+(?:\.\d+)?\s*(?:ml|mL|ML|l|L|리터|g|kg|KG|mg|개입|개|매|롤|팩|병|캔|박스|box|ea|EA|p|P|세트|종|입|회분|정))"
+    r"|(?:[xX×*]\s*\d+)"
+    r"|(?:\d+\s*\+\s*\d+)"
+)
+# 대괄호 홍보 문구: [특가], 【무료배송】 ...
+_PROMO = re.compile(r"\[[^\]]*\]|【[^】]*】")
+# 한글/영문/숫자 외 문자
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def clean_title(title: str) -> str:
+    """표시용 제목 정리 (HTML 태그 제거, 엔티티 복원, 공백 정리)"""
+    text = html.unescape(_TAG.sub("", title or ""))
+    return " ".join(text.split())
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (홍보 문구/용량/수량/문장부호 제거, 소문자, 단어 순서 무시)"""
+    text = _QUANTITY.sub(" ", _PROMO.sub(" ", clean_title(title)))
+    tokens = _NON_WORD.sub(" ", text.lower()).split()
+    return " ".join(sorted(set(tokens)))
+
+
+def canonical_key(title: str, brand: str = "") -> str:
+    """정규화 제목 + 브랜드의 해시 키"""
+    normalized = f"{normalize_title(brand)}|{normalize_title(title)}"
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _offer(product: dict) -> dict:
+    """개별 판매처 정보"""
+    return {
+        "product_id": product.get("product_id", ""),
+        "mall": product.get("mall", ""),
+        "price": product.get("price", 0),
+        "link": product.get("link", ""),
+        "rank": product.get("rank"),
+    }
+
+
+def canonicalize_listings(products: Sequence[dict]) -> list[dict]:
+    """같은 상품 묶기
+
+    대표 상품은 가장 먼저(가장 높은 순위로) 나온 판매 항목의 필드를 따르고, price는
+    판매처 중 최저가(0 초과), mall은 최저가 판매처입니다. 결과 순서는 대표 상품의 첫 등장 순서입니다.
+    """
+    groups: dict[str, dict] = {}
+    for product in products:
+        key = canonical_key(product.get("title", ""), product.get("brand", ""))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                **product,
+                "canonical_id": key,
+                "title": clean_title(product.get("title", "")),
+                "offers": [],
+            }
+            if "queries" in product:
+                group["queries"] = list(product["queries"])
+        elif "queries" in product:
+            group.setdefault("queries", [])
+            group["queries"].extend(q for q in product["queries"] if q not in group["queries"])
+        group["offers"].append(_offer(product))
+
+    canonical = []
+    for group in groups.values():
+        offers = group["offers"]
+        priced = [offer for offer in offers if offer["price"] > 0]
+        cheapest = min(priced, key=lambda offer: offer["price"]) if priced else offers[0]
+        group["price"] = cheapest["price"]
+        group["mall"] = cheapest["mall"]
+        group["max_price"] = max((offer["price"] for offer in priced), default=0)
+        group["offer_count"] = len(offers)
+        group["mall_count"] = len({offer["mall"] for offer in offers if offer["mall"]})
+        canonical.append(group)
+    return canonical
@@ -0,0 +1,254 @@
+"""
+프롬프트 데이터 압축
+수집 데이터(YouTube/네이버)를 우선순위가 있는 짧은 텍스트 섹션으로 바꿔 토큰 예산 안에 담음
+
+섹션 우선순위:
+    제품 → 댓글 요약/키워드 빈도 → 가격 통계 → 브랜드/판매처 → 인기 댓글 → 페인/게인 예시
+    → 상위 상품 → 영상(자막 앞부분) → 카테고리
+예산이 모자라면 뒤쪽 섹션의 줄부터 빠집니다. 썸네일/링크/이미지 URL/긴 설명은 넣지 않습니다.
+"""
+import json
+import math
+from typing import Any, Iterable
+
+from ...config.constants import (
+    PROMPT_COMMENT_CHARS,
+    PROMPT_MAX_PRODUCTS,
+    PROMPT_SAMPLE_COMMENTS,
+    PROMPT_SAMPLE_POINTS,
+    PROMPT_TOKEN_BUDGET,
+    PROMPT_TRANSCRIPT_CHARS,
+)
+from .listing_canonicalizer import clean_title
+
+_DESCRIPTION_CHARS = 100
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (영문/숫자/기호 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰)"""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _shorten(text: Any, limit: int) -> str:
+    """공백 정리 후 limit 글자로 자르기"""
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _won(value: float) -> str:
+    """가격 표기"""
+    return f"{round(value):,}원"
+
+
+def _product_section(product: dict) -> list[str]:
+    """제품 기본 정보"""
+    if not product:
+        return []
+    category = product.get("category", "")
+    category = getattr(category, "value", category)
+    fields = [
+        ("제품명", product.get("name", "")),
+        ("카테고리", category),
+        ("타겟", product.get("target", "")),
+        ("설명", _shorten(product.get("description", ""), _DESCRIPTION_CHARS)),
+    ]
+    return [f"{name}: {value}" for name, value in fields if value]
+
+
+def _comment_summary_section(youtube_data: dict) -> list[str]:
+    """댓글 수/좋아요 요약과 페인·게인 키워드 빈도"""
+    lines = []
+    videos = youtube_data.get("videos", [])
+    comment_stats = youtube_data.get("comment_stats", {})
+    if videos or youtube_data.get("comments_total"):
+        summary = f"영상 {len(videos)}개, 댓글 {youtube_data.get('comments_total', 0)}개"
+        if "unique_comments" in youtube_data:
+            summary += f" (중복 병합 후 {youtube_data['unique_comments']}개)"
+        if comment_stats.get("count"):
+            summary += f", 좋아요 합계 {comment_stats.get('total_likes', 0)}, 평균 {comment_stats.get('avg_likes', 0)}"
+        lines.append(summary)
+
+    labels = {"pain": "페인 키워드", "gain": "게인 키워드"}
+    for kind, label in labels.items():
+        stats = youtube_data.get("keyword_stats", {}).get(kind)
+        if not stats or not stats.get("keywords"):
+            continue
+        keywords = ", ".join(
+            f"{s['keyword']} {s['count']}회(비율 {s['ratio']}, 좋아요 {s['like_ratio']})"
+            for s in stats["keywords"]
+        )
+        lines.append(f"{label} (해당 댓글 {stats.get('matched_comments', 0)}개): {keywords}")
+        if stats.get("co_occurrence"):
+            pairs = ", ".join(
+                f"{'+'.join(pair['keywords'])} {pair['count']}" for pair in stats["co_occurrence"]
+            )
+            lines.append(f"{label} 동시 언급: {pairs}")
+    return lines
+
+
+def _price_section(stats: dict) -> list[str]:
+    """가격 요약/분위수/구간"""
+    if not stats or not stats.get("total_products"):
+        return []
+    total = f"상품 {stats['total_products']}개"
+    if stats.get("total_listings"):
+        total += f" (판매 목록 {stats['total_listings']}개)"
+    lines = [
+        f"{total}, 최저 {_won(stats.get('min_price', 0))}, 평균 {_won(stats.get('avg_price', 0))}, "
+        f"최고 {_won(stats.get('max_price', 0))}"
+    ]
+    if stats.get("quantiles"):
+        lines.append("분위수: " + ", ".join(f"{k} {_won(v)}" for k, v in stats["quantiles"].items()))
+    if stats.get("price_distribution"):
+        lines.append(
+            "가격 구간: " + ", ".join(f"{k} {v}개" for k, v in stats["price_distribution"].items() if v)
+        )
+    return lines
+
+
+def _group_section(stats: dict) -> list[str]:
+    """브랜드/판매처별 상품 수와 가격"""
+    lines = []
+    for key, label, fallback in (
+        ("brand_stats", "브랜드", "top_brands"),
+        ("mall_stats", "판매처", "top_malls"),
+    ):
+        groups = stats.get(key)
+        if groups:
+            lines.append(f"{label}: " + ", ".join(
+                f"{g['name']} {g['count']}개" + (f"(중앙 {_won(g['median_price'])})" if "median_price" in g else "")
+                for g in groups
+            ))
+        elif stats.get(fallback):
+            lines.append(f"{label}: " + ", ".join(stats[fallback]))
+    return lines
+
+
+def _comment_lines(comments: Iterable[dict], limit: int) -> list[str]:
+    """댓글 목록 → '(좋아요) 내용' 줄"""
+    return [
+        f"({c.get('likes', 0)}) {_shorten(c.get('text', ''), PROMPT_COMMENT_CHARS)}"
+        for c in list(comments)[:limit]
+    ]
+
+
+def _point_section(youtube_data: dict) -> list[str]:
+    """페인/게인 예시 댓글"""
+    lines = []
+    for key, label in (("pain_points", "페인"), ("gain_points", "게인")):
+        for point in youtube_data.get(key, [])[:PROMPT_SAMPLE_POINTS]:
+            keyword = point.get("keyword", "")
+            lines.append(f"{label}[{keyword}] {_shorten(point.get('text', ''), PROMPT_COMMENT_CHARS)}")
+    return lines
+
+
+def _product_list_section(products: list[dict]) -> list[str]:
+    """상위 상품 (순위, 제목, 가격 범위, 판매처 수, 브랜드, 판매처)"""
+    lines = []
+    for index, p in enumerate(products[:PROMPT_MAX_PRODUCTS], start=1):
+        price = _won(p.get("price", 0))
+        if p.get("max_price", 0) > p.get("price", 0):
+            price = f"{p['price']:,}~{_won(p['max_price'])}"
+        parts = [f"{p.get('rank') or index}. {_shorten(clean_title(p.get('title', '')), 60)}", price]
+        if p.get("offer_count", 1) > 1:
+            parts.append(f"판매처 {p['offer_count']}곳")
+        parts.extend(p[field] for field in ("brand", "mall") if p.get(field))
+        lines.append(" | ".join(parts))
+    return lines
+
+
+def _video_section(videos: list[dict]) -> list[str]:
+    """영상 제목/채널과 자막 앞부분"""
+    lines = []
+    for video in videos:
+        title = _shorten(video.get("title", ""), 80)
+        channel = f" ({video['channel']})" if video.get("channel") else ""
+        transcript = _shorten(video.get("transcript", ""), PROMPT_TRANSCRIPT_CHARS)
+        lines.append(f"{title}{channel}: {transcript}" if transcript else f"{title}{channel}")
+    return lines
+
+
+def _category_section(stats: dict) -> list[str]:
+    """카테고리 단계별 상위 경로"""
+    lines = []
+    for level, groups in (stats.get("category_stats") or {}).items():
+        if groups:
+            lines.append(f"{level}: " + ", ".join(f"{g['path']} {g['count']}개" for g in groups))
+    return lines
+
+
+def _raw_size(youtube_data: dict, naver_data: dict) -> int:
+    """기존 방식(json.dumps indent=2) 프롬프트 토큰 추정치"""
+    return sum(
+        estimate_tokens(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+        for data in (youtube_data, naver_data)
+        if data
+    )
+
+
+def pack_collected_data(
+    youtube_data: dict | None,
+    naver_data: dict | None,
+    budget: int = PROMPT_TOKEN_BUDGET,
+) -> dict:
+    """수집 데이터 → 토큰 예산 안의 프롬프트 텍스트
+
+    섹션은 우선순위 순으로 채우며, 줄 하나가 남은 예산을 넘으면 그 섹션의 나머지 줄은 빼고
+    다음 섹션으로 넘어갑니다(뒤 섹션의 짧은 줄은 들어갈 수 있음). 제품 섹션은 항상 넣습니다.
+
+    Returns:
+        text, tokens(추정), raw_tokens(기존 json.dumps 기준 추정), saved_tokens, budget,
+        omitted(일부 또는 전부 빠진 섹션 이름)
+    """
+    youtube_data = youtube_data or {}
+    naver_data = naver_data or {}
+    stats = naver_data.get("competitor_stats") or {}
+    product = youtube_data.get("product") or naver_data.get("product") or {}
+
+    sections = [
+        ("제품", _product_section(product)),
+        ("댓글 요약", _comment_summary_section(youtube_data)),
+        ("가격 통계", _price_section(stats)),
+        ("브랜드/판매처", _group_section(stats)),
+        ("인기 댓글", _comment_lines(youtube_data.get("top_comments", []), PROMPT_SAMPLE_COMMENTS)),
+        ("페인/게인 예시", _point_section(youtube_data)),
+        ("상위 상품", _product_list_section(naver_data.get("products", []))),
+        ("영상", _video_section(youtube_data.get("videos", []))),
+        ("카테고리", _category_section(stats)),
+    ]
+
+    lines: list[str] = []
+    used = 0
+    omitted: list[str] = []
+    for index, (name, section_lines) in enumerate(sections):
+        if not section_lines:
+            continue
+        header = f"[{name}]"
+        header_tokens = estimate_tokens(header) + 1
+        # 제품 섹션은 예산과 무관하게 포함
+        required = index == 0
+        if not required and used + header_tokens + estimate_tokens(section_lines[0]) + 1 > budget:
+            omitted.append(name)
+            continue
+        lines.append(header)
+        used += header_tokens
+        for line in section_lines:
+            cost = estimate_tokens(line) + 1
+            if not required and used + cost > budget:
+                omitted.append(name)
+                break
+            lines.append(line)
+            used += cost
+
+    text = "\n".join(lines) if lines else "데이터 없음"
+    tokens = estimate_tokens(text)
+    raw_tokens = _raw_size(youtube_data, naver_data)
+    return {
+        "text": text,
+        "tokens": tokens,
+        "raw_tokens": raw_tokens,
+        "saved_tokens": max(raw_tokens - tokens, 0),
+        "budget": budget,
+        "omitted": omitted,
+    }
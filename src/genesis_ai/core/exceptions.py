@@ -59,6 +59,12 @@ class NaverAPIError(APIClientError):
     pass
 
 
+class RateLimitExceededError(APIClientError):
+    """호출 한도(일일 쿼터 등) 소진"""
+
+    pass
+
+
 class GeminiAPIError(APIClientError):
     """Gemini AI API 오류"""
 
@@ -66,6 +66,7 @@ class IMarketingAIService(ITextGenerationService, IImageGenerationService, Proto
         hook_text: str,
         style: str = "드라마틱",
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        use_cache: bool = True,
     ) -> bytes | None:
         """마케팅 썸네일 생성"""
         ...
@@ -77,6 +78,7 @@ class IMarketingAIService(ITextGenerationService, IImageGenerationService, Proto
         hook_texts: list[str],
         styles: list[str] | None = None,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        use_cache: bool = True,
     ) -> list[dict]:
         """다중 썸네일 생성"""
         ...
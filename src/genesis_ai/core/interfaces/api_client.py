@@ -2,7 +2,7 @@
 API 클라이언트 인터페이스 정의
 """
 from abc import abstractmethod
-from typing import Generic, Protocol, TypeVar, runtime_checkable
+from typing import Generic, Iterator, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
 
@@ -57,8 +57,24 @@ class INaverClient(ISearchClient, Protocol):
     """네이버 API 클라이언트 프로토콜"""
 
     @abstractmethod
-    def search_shopping(self, query: str, display: int = 10) -> list[dict]:
-        """네이버 쇼핑 검색"""
+    def search_shopping(
+        self,
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+    ) -> list[dict]:
+        """네이버 쇼핑 검색 (단일 페이지)"""
+        ...
+
+    @abstractmethod
+    def search_shopping_all(self, query: str, total: int = 100, sort: str = "sim") -> list[dict]:
+        """네이버 쇼핑 다중 페이지 검색"""
+        ...
+
+    @abstractmethod
+    def iter_shopping(self, query: str, total: int = 100, sort: str = "sim") -> Iterator[dict]:
+        """네이버 쇼핑 다중 페이지 검색 (지연 이터레이터)"""
         ...
 
     @abstractmethod
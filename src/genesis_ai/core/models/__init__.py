@@ -6,6 +6,7 @@ from .marketing import (
     CompetitorAnalysis,
     ContentStrategy,
     HookingPoint,
+    MarketingAnalysis,
     MarketingStrategy,
     ShortformScenario,
     SNSCopy,
@@ -19,6 +20,7 @@ from .naver import (
 from .pipeline import (
     CollectedData,
     GeneratedContent,
+    ImageVariant,
     PipelineConfig,
     PipelineProgress,
     PipelineResult,
@@ -29,6 +31,10 @@ from .product import (
     ProductCatalog,
     ProductCategory,
 )
+from .usage import (
+    ModelCallUsage,
+    UsageSummary,
+)
 from .youtube import (
     GainPoint,
     PainPoint,
@@ -59,6 +65,7 @@ __all__ = [
     "SNSCopy",
     "CompetitorAnalysis",
     "ContentStrategy",
+    "MarketingAnalysis",
     "MarketingStrategy",
     # Pipeline
     "PipelineStep",
@@ -67,4 +74,8 @@ __all__ = [
     "PipelineResult",
     "CollectedData",
     "GeneratedContent",
+    "ImageVariant",
+    # Usage
+    "ModelCallUsage",
+    "UsageSummary",
 ]
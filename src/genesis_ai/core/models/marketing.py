@@ -2,7 +2,7 @@
 마케팅 전략 관련 도메인 모델
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -63,6 +63,22 @@ class ContentStrategy(BaseModel):
     recommended_hashtags: list[str] = Field(default_factory=list, description="추천 해시태그")
 
 
+class MarketingAnalysis(BaseModel):
+    """Gemini 마케팅 분석 응답 (response_schema로 생성을 제한하고 이 모델로 바로 파싱)
+
+    필드 순서가 스트리밍 응답에서 필드가 완성되는 순서입니다.
+    """
+
+    target_audience: TargetPersona = Field(..., description="타겟 고객층과 페인 포인트/욕구")
+    competitor_analysis: CompetitorAnalysis = Field(
+        default_factory=CompetitorAnalysis, description="경쟁 상품 분석"
+    )
+    content_strategy: ContentStrategy = Field(default_factory=ContentStrategy, description="콘텐츠 전략")
+    hook_suggestions: list[str] = Field(default_factory=list, description="훅 문구 제안 5개")
+    keywords: list[str] = Field(default_factory=list, description="핵심 키워드 5개")
+    summary: str = Field(default="", description="전체 분석 요약 (2-3문장)")
+
+
 class MarketingStrategy(BaseModel):
     """완전한 마케팅 전략 출력"""
 
@@ -76,7 +92,36 @@ class MarketingStrategy(BaseModel):
     video_prompt: Optional[str] = Field(default=None, description="비디오 생성 프롬프트")
     keywords: list[str] = Field(default_factory=list, description="핵심 키워드")
     summary: str = Field(default="", description="전체 분석 요약")
+    generation: dict[str, Any] = Field(
+        default_factory=dict, description="응답한 모델 티어/모델, 상향 사유, 소요 시간, 절감 비용"
+    )
     generated_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
 
+    @classmethod
+    def from_analysis(
+        cls,
+        product_name: str,
+        analysis: MarketingAnalysis,
+        generation: dict[str, Any] | None = None,
+    ) -> "MarketingStrategy":
+        """Gemini 분석 응답 → 마케팅 전략"""
+        return cls(
+            product_name=product_name,
+            target_persona=analysis.target_audience,
+            hooking_points=[
+                HookingPoint(hook=hook, hook_type="suggestion") for hook in analysis.hook_suggestions
+            ],
+            competitor_analysis=analysis.competitor_analysis,
+            content_strategy=analysis.content_strategy,
+            keywords=analysis.keywords,
+            summary=analysis.summary,
+            generation=generation or {},
+        )
+
+    @property
+    def hook_texts(self) -> list[str]:
+        """훅 텍스트 목록 (순위 순)"""
+        return [point.hook for point in self.hooking_points]
+
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
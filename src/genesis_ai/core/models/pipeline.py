@@ -3,10 +3,13 @@
 """
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from .marketing import MarketingStrategy
+from .usage import UsageSummary
+
 
 class PipelineStep(str, Enum):
     """파이프라인 실행 단계"""
@@ -28,19 +31,30 @@ class PipelineConfig(BaseModel):
 
     # 데이터 수집 설정
     youtube_count: int = Field(default=3, ge=1, le=10, description="YouTube 검색 결과 수")
-    naver_count: int = Field(default=10, ge=5, le=30, description="네이버 쇼핑 검색 결과 수")
+    naver_count: int = Field(default=10, ge=5, le=1000, description="네이버 쇼핑 검색 결과 수")
+    naver_queries: Optional[list[str]] = Field(
+        default=None, description="네이버 검색어 템플릿 (None이면 기본 템플릿 사용)"
+    )
     include_comments: bool = Field(default=True, description="댓글 수집 여부")
+    dedup_comments: bool = Field(default=True, description="유사 중복 댓글 병합 여부")
+    incremental_comments: bool = Field(default=True, description="이전 수집 이후 새 댓글만 수집 여부")
     include_transcript: bool = Field(default=True, description="자막 수집 여부")
 
     # 콘텐츠 생성 설정
     generate_thumbnail: bool = Field(default=True, description="썸네일 생성 여부")
     generate_multi_thumbnails: bool = Field(default=False, description="다중 썸네일 생성 여부")
     thumbnail_count: int = Field(default=3, ge=1, le=5, description="생성할 썸네일 수")
+    thumbnail_new_variation: bool = Field(
+        default=False, description="저장된 썸네일을 재사용하지 않고 새 변형 생성 여부"
+    )
     generate_video: bool = Field(default=True, description="비디오 생성 여부")
     video_duration: int = Field(default=8, ge=5, le=30, description="비디오 길이(초)")
 
     # AI 설정
     use_search_grounding: bool = Field(default=True, description="검색 그라운딩 사용 여부")
+    strategy_quality: Literal["auto", "final"] = Field(
+        default="auto", description="전략 생성 품질 (auto: 빠른 모델 후 필요 시 상향, final: pro 모델만)"
+    )
 
     # 저장 설정
     upload_to_gcs: bool = Field(default=True, description="GCS 업로드 여부")
@@ -82,12 +96,31 @@ class CollectedData(BaseModel):
     naver_data: Optional[dict[str, Any]] = Field(default=None, description="네이버 데이터")
     pain_points: list[dict[str, Any]] = Field(default_factory=list, description="페인 포인트")
     gain_points: list[dict[str, Any]] = Field(default_factory=list, description="게인 포인트")
+    keyword_stats: dict[str, Any] = Field(default_factory=dict, description="페인/게인 키워드 빈도 요약")
+
+
+class ImageVariant(BaseModel):
+    """후처리된 이미지 변형 1개 (용도별 크기/포맷)"""
+
+    name: str = Field(..., description="변형 이름 (preview/hd/original)")
+    data: bytes = Field(..., description="인코딩된 이미지 바이트")
+    mime_type: str = Field(..., description="MIME 타입 (예: image/webp)")
+    width: int = Field(default=0, ge=0, description="가로 픽셀 (알 수 없으면 0)")
+    height: int = Field(default=0, ge=0, description="세로 픽셀 (알 수 없으면 0)")
+
+    @property
+    def extension(self) -> str:
+        """파일 확장자"""
+        return {"image/jpeg": "jpg", "image/webp": "webp", "image/png": "png"}.get(self.mime_type, "bin")
 
 
 class GeneratedContent(BaseModel):
     """생성된 콘텐츠"""
 
-    thumbnail_data: Optional[bytes] = Field(default=None, description="썸네일 이미지 바이트")
+    thumbnail_data: Optional[bytes] = Field(default=None, description="썸네일 이미지 바이트 (original 변형)")
+    thumbnail_variants: dict[str, ImageVariant] = Field(
+        default_factory=dict, description="썸네일 용도별 변형 (preview: UI, hd: 업로드, original)"
+    )
     thumbnail_url: Optional[str] = Field(default=None, description="썸네일 URL")
     multi_thumbnails: list[dict[str, Any]] = Field(default_factory=list, description="다중 썸네일")
     video_path: Optional[str] = Field(default=None, description="비디오 경로")
@@ -104,11 +137,12 @@ class PipelineResult(BaseModel):
     product_name: str = Field(..., description="제품명")
     config: Optional[PipelineConfig] = Field(default=None, description="실행 설정")
     collected_data: Optional[CollectedData] = Field(default=None, description="수집된 데이터")
-    strategy: Optional[dict[str, Any]] = Field(default=None, description="마케팅 전략")
+    strategy: Optional[MarketingStrategy] = Field(default=None, description="마케팅 전략")
     generated_content: Optional[GeneratedContent] = Field(default=None, description="생성된 콘텐츠")
     error_message: Optional[str] = Field(default=None, description="에러 메시지")
     executed_at: datetime = Field(default_factory=datetime.now, description="실행 시간")
     duration_seconds: float = Field(default=0.0, ge=0, description="실행 시간(초)")
+    usage: Optional[UsageSummary] = Field(default=None, description="모델 호출 토큰/비용 원장")
 
     class Config:
         arbitrary_types_allowed = True
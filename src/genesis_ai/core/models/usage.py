@@ -0,0 +1,68 @@
+"""
+모델 호출 사용량 관련 도메인 모델
+"""
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+_TOTAL_FIELDS = (
+    "prompt_tokens",
+    "candidate_tokens",
+    "cached_tokens",
+    "thoughts_tokens",
+    "video_seconds",
+    "latency_seconds",
+    "cost_usd",
+    "cost_saved_usd",
+)
+
+
+class ModelCallUsage(BaseModel):
+    """모델 호출 1회 사용량"""
+
+    operation: str = Field(..., description="호출 이름 (예: Gemini 마케팅 분석)")
+    model: str = Field(..., description="모델 ID")
+    prompt_tokens: int = Field(default=0, ge=0, description="입력 토큰 수 (캐시 토큰 포함)")
+    candidate_tokens: int = Field(default=0, ge=0, description="출력 토큰 수")
+    cached_tokens: int = Field(default=0, ge=0, description="컨텍스트 캐시 적중 토큰 수")
+    thoughts_tokens: int = Field(default=0, ge=0, description="추론 토큰 수")
+    video_seconds: float = Field(default=0.0, ge=0, description="생성한 영상 길이(초)")
+    latency_seconds: float = Field(default=0.0, ge=0, description="호출 소요 시간(초)")
+    cost_usd: float = Field(default=0.0, ge=0, description="추정 비용(USD)")
+    tier: str = Field(default="", description="모델 캐스케이드 티어 (fast/pro, 캐스케이드 밖 호출은 빈 값)")
+    cost_saved_usd: float = Field(
+        default=0.0, description="상위 모델 대비 절감 비용(USD, 상향으로 버려진 호출은 음수)"
+    )
+    recorded_at: datetime = Field(default_factory=datetime.now, description="기록 시각")
+
+
+class UsageSummary(BaseModel):
+    """실행 1회의 모델 호출 사용량 원장과 합계"""
+
+    calls: list[ModelCallUsage] = Field(default_factory=list, description="호출별 사용량")
+    totals: dict[str, float] = Field(default_factory=dict, description="전체 합계")
+    by_operation: dict[str, dict[str, Any]] = Field(
+        default_factory=dict, description="호출 이름별 호출 수/합계"
+    )
+
+    @classmethod
+    def from_calls(cls, calls: list[ModelCallUsage]) -> "UsageSummary":
+        """호출 목록 → 합계 포함 요약"""
+        totals: dict[str, float] = {"calls": len(calls), **{name: 0 for name in _TOTAL_FIELDS}}
+        by_operation: dict[str, dict[str, Any]] = {}
+        for call in calls:
+            group = by_operation.setdefault(
+                call.operation,
+                {"model": call.model, "calls": 0, **{name: 0 for name in _TOTAL_FIELDS}},
+            )
+            group["calls"] += 1
+            for name in _TOTAL_FIELDS:
+                value = getattr(call, name)
+                totals[name] += value
+                group[name] += value
+        for values in (totals, *by_operation.values()):
+            values["latency_seconds"] = round(values["latency_seconds"], 3)
+            values["cost_usd"] = round(values["cost_usd"], 6)
+            values["cost_saved_usd"] = round(values["cost_saved_usd"], 6)
+        return cls(calls=list(calls), totals=totals, by_operation=by_operation)
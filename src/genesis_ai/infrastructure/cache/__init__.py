@@ -0,0 +1,12 @@
+"""
+캐시 모듈 (인메모리 TTL 캐시, Gemini 응답 디스크 캐시)
+"""
+from .response_cache import ResponseCache, normalize_prompt
+from .ttl_cache import CacheState, TTLCache
+
+__all__ = [
+    "CacheState",
+    "TTLCache",
+    "ResponseCache",
+    "normalize_prompt",
+]
@@ -0,0 +1,202 @@
+"""
+Gemini 응답 디스크 캐시
+모델 ID + 정규화 프롬프트 + 생성 설정 해시를 키로 텍스트/이미지 응답을 보관
+
+디렉토리 구조:
+    {base_dir}/gemini/index.json       - 키 → 호출 유형, 크기, 저장/사용 시각, 텍스트 응답
+    {base_dir}/gemini/blobs/{key}.bin  - 이미지 응답 (색인에는 경로만 기록)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from ...config.constants import (
+    GEMINI_CACHE_MAX_BYTES,
+    GEMINI_CACHE_MAX_ENTRIES,
+    GEMINI_CACHE_TTLS,
+)
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_BLOB_KINDS = frozenset({"image"})
+
+
+def normalize_prompt(prompt: str) -> str:
+    """프롬프트 정규화 (유니코드 NFC, 줄 끝 공백/앞뒤 빈 줄 제거)"""
+    text = unicodedata.normalize("NFC", prompt or "")
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+class ResponseCache:
+    """Gemini 응답 디스크 캐시 (호출 유형별 TTL, 크기 기준 LRU 제거, 스레드 안전)
+
+    텍스트 응답은 색인 파일에 함께 저장하고, 이미지 응답은 blobs/ 아래 파일로 저장합니다.
+    사용 시각 갱신은 메모리에만 반영했다가 다음 저장 시 색인 파일에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        ttls: Mapping[str, float] | None = None,
+        max_bytes: int = GEMINI_CACHE_MAX_BYTES,
+        max_entries: int = GEMINI_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._root = Path(base_dir) / "gemini"
+        self._blob_dir = self._root / "blobs"
+        self._index_path = self._root / "index.json"
+        self._ttls = {**GEMINI_CACHE_TTLS, **(ttls or {})}
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._index: dict[str, dict] = self._load_index()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(kind: str, model: str, prompt: str, config: Mapping[str, Any] | None = None) -> str:
+        """캐시 키 (호출 유형 + 모델 ID + 정규화 프롬프트 + 생성 설정)"""
+        payload = json.dumps(
+            {
+                "kind": kind,
+                "model": model,
+                "prompt": normalize_prompt(prompt),
+                "config": dict(config or {}),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> dict[str, dict]:
+        """색인 파일 읽기 (없거나 손상되었으면 빈 색인)"""
+        if not self._index_path.exists():
+            return {}
+        try:
+            with self._index_path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Gemini 캐시 색인 손상, 초기화: {e}")
+            return {}
+
+    def _write_index(self) -> None:
+        """색인 파일 원자적 쓰기 (잠금 안에서 호출)"""
+        self._root.mkdir(parents=True, exist_ok=True)
+        temp_path = self._index_path.with_suffix(".json.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(temp_path, self._index_path)
+
+    def _blob_path(self, key: str) -> Path:
+        return self._blob_dir / f"{key}.bin"
+
+    def _remove(self, key: str) -> None:
+        """항목 제거 (잠금 안에서 호출)"""
+        entry = self._index.pop(key, None)
+        if entry and entry.get("blob"):
+            self._blob_path(key).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def nbytes(self) -> int:
+        """저장된 응답 크기 합"""
+        return sum(entry["size"] for entry in self._index.values())
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, key: str) -> str | bytes | None:
+        """응답 조회 (없거나 TTL이 지났으면 None)"""
+        ttl = self._ttls.get(kind, 0)
+        with self._lock:
+            entry = self._index.get(key)
+            now = self._clock()
+            if entry is None or entry["kind"] != kind or now - entry["stored_at"] > ttl:
+                if entry is not None:
+                    self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            if entry.get("blob"):
+                try:
+                    value: str | bytes = self._blob_path(key).read_bytes()
+                except OSError:
+                    self._remove(key)
+                    self.stats["misses"] += 1
+                    return None
+            else:
+                value = entry["value"]
+            entry["used_at"] = now
+            self.stats["hits"] += 1
+            return value
+
+    def set(self, kind: str, key: str, value: str | bytes) -> None:
+        """응답 저장 (TTL이 0인 호출 유형은 저장하지 않음, 한도를 넘으면 오래 안 쓴 항목부터 제거)"""
+        if self._ttls.get(kind, 0) <= 0:
+            return
+        is_blob = kind in _BLOB_KINDS
+        size = len(value) if is_blob else len(str(value).encode("utf-8"))
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            now = self._clock()
+            self._remove(key)
+            entry: dict = {"kind": kind, "size": size, "stored_at": now, "used_at": now}
+            try:
+                if is_blob:
+                    self._blob_dir.mkdir(parents=True, exist_ok=True)
+                    temp_path = self._blob_path(key).with_suffix(".tmp")
+                    temp_path.write_bytes(value)  # type: ignore[arg-type]
+                    os.replace(temp_path, self._blob_path(key))
+                    entry["blob"] = True
+                else:
+                    entry["value"] = value
+                self._index[key] = entry
+                self._evict()
+                self._write_index()
+            except OSError as e:
+                # 캐시 저장 실패는 응답 자체에 영향을 주지 않음
+                logger.warning(f"Gemini 캐시 저장 실패: {e}")
+
+    def _evict(self) -> None:
+        """항목 수/크기 한도를 넘으면 사용 시각이 가장 오래된 항목부터 제거 (잠금 안에서 호출)"""
+        total = sum(entry["size"] for entry in self._index.values())
+        if len(self._index) <= self._max_entries and total <= self._max_bytes:
+            return
+        for key in sorted(self._index, key=lambda k: self._index[k]["used_at"]):
+            if len(self._index) <= self._max_entries and total <= self._max_bytes:
+                break
+            total -= self._index[key]["size"]
+            self._remove(key)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, key: str | None = None) -> None:
+        """항목 하나 또는 전체 제거"""
+        with self._lock:
+            for k in [key] if key is not None else list(self._index):
+                self._remove(k)
+            self._write_index()
+
+    def flush(self) -> None:
+        """메모리의 사용 시각 갱신을 색인 파일에 기록"""
+        with self._lock:
+            try:
+                self._write_index()
+            except OSError as e:
+                logger.warning(f"Gemini 캐시 색인 기록 실패: {e}")
@@ -0,0 +1,179 @@
+"""
+TTL + stale-while-revalidate LRU 캐시
+항목 수와 추정 바이트 크기 두 기준으로 제한하고, 만료 직후 구간에는 이전 값을 즉시 돌려주면서
+백그라운드에서 새 값을 받아옴
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Hashable
+
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheState(str, Enum):
+    """조회 결과 상태"""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+def _json_size(value: Any) -> int:
+    """JSON 직렬화 길이로 항목 크기 추정"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+class _Entry:
+    """캐시 항목"""
+
+    __slots__ = ("value", "stored_at", "size")
+
+    def __init__(self, value: Any, stored_at: float, size: int) -> None:
+        self.value = value
+        self.stored_at = stored_at
+        self.size = size
+
+
+class TTLCache:
+    """스레드 안전 TTL 캐시
+
+    저장 후 ttl초까지는 FRESH, ttl+stale_ttl초까지는 STALE(값은 돌려주되 갱신 필요),
+    그 이후는 MISS로 취급합니다. 항목 수가 max_entries를, 추정 크기 합이 max_bytes를
+    넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        sizeof: Callable[[Any], int] = _json_size,
+        clock: Callable[[], float] = time.monotonic,
+        refresh_workers: int = 2,
+    ) -> None:
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._refresh_workers = refresh_workers
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._refreshing: set[Hashable] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "refreshes": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """저장된 항목의 추정 크기 합"""
+        return self._bytes
+
+    def get(self, key: Hashable) -> tuple[Any, CacheState]:
+        """값과 상태 조회 (MISS면 값은 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, CacheState.MISS
+            age = self._clock() - entry.stored_at
+            if age <= self._ttl:
+                self._entries.move_to_end(key)
+                return entry.value, CacheState.FRESH
+            if age <= self._ttl + self._stale_ttl:
+                self._entries.move_to_end(key)
+                return entry.value, CacheState.STALE
+            # 갱신 가능 구간도 지났으면 제거
+            self._remove(key)
+            return None, CacheState.MISS
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (제한을 넘으면 LRU 제거)"""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # 한 항목이 전체 바이트 한도보다 크면 저장하지 않음
+            if size > self._max_bytes:
+                return
+            self._entries[key] = _Entry(value, self._clock(), size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """항목 하나 또는 전체 제거"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """캐시 조회 후 없으면 loader로 채움 (STALE이면 이전 값을 반환하고 백그라운드 갱신)"""
+        value, state = self.get(key)
+        if state is CacheState.FRESH:
+            self.stats["hits"] += 1
+            return value
+        if state is CacheState.STALE:
+            self.stats["stale_hits"] += 1
+            self._schedule_refresh(key, loader)
+            return value
+
+        self.stats["misses"] += 1
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """같은 키는 한 번만 백그라운드 갱신"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="cache-refresh"
+                )
+            executor = self._executor
+        executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """백그라운드 갱신 (실패하면 이전 값 유지)"""
+        try:
+            self.set(key, loader())
+            self.stats["refreshes"] += 1
+        except Exception as e:
+            logger.warning(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def close(self, wait: bool = False) -> None:
+        """백그라운드 갱신 스레드 정리 (wait=True면 진행 중인 갱신이 끝날 때까지 대기)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _remove(self, key: Hashable) -> None:
+        """항목 제거 (잠금 안에서 호출)"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
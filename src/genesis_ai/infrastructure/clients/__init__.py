@@ -2,6 +2,7 @@
 인프라스트럭처 클라이언트 패키지
 """
 from .gemini_client import GeminiClient
+from .genai_provider import GenaiClientProvider
 from .naver_client import NaverClient
 from .veo_client import VeoClient
 from .youtube_client import YouTubeClient
@@ -11,4 +12,5 @@ __all__ = [
     "NaverClient",
     "GeminiClient",
     "VeoClient",
+    "GenaiClientProvider",
 ]
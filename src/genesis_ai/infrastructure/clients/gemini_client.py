@@ -3,13 +3,30 @@ Gemini AI 클라이언트
 Vertex AI 기반 텍스트/이미지 생성
 """
 
-import json
-import re
 import time
-from typing import Any, Callable, Optional
-
-from ...config.constants import HOOK_TEMPLATES, HOOK_TYPES
-from ...core.exceptions import GeminiAPIError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, Optional
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ...config.constants import (
+    HOOK_TEMPLATES,
+    HOOK_TYPES,
+    CASCADE_MIN_HOOKS,
+    MULTI_THUMBNAIL_STYLES,
+    CASCADE_MIN_KEYWORDS,
+    PROMPT_TOKEN_BUDGET,
+    QUALITY_LEVELS,
+    THUMBNAIL_CONCURRENCY,
+)
+from ...core.analysis import pack_collected_data
+from ...core.exceptions import GeminiAPIError, InvalidConfigError
+from ...core.models import MarketingAnalysis, ModelCallUsage
+from ..cache.response_cache import ResponseCache
+from ..resilience import ConcurrencyLimiterRegistry, RequestHedger, RetryBudget, RetryPolicy
+from .genai_provider import GenaiClientProvider
+from ..telemetry import UsageLedger, build_usage
+from ...utils.json_stream import IncrementalJSONParser
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,24 +41,211 @@ class GeminiClient:
         location: str,
         text_model: str = "gemini-3-pro-preview",
         image_model: str = "gemini-3-pro-image-preview",
+        fast_model: str | None = None,
+        prompt_token_budget: int = PROMPT_TOKEN_BUDGET,
+        response_cache: ResponseCache | None = None,
+        thumbnail_concurrency: int = THUMBNAIL_CONCURRENCY,
+        retry_budget: RetryBudget | None = None,
+        usage_ledger: UsageLedger | None = None,
+        concurrency_limiters: ConcurrencyLimiterRegistry | None = None,
+        genai_provider: GenaiClientProvider | None = None,
+        hedger: RequestHedger | None = None,
     ) -> None:
         self._project_id = project_id
         self._location = location
         self._text_model = text_model
         self._image_model = image_model
+        # 캐스케이드 1단계 모델 (None/빈 값이면 항상 text_model만 사용)
+        self._fast_model = fast_model
+        self._prompt_token_budget = prompt_token_budget
+        self._response_cache = response_cache
+        self._thumbnail_concurrency = thumbnail_concurrency
+        self._retry_policy = RetryPolicy(budget=retry_budget)
+        self._usage_ledger = usage_ledger
+        self._limiters = concurrency_limiters or ConcurrencyLimiterRegistry()
+        self._genai_provider = genai_provider or GenaiClientProvider()
+        # 멱등 텍스트 호출(텍스트 생성/마케팅 분석) 헤징 (None이면 사용 안 함)
+        self._hedger = hedger
         self._client = None
 
     def _get_client(self):
         """Gemini 클라이언트 인스턴스 반환 (지연 초기화)"""
         if self._client is None:
-            from google import genai
+            # 제공자가 잠금 안에서 같은 인스턴스를 돌려주므로 여러 스레드가 동시에 대입해도 무방
+            self._client = self._genai_provider.get(self._project_id, self._location)
+        return self._client
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """응답 디스크 캐시 (없으면 None)"""
+        return self._response_cache
 
-            self._client = genai.Client(
-                vertexai=True,
-                project=self._project_id,
-                location=self._location,
+    def _cache_key(self, kind: str, model: str, prompt: str, config: dict, use_cache: bool) -> str | None:
+        """캐시 키 (캐시가 없거나 우회하면 None)"""
+        if not use_cache or self._response_cache is None:
+            return None
+        return ResponseCache.make_key(kind, model, prompt, config)
+
+    def _record_usage(self, usage: ModelCallUsage) -> None:
+        """사용량 원장에 호출 기록 (원장이 없으면 무시)"""
+        if self._usage_ledger is not None:
+            self._usage_ledger.add(usage)
+
+    def _call_model(self, client, operation: str, hedge: bool = False, **kwargs) -> tuple[Any, float]:
+        """generate_content 호출 → (응답, 소요 시간)
+
+        시도마다 모델별 동시 호출 제한기의 자리를 잡고, 429/5xx/연결 오류는 공통 재시도 정책으로
+        재시도합니다. hedge=True이고 헤저가 있으면 느린 요청에 같은 요청을 한 번 더 보내고
+        먼저 온 응답을 쓰며, 버려진 응답의 사용량은 hedge 티어 손실로 기록합니다.
+        """
+        model = kwargs["model"]
+        limiter = self._limiters.get(model)
+        started = time.perf_counter()
+
+        def _once():
+            return self._retry_policy.call(
+                limiter.call, client.models.generate_content, operation=operation, **kwargs
             )
-        return self._client
+
+        if hedge and self._hedger is not None:
+            response = self._hedger.call(
+                f"{model}:{operation}",
+                _once,
+                on_discarded=lambda discarded: self._record_usage(
+                    build_usage(
+                        operation, model, time.perf_counter() - started, discarded,
+                        tier="hedge", escalated=True,
+                    )
+                ),
+            )
+        else:
+            response = _once()
+        return response, time.perf_counter() - started
+
+    def _generate(self, client, operation: str, **kwargs):
+        """generate_content 호출 후 사용량 기록"""
+        response, latency = self._call_model(client, operation, **kwargs)
+        self._record_usage(build_usage(operation, kwargs["model"], latency, response))
+        return response
+
+    def _open_stream(self, client, operation: str, meta: dict | None = None, **kwargs) -> Iterator:
+        """generate_content_stream 열기
+
+        첫 조각을 받을 때까지만 재시도합니다. 이미 조각을 내보낸 뒤의 오류를 재시도하면
+        같은 내용이 두 번 전달되므로 그대로 전달합니다. 동시 호출 제한기의 자리는 스트림이
+        끝날 때까지 유지합니다. 스트림이 끝나면 usage_metadata가 담긴 마지막 조각 기준으로
+        사용량을 기록하고, meta를 주면 기록 대신 meta에 response(마지막 조각)/latency를 채웁니다.
+        """
+        limiter = self._limiters.get(kwargs["model"])
+
+        def _first():
+            token = limiter.acquire()
+            try:
+                stream = iter(client.models.generate_content_stream(**kwargs))
+                return next(stream, None), stream, token
+            except Exception as e:
+                limiter.release(token, e)
+                raise
+
+        started = time.perf_counter()
+        first, stream, token = self._retry_policy.call(_first, operation=operation)
+        error: BaseException | None = None
+        try:
+            if first is None:
+                return
+            last = first
+            yield first
+            for chunk in stream:
+                if getattr(chunk, "usage_metadata", None) is not None:
+                    last = chunk
+                yield chunk
+            latency = time.perf_counter() - started
+            if meta is not None:
+                meta.update(response=last, latency=latency)
+            else:
+                self._record_usage(build_usage(operation, kwargs["model"], latency, last))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            limiter.release(token, error)
+
+    # ------------------------------------------------------------------
+    # 모델 캐스케이드 (fast → pro)
+    # ------------------------------------------------------------------
+
+    def _tiers(self, quality: str) -> list[tuple[str, str]]:
+        """품질 요청에 따른 (티어, 모델) 시도 순서
+
+        auto: 빠른 모델 먼저, 검증/품질 검사에 실패하면 pro 모델로 상향
+        final: pro 모델만 사용
+        """
+        if quality not in QUALITY_LEVELS:
+            raise InvalidConfigError(f"알 수 없는 품질 요청: {quality}", {"allowed": list(QUALITY_LEVELS)})
+        if quality == "final" or not self._fast_model or self._fast_model == self._text_model:
+            return [("pro", self._text_model)]
+        return [("fast", self._fast_model), ("pro", self._text_model)]
+
+    def _cascade(
+        self,
+        operation: str,
+        quality: str,
+        attempt: Callable[[str], tuple[str, Any, float]],
+        check: Callable[[str], tuple[Any, str | None]],
+    ) -> tuple[Any, str | None, dict]:
+        """티어 순서대로 시도하고 통과한 첫 결과 반환 → (값, 마지막 실패 사유, 티어 정보)
+
+        attempt(모델)은 (응답 텍스트, usage_metadata가 담긴 응답, 소요 시간), check(텍스트)는
+        (값, 실패 사유 또는 None)을 돌려줍니다. 빠른 모델의 오류/실패는 상향 사유가 되고,
+        마지막 티어의 실패 사유는 그대로 돌려줘 호출한 쪽이 처리합니다(다시 생성하지 않음).
+        티어 정보: tier, model, escalation_reason, latency_seconds(전체), cost_usd, cost_saved_usd
+        """
+        tiers = self._tiers(quality)
+        calls: list[ModelCallUsage] = []
+        reason: str | None = None
+        for index, (tier, model) in enumerate(tiers):
+            is_last = index == len(tiers) - 1
+            try:
+                text, source, latency = attempt(model)
+                value, failure = check(text)
+            except Exception as e:
+                if is_last:
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+                logger.warning(f"{operation}: {model} 호출 실패, {tiers[index + 1][1]}로 상향 - {e}")
+                continue
+
+            escalate = failure is not None and not is_last
+            usage = build_usage(
+                operation,
+                model,
+                latency,
+                source,
+                tier=tier,
+                baseline_model=self._text_model if tier == "fast" else None,
+                escalated=escalate,
+            )
+            self._record_usage(usage)
+            calls.append(usage)
+            if escalate:
+                reason = failure
+                logger.info(f"{operation}: {model} 결과 부족({failure}), {tiers[index + 1][1]}로 상향")
+                continue
+
+            info = {
+                "tier": tier,
+                "model": model,
+                "escalation_reason": reason,
+                "latency_seconds": round(sum(call.latency_seconds for call in calls), 3),
+                "cost_usd": round(sum(call.cost_usd for call in calls), 6),
+                "cost_saved_usd": round(sum(call.cost_saved_usd for call in calls), 6),
+            }
+            logger.info(
+                f"{operation}: {tier} 티어({model}) 응답, {info['latency_seconds']:.2f}초, "
+                f"절감 ${info['cost_saved_usd']:.4f}"
+            )
+            return value, failure, info
+        raise GeminiAPIError(f"{operation}: 응답한 모델 없음", {"reason": reason})
 
     def is_configured(self) -> bool:
         """설정 확인"""
@@ -60,8 +264,32 @@ class GeminiClient:
         prompt: str,
         temperature: float = 0.7,
         use_grounding: bool = False,
+        use_cache: bool = True,
+        quality: str = "auto",
+        validator: Optional[Callable[[str], str | None]] = None,
     ) -> str:
-        """텍스트 생성"""
+        """텍스트 생성
+
+        quality="auto"면 빠른 모델 응답이 비었거나 validator(텍스트)가 실패 사유를 돌려줄 때만
+        pro 모델로 다시 요청하고, "final"이면 처음부터 pro 모델을 씁니다.
+        use_cache=False면 응답 캐시를 건너뜁니다. 헤저가 있으면 느린 요청을 헤징합니다.
+        """
+        tiers = self._tiers(quality)
+        cache_key = self._cache_key(
+            "text", self._text_model, prompt,
+            {
+                "temperature": temperature,
+                "grounding": use_grounding,
+                "models": [model for _, model in tiers],
+            },
+            use_cache,
+        )
+        if cache_key:
+            cached = self._response_cache.get("text", cache_key)
+            if cached is not None:
+                logger.info("텍스트 생성 캐시 사용")
+                return cached
+
         try:
             from google.genai import types
 
@@ -72,24 +300,91 @@ class GeminiClient:
             if use_grounding:
                 config.tools = [types.Tool(google_search=types.GoogleSearch())]
 
-            response = client.models.generate_content(
-                model=self._text_model,
-                contents=prompt,
-                config=config,
-            )
+            def attempt(model: str) -> tuple[str, Any, float]:
+                response, latency = self._call_model(
+                    client, "Gemini 텍스트 생성", hedge=True, model=model, contents=prompt, config=config
+                )
+                return response.text or "", response, latency
 
-            return response.text
+            def check(text: str) -> tuple[str, str | None]:
+                if not text.strip():
+                    return text, "빈 응답"
+                return text, validator(text) if validator else None
+
+            text, _, _ = self._cascade("Gemini 텍스트 생성", quality, attempt, check)
+
+            if cache_key and text:
+                self._response_cache.set("text", cache_key, text)
+            return text
 
         except Exception as e:
             logger.error(f"텍스트 생성 실패: {e}")
             raise GeminiAPIError(f"텍스트 생성 실패: {e}")
 
+    def generate_text_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        use_grounding: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[str]:
+        """텍스트 스트리밍 생성 (도착하는 텍스트 조각을 차례로 반환, 캐시 적중 시 전체를 한 번에 반환)"""
+        cache_key = self._cache_key(
+            "text", self._text_model, prompt,
+            {"temperature": temperature, "grounding": use_grounding}, use_cache,
+        )
+        if cache_key:
+            cached = self._response_cache.get("text", cache_key)
+            if cached is not None:
+                logger.info("텍스트 생성 캐시 사용")
+                yield cached
+                return
+
+        try:
+            from google.genai import types
+
+            client = self._get_client()
+
+            config = types.GenerateContentConfig(temperature=temperature)
+
+            if use_grounding:
+                config.tools = [types.Tool(google_search=types.GoogleSearch())]
+
+            chunks: list[str] = []
+            for chunk in self._open_stream(
+                client,
+                "Gemini 텍스트 스트리밍",
+                model=self._text_model,
+                contents=prompt,
+                config=config,
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+
+        except Exception as e:
+            logger.error(f"텍스트 스트리밍 생성 실패: {e}")
+            raise GeminiAPIError(f"텍스트 스트리밍 생성 실패: {e}")
+
+        if cache_key and chunks:
+            self._response_cache.set("text", cache_key, "".join(chunks))
+
     def generate_image(
         self,
         prompt: str,
         aspect_ratio: str = "16:9",
+        use_cache: bool = True,
     ) -> bytes | None:
         """이미지 생성 (genesis_kr/v3 방식: generate_content + response_modalities)"""
+        cache_key = self._cache_key(
+            "image", self._image_model, prompt, {"aspect_ratio": aspect_ratio}, use_cache
+        )
+        if cache_key:
+            cached = self._response_cache.get("image", cache_key)
+            if cached is not None:
+                logger.info(f"이미지 생성 캐시 사용: {len(cached):,} bytes")
+                return cached
+
         try:
             import base64
             from google.genai.types import GenerateContentConfig, Modality
@@ -97,7 +392,9 @@ class GeminiClient:
             client = self._get_client()
 
             # v3와 동일: generate_content + response_modalities 사용
-            response = client.models.generate_content(
+            response = self._generate(
+                client,
+                "Gemini 이미지 생성",
                 model=self._image_model,
                 contents=prompt,
                 config=GenerateContentConfig(
@@ -113,6 +410,8 @@ class GeminiClient:
                         if isinstance(img_data, str):
                             img_data = base64.b64decode(img_data)
                         logger.info(f"이미지 생성 완료: {len(img_data):,} bytes")
+                        if cache_key:
+                            self._response_cache.set("image", cache_key, img_data)
                         return img_data
 
             return None
@@ -128,8 +427,19 @@ class GeminiClient:
         product_name: str,
         progress_callback: Optional[Callable[[str, int], None]] = None,
         use_search_grounding: bool = True,
+        use_cache: bool = True,
+        field_callback: Optional[Callable[[str, Any], None]] = None,
+        quality: str = "auto",
     ) -> dict[str, Any]:
-        """마케팅 데이터 분석"""
+        """마케팅 데이터 분석
+
+        field_callback이 있으면 응답을 스트리밍으로 받아 최상위 필드(target_audience,
+        hook_suggestions, keywords 등)가 완성될 때마다 (필드명, 값)으로 호출합니다.
+        quality="auto"면 빠른 모델 응답이 스키마/품질 검사에 실패할 때만 pro 모델로 상향하며,
+        이때 같은 필드가 pro 모델 값으로 한 번 더 전달됩니다. "final"이면 pro 모델만 씁니다.
+        결과의 _cascade에 응답한 티어/모델, 상향 사유, 소요 시간, 절감 비용을 담습니다.
+        use_cache=False면 응답 캐시를 건너뜁니다. 헤저가 있으면 스트리밍이 아닌 요청만 헤징합니다.
+        """
         logger.info(f"마케팅 분석 시작: {product_name}")
 
         try:
@@ -140,71 +450,119 @@ class GeminiClient:
             if progress_callback:
                 progress_callback("마케팅 데이터 분석 중...", 20)
 
+            packed = pack_collected_data(youtube_data, naver_data, self._prompt_token_budget)
+            logger.info(
+                f"프롬프트 데이터 압축: {packed['raw_tokens']:,} → {packed['tokens']:,} 토큰 "
+                f"(절감 {packed['saved_tokens']:,}, 예산 {packed['budget']:,}"
+                + (f", 생략: {', '.join(packed['omitted'])})" if packed["omitted"] else ")")
+            )
+
             analysis_prompt = f"""
 당신은 전문 마케팅 분석가입니다. 다음 데이터를 분석하여 마케팅 인사이트를 제공해주세요.
 
 ## 분석 대상 제품
 제품명: {product_name}
 
-## YouTube 데이터
-{json.dumps(youtube_data, ensure_ascii=False, indent=2) if youtube_data else "데이터 없음"}
-
-## 네이버 쇼핑 데이터
-{json.dumps(naver_data, ensure_ascii=False, indent=2) if naver_data else "데이터 없음"}
+## 수집 데이터 요약 (YouTube 댓글/영상, 네이버 쇼핑)
+{packed["text"]}
 
 ## 분석 요청
-다음 형식으로 분석 결과를 JSON으로 반환해주세요:
-
-{{
-    "target_audience": {{
-        "primary": "주요 타겟 고객층",
-        "secondary": "2차 타겟 고객층",
-        "pain_points": ["고객 페인 포인트 1", "페인 포인트 2", "페인 포인트 3"],
-        "desires": ["고객이 원하는 것 1", "원하는 것 2", "원하는 것 3"]
-    }},
-    "competitor_analysis": {{
-        "price_range": "가격대 분석",
-        "key_features": ["주요 경쟁 기능 1", "기능 2", "기능 3"],
-        "differentiators": ["차별화 포인트 1", "포인트 2"]
-    }},
-    "content_strategy": {{
-        "trending_topics": ["인기 주제 1", "주제 2", "주제 3"],
-        "content_types": ["효과적인 콘텐츠 유형 1", "유형 2"],
-        "posting_tips": ["포스팅 팁 1", "팁 2"]
-    }},
-    "hook_suggestions": [
-        "훅 문구 제안 1",
-        "훅 문구 제안 2",
-        "훅 문구 제안 3",
-        "훅 문구 제안 4",
-        "훅 문구 제안 5"
-    ],
-    "keywords": ["키워드 1", "키워드 2", "키워드 3", "키워드 4", "키워드 5"],
-    "summary": "전체 분석 요약 (2-3문장)"
-}}
+키워드 빈도의 비율은 키워드가 들어간 댓글 중 해당 키워드 댓글의 비율, 좋아요는 같은 댓글들의
+좋아요 합계 중 차지하는 비율입니다. 댓글/상품 목록은 예시로 일부만 포함되어 있으니,
+전체 댓글·상품에서 집계한 빈도와 가격 통계를 근거로 고객 불만/욕구의 비중과 가격대를 판단해주세요.
+
+다음 항목을 JSON으로 반환해주세요 (형식은 응답 스키마를 따릅니다):
+- target_audience: 주요/2차 타겟 고객층, 페인 포인트 3개, 원하는 것 3개
+- competitor_analysis: 가격대 분석, 주요 경쟁 기능 3개, 차별화 포인트 2개
+- content_strategy: 인기 주제 3개, 효과적인 콘텐츠 유형 2개, 포스팅 팁 2개
+- hook_suggestions: 훅 문구 제안 5개
+- keywords: 핵심 키워드 5개
+- summary: 전체 분석 요약 (2-3문장)
 """
 
             if progress_callback:
                 progress_callback("AI 분석 진행 중...", 50)
 
-            config = types.GenerateContentConfig(
-                temperature=0.7,
-                response_mime_type="application/json",
+            tiers = self._tiers(quality)
+            cache_key = self._cache_key(
+                "analysis", self._text_model, analysis_prompt,
+                {
+                    "temperature": 0.7,
+                    "grounding": use_search_grounding,
+                    "schema": MarketingAnalysis.__name__,
+                    "models": [model for _, model in tiers],
+                },
+                use_cache,
             )
+            cached_text = self._response_cache.get("analysis", cache_key) if cache_key else None
+            if cached_text is not None:
+                logger.info("마케팅 분석 캐시 사용")
+                if field_callback:
+                    for key, value in IncrementalJSONParser().feed(cached_text):
+                        field_callback(key, value)
+                try:
+                    analysis = self._parse_analysis(cached_text)
+                except GeminiAPIError as e:
+                    # 파싱되지 않는 캐시 항목은 제거하고 실패로 반환 (다시 생성하지 않음)
+                    self._response_cache.invalidate(cache_key)
+                    logger.error(f"마케팅 분석 캐시 응답 파싱 실패: {e}")
+                    return {"error": str(e), "raw_text": cached_text[:500]}
+                cascade_info: dict = {"tier": "cache"}
+            else:
+                config = types.GenerateContentConfig(
+                    temperature=0.7,
+                    response_mime_type="application/json",
+                    response_schema=MarketingAnalysis,
+                )
 
-            if use_search_grounding:
-                config.tools = [types.Tool(google_search=types.GoogleSearch())]
+                if use_search_grounding:
+                    config.tools = [types.Tool(google_search=types.GoogleSearch())]
+
+                texts: list[str] = []
+
+                def attempt(model: str) -> tuple[str, Any, float]:
+                    if field_callback:
+                        meta: dict = {}
+                        text = self._stream_json_fields(
+                            client, analysis_prompt, config, field_callback, model=model, meta=meta
+                        )
+                        return text, meta.get("response"), meta.get("latency", 0.0)
+                    response, latency = self._call_model(
+                        client, "Gemini 마케팅 분석", hedge=True,
+                        model=model, contents=analysis_prompt, config=config,
+                    )
+                    return response.text or "", response, latency
 
-            response = client.models.generate_content(
-                model=self._text_model,
-                contents=analysis_prompt,
-                config=config,
-            )
+                def check(text: str) -> tuple[MarketingAnalysis | None, str | None]:
+                    texts.append(text)
+                    try:
+                        parsed = self._parse_analysis(text)
+                    except GeminiAPIError as e:
+                        return None, str(e)
+                    return parsed, self._analysis_quality_issue(parsed)
+
+                analysis, failure, cascade_info = self._cascade(
+                    "Gemini 마케팅 분석", quality, attempt, check
+                )
+                if analysis is None:
+                    # 마지막 티어도 스키마에 맞지 않으면 다시 생성하지 않고 실패로 반환
+                    logger.error(f"마케팅 분석 응답 파싱 실패: {failure}")
+                    return {"error": failure, "raw_text": texts[-1][:500], "_cascade": cascade_info}
+                if failure:
+                    # 마지막 티어의 품질 검사 실패는 경고만 남김 (더 올릴 티어가 없음)
+                    cascade_info["quality_warning"] = failure
+                if cache_key:
+                    # 스키마에 맞는 새 응답만 캐시
+                    self._response_cache.set("analysis", cache_key, texts[-1])
 
             if progress_callback:
                 progress_callback("분석 결과 처리 중...", 80)
 
-            result = self._validate_json_output(response.text)
+            result = analysis.model_dump()
+            result["_prompt_stats"] = {
+                key: packed[key] for key in ("tokens", "raw_tokens", "saved_tokens", "omitted")
+            }
+            result["_cascade"] = cascade_info
 
             logger.info("마케팅 분석 완료")
 
@@ -219,10 +577,39 @@ class GeminiClient:
                 progress_callback(f"오류: {e}", 0)
             return {"error": str(e)}
 
+    def _stream_json_fields(
+        self,
+        client,
+        contents: str,
+        config,
+        field_callback: Callable[[str, Any], None],
+        model: str | None = None,
+        meta: dict | None = None,
+    ) -> str:
+        """JSON 응답 스트리밍 수신, 최상위 필드가 완성될 때마다 콜백 호출 후 전체 텍스트 반환"""
+        parser = IncrementalJSONParser()
+        chunks: list[str] = []
+        for chunk in self._open_stream(
+            client,
+            "Gemini 마케팅 분석 스트리밍",
+            meta=meta,
+            model=model or self._text_model,
+            contents=contents,
+            config=config,
+        ):
+            if not chunk.text:
+                continue
+            chunks.append(chunk.text)
+            for key, value in parser.feed(chunk.text):
+                field_callback(key, value)
+        return "".join(chunks)
+
     def generate_marketing_strategy(
         self,
         collected_data: dict,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        field_callback: Optional[Callable[[str, Any], None]] = None,
+        quality: str = "auto",
     ) -> dict[str, Any]:
         """마케팅 전략 생성"""
         product = collected_data.get("product", {})
@@ -237,6 +624,8 @@ class GeminiClient:
             product_name=product_name,
             progress_callback=progress_callback,
             use_search_grounding=True,
+            field_callback=field_callback,
+            quality=quality,
         )
 
     def _build_image_prompt(
@@ -286,14 +675,24 @@ MOOD:
 - Creates urgency and desire
 """.strip()
 
+    @property
+    def image_model(self) -> str:
+        """이미지 생성 모델 ID"""
+        return self._image_model
+
+    def thumbnail_prompt(self, product: dict, hook_text: str, style: str = "드라마틱") -> str:
+        """썸네일 이미지 프롬프트 (썸네일 저장소 키 계산용)"""
+        return self._build_image_prompt(product, hook_text, style)
+
     def generate_thumbnail(
         self,
         product: dict,
         hook_text: str,
         style: str = "드라마틱",
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        use_cache: bool = True,
     ) -> bytes | None:
-        """마케팅 썸네일 생성"""
+        """마케팅 썸네일 생성 (use_cache=False면 응답 캐시를 건너뛰고 새로 생성)"""
         logger.info(f"썸네일 생성 시작: {product.get('name', 'N/A')}")
 
         try:
@@ -305,7 +704,7 @@ MOOD:
             if progress_callback:
                 progress_callback("이미지 생성 중...", 30)
 
-            image_data = self.generate_image(prompt, aspect_ratio="16:9")
+            image_data = self.generate_image(prompt, aspect_ratio="16:9", use_cache=use_cache)
 
             if progress_callback:
                 progress_callback("이미지 처리 중...", 80)
@@ -331,33 +730,54 @@ MOOD:
         hook_texts: list[str],
         styles: list[str] | None = None,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        max_concurrency: int | None = None,
+        use_cache: bool = True,
     ) -> list[dict]:
-        """다중 썸네일 생성"""
+        """다중 썸네일 동시 생성
+
+        max_concurrency(기본: 클라이언트 설정)개까지 동시에 생성하고, 진행 콜백은 끝나는 순서대로
+        호출합니다. 결과 목록은 hook_texts 순서를 따르며 실패한 썸네일만 빠집니다.
+        use_cache=False면 응답 캐시를 건너뛰고 새로 생성합니다.
+        """
         logger.info(f"다중 썸네일 생성 시작: {len(hook_texts)}개")
 
         if styles is None:
-            styles = ["드라마틱", "미니멀", "모던"]
+            styles = MULTI_THUMBNAIL_STYLES
 
-        results = []
         total = len(hook_texts)
+        if total == 0:
+            return []
+        jobs = [(hook_text, styles[i % len(styles)]) for i, hook_text in enumerate(hook_texts)]
+        workers = max(1, min(max_concurrency or self._thumbnail_concurrency, total))
 
-        for i, hook_text in enumerate(hook_texts):
-            style = styles[i % len(styles)]
+        if progress_callback:
+            progress_callback(f"썸네일 {total}개 생성 중 (동시 {workers}개)...", 0)
+
+        images: list[bytes | None] = [None] * total
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnail") as executor:
+            futures = {
+                executor.submit(
+                    self.generate_thumbnail, product, hook_text, style, use_cache=use_cache
+                ): i
+                for i, (hook_text, style) in enumerate(jobs)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                try:
+                    images[i] = future.result()
+                except Exception as e:
+                    logger.error(f"썸네일 생성 실패 ({jobs[i][0]}): {e}")
+                status = "완료" if images[i] else "실패"
+                if progress_callback:
+                    progress_callback(
+                        f"썸네일 {done}/{total} {status}: {jobs[i][0]}", int(done / total * 100)
+                    )
 
-            if progress_callback:
-                progress = int((i / total) * 100)
-                progress_callback(f"썸네일 {i + 1}/{total} 생성 중...", progress)
-
-            image = self.generate_thumbnail(product, hook_text, style)
-
-            if image:
-                results.append(
-                    {
-                        "image": image,
-                        "hook_text": hook_text,
-                        "style": style,
-                    }
-                )
+        results = [
+            {"image": image, "hook_text": hook_text, "style": style}
+            for image, (hook_text, style) in zip(images, jobs)
+            if image
+        ]
 
         logger.info(f"다중 썸네일 생성 완료: {len(results)}/{total}")
 
@@ -407,51 +827,28 @@ MOOD:
 
         return unique_hooks
 
-    def _validate_json_output(
-        self,
-        text: str,
-        required_fields: list[str] | None = None,
-    ) -> dict:
-        """LLM 출력 JSON 검증"""
+    @staticmethod
+    def _analysis_quality_issue(analysis: MarketingAnalysis) -> str | None:
+        """분석 결과 품질 검사 (통과하면 None, 아니면 실패 사유)"""
+        if not analysis.target_audience.primary.strip():
+            return "타겟 고객층 없음"
+        if len(analysis.hook_suggestions) < CASCADE_MIN_HOOKS:
+            return f"훅 문구 {len(analysis.hook_suggestions)}개 (최소 {CASCADE_MIN_HOOKS}개)"
+        if len(analysis.keywords) < CASCADE_MIN_KEYWORDS:
+            return f"키워드 {len(analysis.keywords)}개 (최소 {CASCADE_MIN_KEYWORDS}개)"
+        if not analysis.summary.strip():
+            return "요약 없음"
+        return None
+
+    @staticmethod
+    def _parse_analysis(text: str | None) -> MarketingAnalysis:
+        """스키마 제한 JSON 응답을 MarketingAnalysis로 한 번에 파싱 (실패 시 GeminiAPIError)"""
+        if not text:
+            raise GeminiAPIError("빈 분석 응답")
         try:
-            result = json.loads(text)
-        except json.JSONDecodeError:
-            json_match = re.search(r"\{[\s\S]*\}", text)
-            if json_match:
-                try:
-                    result = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    return {"error": "JSON 파싱 실패", "raw_text": text[:500]}
-            else:
-                return {"error": "JSON을 찾을 수 없음", "raw_text": text[:500]}
-
-        if required_fields:
-            missing = [f for f in required_fields if f not in result]
-            if missing:
-                result["_validation_warning"] = f"누락된 필드: {missing}"
-
-        return result
-
-    def retry_with_backoff(
-        self,
-        func: Callable,
-        max_retries: int = 3,
-        base_delay: float = 1.0,
-        max_delay: float = 10.0,
-    ):
-        """지수 백오프 재시도"""
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                return func()
-            except Exception as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    delay = min(base_delay * (2**attempt), max_delay)
-                    logger.info(
-                        f"재시도 {attempt + 1}/{max_retries} ({delay:.1f}초 후)"
-                    )
-                    time.sleep(delay)
-
-        raise last_error  # type: ignore
+            return MarketingAnalysis.model_validate_json(text)
+        except PydanticValidationError as e:
+            raise GeminiAPIError(
+                f"분석 응답 스키마 검증 실패: {e.error_count()}개 오류",
+                {"errors": e.errors(include_url=False, include_input=False)[:5]},
+            )
@@ -0,0 +1,94 @@
+"""
+공용 genai 클라이언트 제공자
+GeminiClient/VeoClient가 프로세스 전체에서 하나의 연결 풀(httpx)과 인증 정보를 공유하도록 genai.Client를 만들어 줌
+"""
+import threading
+from typing import Any
+
+from ...config.constants import GENAI_AUTH_SCOPES, GENAI_MAX_CONNECTIONS, GENAI_MAX_KEEPALIVE
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GenaiClientProvider:
+    """(프로젝트, 리전)별 genai.Client 제공자 (스레드 안전)
+
+    모든 클라이언트가 httpx 연결 풀 하나와 인증 정보(ADC) 하나를 공유하므로 연결/TLS 핸드셰이크와
+    토큰 갱신이 클라이언트마다 반복되지 않습니다. 생성은 잠금 안에서 한 번만 일어납니다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = GENAI_MAX_CONNECTIONS,
+        max_keepalive_connections: int = GENAI_MAX_KEEPALIVE,
+        credentials: Any = None,
+        base_url: str | None = None,
+    ) -> None:
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._credentials = credentials
+        self._base_url = base_url  # 사설 엔드포인트/벤치마크용 (None이면 기본 Vertex AI 엔드포인트)
+        self._lock = threading.Lock()
+        self._transport = None
+        self._clients: dict[tuple[str, str], Any] = {}
+
+    def _ensure_shared(self) -> None:
+        """공유 연결 풀/인증 정보 준비 (잠금 안에서 호출)"""
+        if self._transport is None:
+            import httpx
+
+            self._transport = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive_connections,
+                ),
+                timeout=None,  # 요청별 제한 시간은 genai가 http_options.timeout으로 지정
+            )
+        if self._credentials is None:
+            import google.auth
+
+            self._credentials, _ = google.auth.default(scopes=list(GENAI_AUTH_SCOPES))
+
+    def get(self, project_id: str, location: str):
+        """(프로젝트, 리전)의 공용 genai.Client (없으면 생성)"""
+        key = (project_id, location)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                from google import genai
+                from google.genai import types
+
+                self._ensure_shared()
+                client = self._clients[key] = genai.Client(
+                    vertexai=True,
+                    project=project_id,
+                    location=location,
+                    credentials=self._credentials,
+                    http_options=types.HttpOptions(
+                        base_url=self._base_url, httpx_client=self._transport
+                    ),
+                )
+                logger.info(f"genai 클라이언트 생성: {project_id}/{location}")
+            return client
+
+    @property
+    def stats(self) -> dict:
+        """생성된 클라이언트 수와 연결 풀 한도"""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "max_connections": self._max_connections,
+                "max_keepalive_connections": self._max_keepalive_connections,
+            }
+
+    def close(self) -> None:
+        """연결 풀 종료 (이후 get()은 새 풀로 다시 생성)"""
+        with self._lock:
+            if self._transport is not None:
+                self._transport.close()
+            self._transport = None
+            self._clients.clear()
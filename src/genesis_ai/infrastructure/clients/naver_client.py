@@ -1,10 +1,37 @@
 """
 네이버 쇼핑 API 클라이언트
 """
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
 import requests
+from requests.adapters import HTTPAdapter
 
-from ...core.exceptions import NaverAPIError
+from ...config.constants import (
+    NAVER_CACHE_MAX_BYTES,
+    NAVER_CACHE_MAX_ENTRIES,
+    NAVER_CACHE_STALE_TTL,
+    NAVER_CACHE_TTL,
+    NAVER_DAILY_CALL_LIMIT,
+    NAVER_HTTP_POOL_SIZE,
+    NAVER_MAX_CONCURRENCY,
+    NAVER_MAX_RETRIES,
+    NAVER_MAX_START,
+    NAVER_PAGE_SIZE,
+    NAVER_RATE_LIMIT_QPS,
+    NAVER_REQUEST_TIMEOUT,
+    NAVER_RETRY_BASE_DELAY,
+    NAVER_RETRY_MAX_DELAY,
+    RETRYABLE_STATUS_CODES,
+)
+from ...core.analysis import compute_competitor_stats
+from ...core.exceptions import NaverAPIError, RateLimitExceededError
 from ...utils.logger import get_logger
+from ..cache import TTLCache
+from ..resilience import RetryBudget, RetryPolicy, TokenBucketRateLimiter, parse_retry_after
 
 logger = get_logger(__name__)
 
@@ -14,9 +41,94 @@ class NaverClient:
 
     SHOPPING_API_URL = "https://openapi.naver.com/v1/search/shop.json"
 
-    def __init__(self, client_id: str, client_secret: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        pool_size: int = NAVER_HTTP_POOL_SIZE,
+        timeout: float = NAVER_REQUEST_TIMEOUT,
+        api_url: str = SHOPPING_API_URL,
+        rate_limit_qps: float = NAVER_RATE_LIMIT_QPS,
+        daily_call_limit: int | None = NAVER_DAILY_CALL_LIMIT,
+        max_retries: int = NAVER_MAX_RETRIES,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        cache_ttl: float = NAVER_CACHE_TTL,
+        cache_stale_ttl: float = NAVER_CACHE_STALE_TTL,
+        cache: TTLCache | None = None,
+        retry_budget: RetryBudget | None = None,
+    ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
+        self._timeout = timeout
+        self._api_url = api_url
+        self._retry_policy = RetryPolicy(
+            max_attempts=max_retries + 1,
+            base_delay=NAVER_RETRY_BASE_DELAY,
+            max_delay=NAVER_RETRY_MAX_DELAY,
+            budget=retry_budget,
+        )
+
+        # 모든 스레드가 하나의 토큰 버킷을 공유해 QPS/일일 한도를 지킴
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=rate_limit_qps,
+            daily_limit=daily_call_limit,
+        )
+
+        # 페이지 단위 검색 결과 캐시 - (query, display, start, sort)로 구분, ttl 0이면 사용 안 함
+        if cache is None and cache_ttl > 0:
+            cache = TTLCache(
+                ttl=cache_ttl,
+                stale_ttl=cache_stale_ttl,
+                max_entries=NAVER_CACHE_MAX_ENTRIES,
+                max_bytes=NAVER_CACHE_MAX_BYTES,
+            )
+        self._cache = cache
+
+        # 인증 헤더는 요청마다 새로 만들지 않고 한 번만 구성
+        self._default_headers = {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret,
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        }
+
+        # 연결 풀(keep-alive)은 어댑터가 소유하므로 모든 스레드가 하나의 어댑터를 공유해
+        # TCP/TLS 핸드셰이크를 재사용합니다. pool_block=True로 풀 크기 이상 연결을 만들지 않음
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        # requests.Session 자체는 스레드 안전이 보장되지 않으므로 스레드마다 세션을 두고
+        # 같은 어댑터를 마운트해 연결 풀만 공유
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """현재 스레드용 세션 반환 (지연 초기화)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._default_headers)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """공유 호출 한도 제어기"""
+        return self._rate_limiter
+
+    @property
+    def cache(self) -> TTLCache | None:
+        """검색 결과 캐시"""
+        return self._cache
+
+    def close(self) -> None:
+        """연결 풀 및 캐시 갱신 스레드 정리"""
+        if self._cache is not None:
+            self._cache.close()
+        self._adapter.close()
 
     def is_configured(self) -> bool:
         """API 키가 설정되었는지 확인"""
@@ -25,35 +137,140 @@ class NaverClient:
     def health_check(self) -> bool:
         """API 연결 상태 확인"""
         try:
-            self.search_shopping("테스트", display=1)
+            # 캐시를 거치지 않고 실제 API를 호출
+            self._request_page("테스트", 1, 1, "sim")
             return True
         except Exception:
             return False
 
     def search(self, query: str, max_results: int = 10) -> list[dict]:
         """검색 실행 (ISearchClient 구현)"""
-        return self.search_shopping(query, display=max_results)
+        return self.search_shopping_all(query, total=max_results)
 
-    def search_shopping(self, query: str, display: int = 10) -> list[dict]:
-        """네이버 쇼핑 상품 검색"""
+    def search_shopping(
+        self,
+        query: str,
+        display: int = 10,
+        start: int = 1,
+        sort: str = "sim",
+    ) -> list[dict]:
+        """네이버 쇼핑 상품 검색 (단일 페이지, display 최대 100)"""
         if not self.is_configured():
             logger.warning("네이버 API 자격증명이 설정되지 않았습니다.")
             return []
 
-        headers = {
-            "X-Naver-Client-Id": self._client_id,
-            "X-Naver-Client-Secret": self._client_secret,
-        }
-        params = {"query": query, "display": display}
+        return self._fetch_page(query, display, start, sort)[0]
+
+    def search_shopping_all(
+        self,
+        query: str,
+        total: int = NAVER_PAGE_SIZE,
+        sort: str = "sim",
+    ) -> list[dict]:
+        """여러 페이지 검색 결과를 순위 순서대로 병합한 목록 (productId 기준 중복 제거)"""
+        return list(self.iter_shopping(query, total=total, sort=sort))
+
+    def iter_shopping(
+        self,
+        query: str,
+        total: int = NAVER_PAGE_SIZE,
+        sort: str = "sim",
+        max_workers: int = NAVER_MAX_CONCURRENCY,
+    ) -> Iterator[dict]:
+        """여러 페이지 검색 결과를 순위 순서대로 하나씩 반환하는 지연 이터레이터
+
+        start 파라미터로 페이지를 나눠 최대 max_workers개 페이지를 동시에 요청하되,
+        결과는 항상 앞 페이지부터 순서대로 내보냅니다. productId 중복으로 빠진 만큼
+        다음 페이지를 더 요청해 API 전체 결과 수와 start 한도(1000) 안에서 total개를 채웁니다.
+        소비자가 중간에 멈추면 아직 시작하지 않은 페이지 요청은 취소됩니다.
+        """
+        if not self.is_configured():
+            logger.warning("네이버 API 자격증명이 설정되지 않았습니다.")
+            return
+
+        seen_ids: set[str] = set()
+        emitted = 0
+        dropped = 0
 
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        pending: deque[tuple[int, int, Future]] = deque()
+        next_start = 1
         try:
-            response = requests.get(
-                self.SHOPPING_API_URL,
-                headers=headers,
-                params=params,
-                timeout=10,
+            while True:
+                # 동시 요청 창(window)을 채움 - 중복으로 빠진 수만큼 요청 범위를 늘림
+                wanted = total + dropped
+                while (
+                    len(pending) < max_workers
+                    and next_start <= min(wanted, NAVER_MAX_START)
+                ):
+                    display = min(NAVER_PAGE_SIZE, wanted - next_start + 1)
+                    future = executor.submit(self._fetch_page, query, display, next_start, sort)
+                    pending.append((next_start, display, future))
+                    next_start += display
+
+                if not pending:
+                    break
+
+                start, display, future = pending.popleft()
+                products, api_total = future.result()
+
+                for product in products:
+                    product_id = product.get("product_id")
+                    if product_id and product_id in seen_ids:
+                        dropped += 1
+                        continue
+                    if product_id:
+                        seen_ids.add(product_id)
+                    yield product
+                    emitted += 1
+                    if emitted >= total:
+                        return
+
+                # 마지막 페이지에 도달했으면 남은 페이지는 요청할 필요 없음
+                if len(products) < display or start + display > api_total:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(
+                f"네이버 쇼핑 다중 페이지 검색 완료: '{query}' -> {emitted}개 결과 (중복 {dropped}개 제외)"
             )
 
+    def _fetch_page(
+        self,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+    ) -> tuple[list[dict], int]:
+        """단일 페이지 조회 (상품 목록, API가 보고한 전체 결과 수)
+
+        캐시가 신선하면 그대로, 만료 직후면 이전 결과를 즉시 돌려주고 백그라운드에서 갱신합니다.
+        """
+        if self._cache is None:
+            return self._request_page(query, display, start, sort)
+        key = (query, min(display, NAVER_PAGE_SIZE), start, sort)
+        return self._cache.get_or_load(
+            key, lambda: self._request_page(query, display, start, sort)
+        )
+
+    def _request_page(
+        self,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+    ) -> tuple[list[dict], int]:
+        """단일 페이지 API 요청"""
+        params = {
+            "query": query,
+            "display": min(display, NAVER_PAGE_SIZE),
+            "start": start,
+            "sort": sort,
+        }
+
+        try:
+            response = self._request(params)
+
             if response.status_code != 200:
                 raise NaverAPIError(
                     f"네이버 API 오류: {response.status_code}",
@@ -63,8 +280,9 @@ class NaverClient:
             data = response.json()
             products = []
 
-            for item in data.get("items", []):
+            for rank, item in enumerate(data.get("items", []), start=start):
                 products.append({
+                    "rank": rank,
                     "product_id": item.get("productId", ""),
                     "title": item.get("title", "").replace("<b>", "").replace("</b>", ""),
                     "price": int(item.get("lprice", 0)),
@@ -78,81 +296,61 @@ class NaverClient:
                     "category4": item.get("category4", ""),
                 })
 
-            logger.info(f"네이버 쇼핑 검색 완료: '{query}' -> {len(products)}개 결과")
-            return products
+            logger.info(f"네이버 쇼핑 검색 완료: '{query}' (start={start}) -> {len(products)}개 결과")
+            return products, int(data.get("total", len(products)))
 
-        except NaverAPIError:
+        except (NaverAPIError, RateLimitExceededError):
             raise
         except Exception as e:
             logger.error(f"네이버 쇼핑 검색 실패: {e}")
             raise NaverAPIError(f"네이버 쇼핑 검색 실패: {e}", {"query": query})
 
-    def analyze_competitors(self, products: list[dict]) -> dict:
-        """경쟁사 분석 - 가격 통계"""
-        if not products:
-            return {
-                "total_products": 0,
-                "min_price": 0,
-                "max_price": 0,
-                "avg_price": 0,
-                "top_brands": [],
-                "top_malls": [],
-                "price_distribution": {},
-            }
-
-        prices = [p["price"] for p in products if p.get("price", 0) > 0]
-        if not prices:
-            return {
-                "total_products": len(products),
-                "min_price": 0,
-                "max_price": 0,
-                "avg_price": 0,
-                "top_brands": [],
-                "top_malls": [],
-                "price_distribution": {},
-            }
-
-        # 브랜드/판매처 집계
-        brand_counts: dict[str, int] = {}
-        mall_counts: dict[str, int] = {}
-
-        for p in products:
-            brand = p.get("brand", "")
-            mall = p.get("mall", "")
-            if brand:
-                brand_counts[brand] = brand_counts.get(brand, 0) + 1
-            if mall:
-                mall_counts[mall] = mall_counts.get(mall, 0) + 1
-
-        top_brands = sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_malls = sorted(mall_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        # 가격대별 분포
-        price_ranges = {
-            "0-10000": 0,
-            "10000-30000": 0,
-            "30000-50000": 0,
-            "50000-100000": 0,
-            "100000+": 0,
-        }
-        for price in prices:
-            if price < 10000:
-                price_ranges["0-10000"] += 1
-            elif price < 30000:
-                price_ranges["10000-30000"] += 1
-            elif price < 50000:
-                price_ranges["30000-50000"] += 1
-            elif price < 100000:
-                price_ranges["50000-100000"] += 1
-            else:
-                price_ranges["100000+"] += 1
-
-        return {
-            "total_products": len(products),
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "avg_price": sum(prices) // len(prices),
-            "top_brands": [b[0] for b in top_brands],
-            "top_malls": [m[0] for m in top_malls],
-            "price_distribution": price_ranges,
-        }
+    def _request(self, params: dict) -> requests.Response:
+        """호출 한도를 지키며 요청하고 일시적 실패는 공통 재시도 정책으로 재시도
+
+        429는 공유 토큰 버킷을 멈춰 다른 스레드도 함께 늦추고, 5xx와 연결 오류/타임아웃은
+        해당 요청만 백오프 후 재시도합니다. 재시도가 소진되면 마지막 오류를 그대로 발생시킵니다.
+        """
+        return self._retry_policy.call(
+            self._request_once, params, operation="네이버 API", wait=self._wait_retry
+        )
+
+    def _request_once(self, params: dict) -> requests.Response:
+        """요청 1회 (재시도 대상 응답 코드는 NaverAPIError로 바꿔 재시도 정책에 넘김)"""
+        self._rate_limiter.acquire()
+        response = self._get_session().get(
+            self._api_url,
+            params=params,
+            timeout=self._timeout,
+        )
+        status = response.status_code
+        if self._is_retryable(status):
+            raise NaverAPIError(
+                f"네이버 API 오류: {status}",
+                {
+                    "status_code": status,
+                    "retry_after": parse_retry_after(response.headers),
+                    "query": params.get("query"),
+                },
+            )
+        return response
+
+    def _wait_retry(self, error: BaseException, delay: float) -> None:
+        """재시도 대기 (429는 공유 호출 한도 제어기를 멈춤)"""
+        if isinstance(error, NaverAPIError) and error.details.get("status_code") == 429:
+            self._rate_limiter.pause(delay)
+        else:
+            time.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(status_code: int) -> bool:
+        """재시도 대상 응답 코드 (속도 제한, 서버 오류)"""
+        return status_code in RETRYABLE_STATUS_CODES
+
+    def analyze_competitors(
+        self,
+        products: list[dict],
+        bin_edges: list[int] | str | None = None,
+    ) -> dict:
+        """경쟁사 분석 - 가격 통계 (분위수, 가격 구간, 브랜드/판매처/카테고리별 집계)"""
+        return compute_competitor_stats(products, bin_edges=bin_edges)
@@ -9,6 +9,9 @@ from typing import Callable, Optional
 from ...config.constants import CAMERA_MOTIONS
 from ...core.exceptions import VeoAPIError
 from ...utils.logger import get_logger
+from ..resilience import ConcurrencyLimiterRegistry, RetryBudget, RetryPolicy
+from .genai_provider import GenaiClientProvider
+from ..telemetry import UsageLedger
 
 logger = get_logger(__name__)
 
@@ -22,19 +25,26 @@ class VeoClient:
         location: str,
         gcs_bucket_name: str,
         model_id: str = "veo-3.1-fast-generate-001",
+        retry_budget: RetryBudget | None = None,
+        usage_ledger: UsageLedger | None = None,
+        concurrency_limiters: ConcurrencyLimiterRegistry | None = None,
+        genai_provider: GenaiClientProvider | None = None,
     ) -> None:
         self._project_id = project_id
         self._location = location
         self._gcs_bucket_name = gcs_bucket_name
         self._model_id = model_id
+        self._retry_policy = RetryPolicy(budget=retry_budget)
+        self._usage_ledger = usage_ledger
+        self._limiters = concurrency_limiters or ConcurrencyLimiterRegistry()
+        self._genai_provider = genai_provider or GenaiClientProvider()
         self._client = None
 
     def _get_client(self):
         """Genai 클라이언트 인스턴스 반환 (지연 초기화)"""
         if self._client is None:
-            from google import genai
-
-            self._client = genai.Client()
+            # 제공자가 잠금 안에서 같은 인스턴스를 돌려주므로 여러 스레드가 동시에 대입해도 무방
+            self._client = self._genai_provider.get(self._project_id, self._location)
         return self._client
 
     def is_configured(self) -> bool:
@@ -146,7 +156,13 @@ NEGATIVE PROMPT: watermarks, text overlays with errors, subtitles, blurry, low q
             if progress_callback:
                 progress_callback(f"Veo API 요청 전송 중... ({duration_seconds}초, {resolution})", 10)
 
-            operation = client.models.generate_videos(
+            started = time.perf_counter()
+
+            # 생성 요청은 모델별 동시 호출 제한기를 거침 (429 시 한도 감소)
+            operation = self._retry_policy.call(
+                self._limiters.get(self._model_id).call,
+                client.models.generate_videos,
+                operation="Veo 비디오 생성 요청",
                 model=self._model_id,
                 prompt=prompt,
                 config=GenerateVideosConfig(
@@ -171,7 +187,10 @@ NEGATIVE PROMPT: watermarks, text overlays with errors, subtitles, blurry, low q
             while not operation.done and waited < max_wait:
                 time.sleep(10)
                 waited += 10
-                operation = client.operations.get(operation)
+                operation = self._retry_policy.call(
+                    lambda current=operation: client.operations.get(current),
+                    operation="Veo 작업 상태 조회",
+                )
 
                 if progress_callback:
                     progress = min(20 + int((waited / max_wait) * 60), 80)
@@ -182,6 +201,14 @@ NEGATIVE PROMPT: watermarks, text overlays with errors, subtitles, blurry, low q
                 video_uri = video.video.uri
 
                 logger.info(f"비디오 생성 완료: {video_uri}")
+                # 생성된 영상 길이(초) 기준 과금, 지연 시간은 요청부터 완료 확인까지
+                if self._usage_ledger is not None:
+                    self._usage_ledger.record(
+                        "Veo 비디오 생성",
+                        self._model_id,
+                        time.perf_counter() - started,
+                        video_seconds=float(duration_seconds),
+                    )
 
                 if progress_callback:
                     progress_callback("비디오 다운로드 중...", 85)
@@ -197,7 +224,9 @@ NEGATIVE PROMPT: watermarks, text overlays with errors, subtitles, blurry, low q
 
                     bucket = gcs_client.bucket(bucket_name)
                     blob = bucket.blob(blob_path)
-                    video_content = blob.download_as_bytes()
+                    video_content = self._retry_policy.call(
+                        blob.download_as_bytes, operation="Veo 비디오 다운로드"
+                    )
 
                     if progress_callback:
                         progress_callback("비디오 생성 완료!", 100)
@@ -7,9 +7,19 @@ from typing import Optional
 from googleapiclient.discovery import build
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from ...config.constants import YOUTUBE_LANGUAGES
-from ...core.exceptions import YouTubeAPIError
+from ...config.constants import MAX_INCREMENTAL_COMMENT_PAGES, YOUTUBE_LANGUAGES
+from ...core.analysis import (
+    CommentBatch,
+    analyze_gain_points,
+    analyze_pain_points,
+    collapse_near_duplicates,
+)
+from ...core.analysis.comment_batch import parse_timestamp
+from ...core.exceptions import StorageError, YouTubeAPIError
+from ...utils.bloom_filter import BloomFilter
 from ...utils.logger import get_logger
+from ..resilience import RetryBudget, RetryPolicy
+from ..storage.comment_store import CommentCorpusStore
 
 logger = get_logger(__name__)
 
@@ -17,8 +27,15 @@ logger = get_logger(__name__)
 class YouTubeClient:
     """YouTube API 클라이언트"""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        comment_store: CommentCorpusStore | None = None,
+        retry_budget: RetryBudget | None = None,
+    ) -> None:
         self._api_key = api_key
+        self._comment_store = comment_store
+        self._retry_policy = RetryPolicy(budget=retry_budget)
         self._youtube = None
 
     def _get_client(self):
@@ -27,6 +44,10 @@ class YouTubeClient:
             self._youtube = build("youtube", "v3", developerKey=self._api_key)
         return self._youtube
 
+    def _execute(self, request, operation: str) -> dict:
+        """API 요청 실행 (429/5xx/연결 오류는 공통 재시도 정책으로 재시도)"""
+        return self._retry_policy.call(request.execute, operation=operation)
+
     def is_configured(self) -> bool:
         """API 키가 설정되었는지 확인"""
         return bool(self._api_key)
@@ -52,7 +73,7 @@ class YouTubeClient:
                 regionCode="KR",
                 relevanceLanguage="ko",
             )
-            response = request.execute()
+            response = self._execute(request, "YouTube 검색")
 
             videos = []
             for item in response.get("items", []):
@@ -77,7 +98,7 @@ class YouTubeClient:
         try:
             youtube = self._get_client()
             request = youtube.videos().list(part="snippet,statistics", id=video_id)
-            response = request.execute()
+            response = self._execute(request, "YouTube 비디오 조회")
 
             if not response.get("items"):
                 return None
@@ -99,33 +120,85 @@ class YouTubeClient:
 
     def get_video_comments(self, video_id: str, max_results: int = 20) -> list[dict]:
         """비디오 댓글 수집"""
+        try:
+            return self._fetch_top_comments(video_id, max_results)
+        except Exception:
+            # 댓글 비활성화 등의 경우 빈 리스트 반환
+            return []
+
+    def _fetch_top_comments(self, video_id: str, max_results: int) -> list[dict]:
+        """관련도 상위 댓글 조회 (좋아요 순 정렬, 실패 시 예외 그대로 전달)"""
+        youtube = self._get_client()
+        request = youtube.commentThreads().list(
+            part="snippet",
+            videoId=video_id,
+            maxResults=max_results,
+            order="relevance",
+            textFormat="plainText",
+        )
+        response = self._execute(request, "YouTube 댓글 조회")
+
+        comments = [self._parse_comment(item) for item in response.get("items", [])]
+
+        # 좋아요 순 정렬
+        return sorted(comments, key=lambda x: x["likes"], reverse=True)
+
+    def get_comments_since(
+        self,
+        video_id: str,
+        published_after: float,
+        seen: BloomFilter | None = None,
+        max_pages: int = MAX_INCREMENTAL_COMMENT_PAGES,
+    ) -> tuple[list[dict], bool]:
+        """워터마크 이후 새 댓글만 수집 (최신순으로 조회하다 이전 댓글을 만나면 중단)
+
+        (댓글 목록, 완료 여부)를 반환합니다. 페이지 조회가 실패했거나 max_pages 안에
+        워터마크까지 내려가지 못했으면 완료 여부가 False이며, 이때는 워터마크를 옮기면 안 됩니다.
+        """
+        comments: list[dict] = []
+        complete = False
         try:
             youtube = self._get_client()
-            request = youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=max_results,
-                order="relevance",
-                textFormat="plainText",
-            )
-            response = request.execute()
+            page_token = None
+
+            for _ in range(max_pages):
+                params = {
+                    "part": "snippet",
+                    "videoId": video_id,
+                    "maxResults": 100,
+                    "order": "time",
+                    "textFormat": "plainText",
+                }
+                if page_token:
+                    params["pageToken"] = page_token
+                response = self._execute(youtube.commentThreads().list(**params), "YouTube 댓글 조회")
+
+                reached_watermark = False
+                for item in response.get("items", []):
+                    comment = self._parse_comment(item)
+                    published = parse_timestamp(comment["published_at"])
+                    if published < published_after:
+                        reached_watermark = True
+                        break
+                    # 워터마크와 같은 시각의 댓글만 이미 저장했을 수 있으므로 블룸 필터로 건너뜀
+                    # (더 최신 댓글은 확률적 오탐으로 누락되지 않도록 검사하지 않음)
+                    if seen is not None and published == published_after and comment["comment_id"] in seen:
+                        continue
+                    comments.append(comment)
+
+                page_token = response.get("nextPageToken")
+                if reached_watermark or not page_token:
+                    complete = True
+                    break
 
-            comments = []
-            for item in response.get("items", []):
-                comment = item["snippet"]["topLevelComment"]["snippet"]
-                comments.append({
-                    "text": comment["textDisplay"],
-                    "likes": comment.get("likeCount", 0),
-                    "author": comment.get("authorDisplayName", ""),
-                    "published_at": comment.get("publishedAt", ""),
-                })
+            if not complete:
+                logger.warning(f"새 댓글이 {max_pages}페이지를 넘어 일부만 수집 ({video_id})")
 
-            # 좋아요 순 정렬
-            return sorted(comments, key=lambda x: x["likes"], reverse=True)
+        except Exception as e:
+            # 댓글 비활성화 등의 경우 지금까지 모은 댓글만 반환
+            logger.warning(f"새 댓글 조회 중단 ({video_id}): {e}")
 
-        except Exception:
-            # 댓글 비활성화 등의 경우 빈 리스트 반환
-            return []
+        return sorted(comments, key=lambda x: x["likes"], reverse=True), complete
 
     def get_transcript(self, video_id: str) -> str | None:
         """비디오 자막 추출"""
@@ -142,6 +215,8 @@ class YouTubeClient:
         product: dict,
         max_results: int = 5,
         include_comments: bool = True,
+        dedup_comments: bool = True,
+        incremental: bool = True,
     ) -> dict:
         """제품 기반 YouTube 데이터 수집"""
         # 검색 키워드 생성
@@ -152,7 +227,8 @@ class YouTubeClient:
         ]
 
         collected_videos = []
-        all_comments = []
+        # 비디오별 댓글은 바로 컬럼형 배치로 변환해 dict 리스트를 오래 들고 있지 않음
+        comment_batches: list[CommentBatch] = []
 
         for keyword in keywords[:2]:  # 상위 2개 키워드
             try:
@@ -162,8 +238,8 @@ class YouTubeClient:
 
                     comments = []
                     if include_comments:
-                        comments = self.get_video_comments(v["id"], max_results=30)
-                        all_comments.extend(comments)
+                        comments = self._collect_comments(product["name"], v["id"], incremental)
+                        comment_batches.append(CommentBatch.from_dicts(comments))
 
                     collected_videos.append({
                         "keyword": keyword,
@@ -178,58 +254,73 @@ class YouTubeClient:
             except YouTubeAPIError:
                 continue
 
-        # 페인/게인 포인트 분석
-        pain_points = self._extract_pain_points(all_comments) if include_comments else []
-        gain_points = self._extract_gain_points(all_comments) if include_comments else []
+        all_comments = CommentBatch.concat(comment_batches)
+
+        # 복붙/유사 댓글은 대표 하나로 합쳐 페인/게인 포인트와 프롬프트가 도배되지 않게 함
+        unique_comments = collapse_near_duplicates(all_comments) if dedup_comments else all_comments
+        if dedup_comments:
+            logger.info(f"유사 중복 댓글 병합: {len(all_comments)}개 -> {len(unique_comments)}개")
+
+        # 페인/게인 포인트 분석 (샘플 댓글과 키워드 빈도 요약을 한 번의 스캔으로 계산)
+        pain_points: list[dict] = []
+        gain_points: list[dict] = []
+        keyword_stats: dict = {}
+        if include_comments:
+            pain = analyze_pain_points(unique_comments)
+            gain = analyze_gain_points(unique_comments)
+            pain_points = pain["points"]
+            gain_points = gain["points"]
+            keyword_stats = {"pain": pain["summary"], "gain": gain["summary"]}
 
         return {
             "product": product,
             "videos": collected_videos,
             "comments_total": len(all_comments),
+            "unique_comments": len(unique_comments),
             "pain_points": pain_points,
             "gain_points": gain_points,
-            "top_comments": all_comments[:20] if all_comments else [],
+            "keyword_stats": keyword_stats,
+            "top_comments": unique_comments.to_dicts(unique_comments.top_indices(20)),
+            "comment_stats": unique_comments.stats(),
         }
 
-    def _extract_pain_points(self, comments: list[dict]) -> list[dict]:
-        """댓글에서 페인포인트 추출"""
-        pain_keywords = [
-            "안됨", "안돼", "효과없", "효과 없", "별로", "실망", "냄새", "불편",
-            "어려", "비싸", "오래", "느리", "힘들", "짜증", "못", "안 ", "없어",
-            "부족", "문제", "고장", "AS", "환불", "반품",
-        ]
-
-        pain_comments = []
-        for comment in comments:
-            text = comment["text"]
-            for keyword in pain_keywords:
-                if keyword in text:
-                    pain_comments.append({
-                        "text": text[:200],
-                        "keyword": keyword,
-                        "likes": comment["likes"],
-                    })
-                    break
+    def _collect_comments(self, product_name: str, video_id: str, incremental: bool) -> list[dict]:
+        """비디오 댓글 수집 (코퍼스 저장소가 있으면 워터마크 이후 댓글만 조회해 누적분과 병합)"""
+        if not (incremental and self._comment_store):
+            return self.get_video_comments(video_id, max_results=30)
 
-        return pain_comments[:10]
+        try:
+            watermark = self._comment_store.get_watermark(product_name, video_id)
+            if watermark is None:
+                # 처음 보는 비디오는 기존과 같이 관련도 상위 댓글로 코퍼스를 시작
+                try:
+                    new_comments = self._fetch_top_comments(video_id, max_results=30)
+                except Exception as e:
+                    # 조회 실패를 '댓글 없음'으로 저장하면 다음 실행에서 시드 수집을 건너뛰게 됨
+                    logger.warning(f"댓글 시드 수집 실패, 코퍼스 갱신 생략 ({video_id}): {e}")
+                    return []
+                complete = True
+            else:
+                new_comments, complete = self.get_comments_since(
+                    video_id, watermark.published_after, watermark.seen
+                )
+            self._comment_store.merge(
+                product_name, video_id, new_comments, advance_watermark=complete
+            )
+            return self._comment_store.load_comments(product_name, video_id)
 
-    def _extract_gain_points(self, comments: list[dict]) -> list[dict]:
-        """댓글에서 게인포인트 추출"""
-        gain_keywords = [
-            "좋아", "최고", "효과", "추천", "만족", "대박", "잘", "빠르",
-            "확실", "깨끗", "사라", "없어졌", "해결", "굿", "완전", "감사", "찐",
-        ]
+        except StorageError as e:
+            logger.warning(f"댓글 코퍼스 사용 불가, 전체 수집으로 대체: {e}")
+            return self.get_video_comments(video_id, max_results=30)
 
-        gain_comments = []
-        for comment in comments:
-            text = comment["text"]
-            for keyword in gain_keywords:
-                if keyword in text:
-                    gain_comments.append({
-                        "text": text[:200],
-                        "keyword": keyword,
-                        "likes": comment["likes"],
-                    })
-                    break
-
-        return gain_comments[:10]
+    @staticmethod
+    def _parse_comment(item: dict) -> dict:
+        """commentThreads 응답 항목을 댓글 dict로 변환"""
+        comment = item["snippet"]["topLevelComment"]["snippet"]
+        return {
+            "comment_id": item.get("id", ""),
+            "text": comment["textDisplay"],
+            "likes": comment.get("likeCount", 0),
+            "author": comment.get("authorDisplayName", ""),
+            "published_at": comment.get("publishedAt", ""),
+        }
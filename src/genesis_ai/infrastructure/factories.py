@@ -6,11 +6,20 @@
 from functools import lru_cache
 
 from ..config.settings import get_settings
+from .cache.response_cache import ResponseCache
 from .clients.gemini_client import GeminiClient
+from .clients.genai_provider import GenaiClientProvider
 from .clients.naver_client import NaverClient
 from .clients.veo_client import VeoClient
 from .clients.youtube_client import YouTubeClient
+from .media import ThumbnailProcessor
+from .resilience import ConcurrencyLimiterRegistry, HedgeBudget, RequestHedger, RetryBudget
+from .storage.comment_store import CommentCorpusStore
 from .storage.gcs_storage import GCSStorage
+from .storage.price_store import PriceSnapshotStore
+from .storage.thumbnail_store import ThumbnailStore
+from .storage.usage_store import UsageReportStore
+from .telemetry import UsageLedger
 
 
 # ============================================================
@@ -18,11 +27,56 @@ from .storage.gcs_storage import GCSStorage
 # ============================================================
 
 
+@lru_cache()
+def get_retry_budget() -> RetryBudget:
+    """모든 외부 호출이 공유하는 재시도 예산 (파이프라인 실행마다 초기화)"""
+    return RetryBudget()
+
+
+@lru_cache()
+def get_concurrency_limiters() -> ConcurrencyLimiterRegistry:
+    """모델별 적응형 동시 호출 제한기 (GeminiClient/VeoClient 공유)"""
+    return ConcurrencyLimiterRegistry(max_limit=get_settings().models.max_concurrency)
+
+
+@lru_cache()
+def get_genai_provider() -> GenaiClientProvider:
+    """GeminiClient/VeoClient가 공유하는 genai 클라이언트 제공자 (연결 풀/인증 정보 공유)"""
+    return GenaiClientProvider()
+
+
+@lru_cache()
+def get_usage_ledger() -> UsageLedger:
+    """모든 모델 호출이 공유하는 사용량 원장 (파이프라인 실행마다 초기화)"""
+    return UsageLedger()
+
+
+@lru_cache()
+def get_usage_report_store() -> UsageReportStore:
+    """실행별 사용량 보고서 저장소 팩토리"""
+    return UsageReportStore(get_settings().app.cache_dir)
+
+
+@lru_cache()
+def get_thumbnail_processor() -> ThumbnailProcessor:
+    """썸네일 후처리기 팩토리 (트랜스코딩/리사이즈 프로세스 풀)"""
+    settings = get_settings()
+    return ThumbnailProcessor(
+        output_format=settings.models.thumbnail_format,
+        quality=settings.models.thumbnail_quality,
+        workers=settings.models.thumbnail_process_workers,
+    )
+
+
 @lru_cache()
 def get_youtube_client() -> YouTubeClient:
     """YouTube 클라이언트 팩토리"""
     settings = get_settings()
-    return YouTubeClient(api_key=settings.google_api_key)
+    return YouTubeClient(
+        api_key=settings.google_api_key,
+        comment_store=CommentCorpusStore(settings.app.cache_dir),
+        retry_budget=get_retry_budget(),
+    )
 
 
 @lru_cache()
@@ -32,6 +86,12 @@ def get_naver_client() -> NaverClient:
     return NaverClient(
         client_id=settings.naver.client_id.get_secret_value(),
         client_secret=settings.naver.client_secret.get_secret_value(),
+        pool_size=settings.naver.pool_size,
+        rate_limit_qps=settings.naver.rate_limit_qps,
+        daily_call_limit=settings.naver.daily_call_limit,
+        cache_ttl=settings.naver.cache_ttl,
+        cache_stale_ttl=settings.naver.cache_stale_ttl,
+        retry_budget=get_retry_budget(),
     )
 
 
@@ -44,6 +104,21 @@ def get_gemini_client() -> GeminiClient:
         location=settings.gcp.location,
         text_model=settings.models.gemini_text_model,
         image_model=settings.models.gemini_image_model,
+        fast_model=settings.models.gemini_fast_model or None,
+        prompt_token_budget=settings.models.prompt_token_budget,
+        thumbnail_concurrency=settings.models.thumbnail_concurrency,
+        retry_budget=get_retry_budget(),
+        usage_ledger=get_usage_ledger(),
+        concurrency_limiters=get_concurrency_limiters(),
+        genai_provider=get_genai_provider(),
+        hedger=(
+            RequestHedger(budget=HedgeBudget(settings.models.gemini_hedge_budget_ratio))
+            if settings.models.gemini_hedging_enabled
+            else None
+        ),
+        response_cache=(
+            ResponseCache(settings.app.cache_dir) if settings.models.gemini_cache_enabled else None
+        ),
     )
 
 
@@ -56,6 +131,10 @@ def get_veo_client() -> VeoClient:
         location=settings.gcp.location,
         gcs_bucket_name=settings.gcp.gcs_bucket_name,
         model_id=settings.models.veo_model_id,
+        retry_budget=get_retry_budget(),
+        usage_ledger=get_usage_ledger(),
+        concurrency_limiters=get_concurrency_limiters(),
+        genai_provider=get_genai_provider(),
     )
 
 
@@ -66,6 +145,7 @@ def get_storage_service() -> GCSStorage:
     return GCSStorage(
         bucket_name=settings.gcp.gcs_bucket_name,
         project_id=settings.gcp.project_id,
+        retry_budget=get_retry_budget(),
     )
 
 
@@ -87,7 +167,10 @@ def get_naver_service():
     """네이버 서비스 팩토리"""
     from ..services.naver_service import NaverService
 
-    return NaverService(client=get_naver_client())
+    return NaverService(
+        client=get_naver_client(),
+        price_store=PriceSnapshotStore(get_settings().app.cache_dir),
+    )
 
 
 @lru_cache()
@@ -103,7 +186,11 @@ def get_thumbnail_service():
     """썸네일 서비스 팩토리"""
     from ..services.thumbnail_service import ThumbnailService
 
-    return ThumbnailService(client=get_gemini_client())
+    return ThumbnailService(
+        client=get_gemini_client(),
+        processor=get_thumbnail_processor(),
+        store=ThumbnailStore(get_settings().app.cache_dir),
+    )
 
 
 @lru_cache()
@@ -126,12 +213,22 @@ def get_pipeline_service():
         thumbnail_service=get_thumbnail_service(),
         video_service=get_video_service(),
         storage_service=get_storage_service(),
+        retry_budget=get_retry_budget(),
+        usage_ledger=get_usage_ledger(),
+        usage_store=get_usage_report_store(),
+        concurrency_limiters=get_concurrency_limiters(),
     )
 
 
 def clear_all_caches() -> None:
     """모든 팩토리 캐시 초기화 (테스트용)"""
     # 클라이언트
+    get_retry_budget.cache_clear()
+    get_usage_ledger.cache_clear()
+    get_concurrency_limiters.cache_clear()
+    get_genai_provider.cache_clear()
+    get_usage_report_store.cache_clear()
+    get_thumbnail_processor.cache_clear()
     get_youtube_client.cache_clear()
     get_naver_client.cache_clear()
     get_gemini_client.cache_clear()
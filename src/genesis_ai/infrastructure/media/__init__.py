@@ -0,0 +1,10 @@
+"""
+미디어 후처리 모듈 (썸네일 트랜스코딩/리사이즈 변형)
+"""
+from .thumbnail_processor import ThumbnailProcessor, passthrough_variants, transcode_variants
+
+__all__ = [
+    "ThumbnailProcessor",
+    "passthrough_variants",
+    "transcode_variants",
+]
@@ -0,0 +1,182 @@
+"""
+썸네일 후처리
+모델이 돌려준 원본 이미지(대개 수 MB PNG)를 WebP/JPEG로 트랜스코딩하고 용도별 크기 변형(preview/hd/original)을 만듦
+CPU 작업이므로 프로세스 풀에서 실행해 I/O 스레드를 막지 않음 (Pillow가 없으면 원본을 그대로 전달)
+"""
+import importlib.util
+import io
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from ...config.constants import (
+    THUMBNAIL_FORMATS,
+    THUMBNAIL_MAX_BYTES,
+    THUMBNAIL_MIN_QUALITY,
+    THUMBNAIL_QUALITY_STEP,
+    THUMBNAIL_VARIANT_SIZES,
+)
+from ...core.exceptions import InvalidConfigError, ThumbnailGenerationError
+from ...core.models import ImageVariant
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MIME_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+def sniff_mime_type(data: bytes) -> str:
+    """매직 바이트로 이미지 MIME 타입 추정"""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def passthrough_variants(data: bytes) -> dict[str, ImageVariant]:
+    """후처리 없이 원본만 담은 변형 (Pillow가 없거나 후처리에 실패한 경우)"""
+    return {"original": ImageVariant(name="original", data=data, mime_type=sniff_mime_type(data))}
+
+
+def _encode_within(image, output_format: str, quality: int, max_bytes: int) -> tuple[bytes, int]:
+    """용량 예산 안에 들 때까지 품질을 낮춰 인코딩 → (바이트, 사용한 품질)
+
+    최저 품질로도 예산을 넘으면 가장 작은 결과를 돌려줍니다.
+    """
+    q = quality
+    while True:
+        buffer = io.BytesIO()
+        if output_format == "jpeg":
+            image.save(buffer, "JPEG", quality=q, optimize=True, progressive=True)
+        else:
+            image.save(buffer, "WEBP", quality=q, method=4)
+        encoded = buffer.getvalue()
+        if len(encoded) <= max_bytes or q <= THUMBNAIL_MIN_QUALITY:
+            return encoded, q
+        q = max(THUMBNAIL_MIN_QUALITY, q - THUMBNAIL_QUALITY_STEP)
+
+
+def transcode_variants(data: bytes, output_format: str, quality: int) -> dict[str, ImageVariant]:
+    """원본 이미지 → 용도별 변형 (프로세스 풀 워커에서 실행되는 순수 함수)
+
+    크기 변형은 비율을 유지한 채 상자 안에 맞추며 원본보다 키우지 않습니다.
+
+    Raises:
+        ThumbnailGenerationError: 이미지를 읽을 수 없는 경우
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            source.load()
+            image = source.copy()
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise ThumbnailGenerationError(f"썸네일 이미지 디코딩 실패: {e}")
+
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    if output_format == "jpeg" and has_alpha:
+        # JPEG은 투명도를 지원하지 않으므로 흰 배경에 합성
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, (255, 255, 255))
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if has_alpha and output_format == "webp" else "RGB")
+
+    variants: dict[str, ImageVariant] = {}
+    for name, size in THUMBNAIL_VARIANT_SIZES.items():
+        resized = image
+        if size is not None:
+            resized = image.copy()
+            resized.thumbnail(size, Image.Resampling.LANCZOS)
+        encoded, used_quality = _encode_within(resized, output_format, quality, THUMBNAIL_MAX_BYTES[name])
+        if len(encoded) > THUMBNAIL_MAX_BYTES[name]:
+            logger.warning(
+                f"썸네일 {name} 변형이 용량 예산 초과: {len(encoded):,} > {THUMBNAIL_MAX_BYTES[name]:,} bytes"
+                f" (품질 {used_quality})"
+            )
+        variants[name] = ImageVariant(
+            name=name,
+            data=encoded,
+            mime_type=_MIME_TYPES[output_format],
+            width=resized.width,
+            height=resized.height,
+        )
+    return variants
+
+
+class ThumbnailProcessor:
+    """썸네일 후처리기 (스레드 안전)
+
+    workers > 0이면 spawn 방식 프로세스 풀(첫 사용 시 생성)에서, 0이면 호출한 스레드에서
+    처리합니다. 여러 스레드가 동작 중인 프로세스를 fork하면 잠금 상태가 복제되어 교착될 수
+    있으므로 spawn을 씁니다. 후처리에 실패하면 경고를 남기고 원본만 담은 변형을 돌려줘
+    비싸게 생성한 이미지를 잃지 않습니다.
+    """
+
+    def __init__(self, output_format: str = "webp", quality: int = 80, workers: int = 2) -> None:
+        if output_format not in THUMBNAIL_FORMATS:
+            raise InvalidConfigError(
+                f"지원하지 않는 썸네일 포맷: {output_format}", {"allowed": list(THUMBNAIL_FORMATS)}
+            )
+        self._format = output_format
+        self._quality = min(max(quality, THUMBNAIL_MIN_QUALITY), 100)
+        self._workers = workers
+        self._available = importlib.util.find_spec("PIL") is not None
+        if not self._available:
+            logger.warning("Pillow가 설치되지 않아 썸네일 후처리 없이 원본을 사용합니다 (pip install .[image])")
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def available(self) -> bool:
+        """후처리 가능 여부 (Pillow 설치 여부)"""
+        return self._available
+
+    def _submit(self, data: bytes) -> Future:
+        """변형 생성 작업 제출 (프로세스 풀이 없으면 바로 실행한 Future)"""
+        if self._workers <= 0:
+            future: Future = Future()
+            try:
+                future.set_result(transcode_variants(data, self._format, self._quality))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            pool = self._pool
+        return pool.submit(transcode_variants, data, self._format, self._quality)
+
+    def _result(self, data: bytes, future: Future) -> dict[str, ImageVariant]:
+        """작업 결과 (실패하면 원본만 담은 변형)"""
+        try:
+            variants = future.result()
+        except Exception as e:
+            logger.warning(f"썸네일 후처리 실패, 원본 사용: {e}")
+            return passthrough_variants(data)
+        sizes = ", ".join(f"{name} {len(variant.data):,}" for name, variant in variants.items())
+        logger.info(f"썸네일 후처리 완료: 원본 {len(data):,} → {sizes} bytes")
+        return variants
+
+    def process(self, data: bytes) -> dict[str, ImageVariant]:
+        """이미지 1개 → 용도별 변형"""
+        return self.process_many([data])[0]
+
+    def process_many(self, images: list[bytes]) -> list[dict[str, ImageVariant]]:
+        """여러 이미지를 동시에 후처리 (입력 순서 유지)"""
+        if not self._available:
+            return [passthrough_variants(data) for data in images]
+        futures = [self._submit(data) for data in images]
+        return [self._result(data, future) for data, future in zip(images, futures)]
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,24 @@
+"""
+외부 API 호출 안정화 모듈 (호출 한도 제어, 재시도 백오프, 공통 재시도 정책, 적응형 동시 호출 제한, 요청 헤징)
+"""
+from .backoff import full_jitter_delay, parse_retry_after
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimiterRegistry
+from .hedging import HedgeBudget, LatencyTracker, RequestHedger
+from .rate_limiter import TokenBucketRateLimiter
+from .retry import RetryBudget, RetryPolicy, is_retryable, is_throttled, retry_after_of
+
+__all__ = [
+    "TokenBucketRateLimiter",
+    "full_jitter_delay",
+    "parse_retry_after",
+    "RetryPolicy",
+    "RetryBudget",
+    "is_retryable",
+    "retry_after_of",
+    "is_throttled",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimiterRegistry",
+    "RequestHedger",
+    "HedgeBudget",
+    "LatencyTracker",
+]
@@ -0,0 +1,32 @@
+"""
+재시도 백오프 계산
+"""
+import random
+from typing import Mapping
+
+
+def full_jitter_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    rng: random.Random | None = None,
+) -> float:
+    """지수 백오프 + full jitter 대기 시간 (0 ~ min(max_delay, base * 2^attempt))
+
+    여러 스레드가 동시에 실패해도 같은 시각에 재시도가 몰리지 않도록 구간 전체에서 무작위 선택합니다.
+    """
+    ceiling = min(max_delay, base_delay * (2 ** attempt))
+    return (rng or random).uniform(0, ceiling)
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Retry-After 헤더(초 단위)를 읽어 대기 시간 반환 (없거나 해석 불가면 None)"""
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,154 @@
+"""
+적응형 동시 호출 제한 (AIMD)
+모델 엔드포인트별로 동시에 진행 중인 호출 수 한도를 성공 시 가산 증가, 호출량 제한(429) 시 승산 감소
+"""
+import math
+import threading
+from typing import Any, Callable, TypeVar
+
+from ...config.constants import (
+    CONCURRENCY_ACQUIRE_TIMEOUT,
+    CONCURRENCY_DECREASE_FACTOR,
+    CONCURRENCY_INITIAL_LIMIT,
+    CONCURRENCY_MAX_LIMIT,
+    CONCURRENCY_MIN_LIMIT,
+)
+from ...core.exceptions import RateLimitExceededError
+from ...utils.logger import get_logger
+from .retry import is_throttled
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시 호출 제한기 (스레드 안전)
+
+    성공할 때마다 한도를 1/한도씩 올려 한도만큼 성공하면 1이 늘고, 429/RESOURCE_EXHAUSTED를
+    받으면 한도에 decrease_factor를 곱합니다. 같은 혼잡 구간에서 이미 진행 중이던 호출들이
+    연달아 실패해도 한 번만 줄이도록, 마지막 감소 이후에 시작한 호출의 실패만 감소에 반영합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float = CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = CONCURRENCY_MIN_LIMIT,
+        max_limit: int = CONCURRENCY_MAX_LIMIT,
+        decrease_factor: float = CONCURRENCY_DECREASE_FACTOR,
+        acquire_timeout: float | None = CONCURRENCY_ACQUIRE_TIMEOUT,
+        classifier: Callable[[BaseException], bool] = is_throttled,
+    ) -> None:
+        self.name = name
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._decrease_factor = decrease_factor
+        self._acquire_timeout = acquire_timeout
+        self._classifier = classifier
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self._epoch = 0  # 한도를 줄일 때마다 증가
+        self._successes = 0
+        self._throttles = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 호출 한도"""
+        with self._condition:
+            return math.floor(self._limit)
+
+    @property
+    def stats(self) -> dict:
+        """현재 한도/진행 중/대기 중 호출 수와 누적 성공/제한/감소 횟수"""
+        with self._condition:
+            return {
+                "limit": math.floor(self._limit),
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "successes": self._successes,
+                "throttles": self._throttles,
+                "decreases": self._decreases,
+            }
+
+    def acquire(self) -> int:
+        """호출 자리 확보 (한도가 찰 때까지 대기) → release()에 넘길 토큰
+
+        Raises:
+            RateLimitExceededError: acquire_timeout 안에 자리가 나지 않은 경우
+        """
+        with self._condition:
+            self._queued += 1
+            try:
+                acquired = self._condition.wait_for(
+                    lambda: self._in_flight < math.floor(self._limit), timeout=self._acquire_timeout
+                )
+            finally:
+                self._queued -= 1
+            if not acquired:
+                raise RateLimitExceededError(
+                    f"{self.name} 동시 호출 대기 시간 초과",
+                    {"limit": math.floor(self._limit), "in_flight": self._in_flight, "retryable": False},
+                )
+            self._in_flight += 1
+            return self._epoch
+
+    def release(self, token: int, error: BaseException | None = None) -> None:
+        """호출 자리 반환, 결과에 따라 한도 조정 (호출량 제한이 아닌 오류는 한도를 바꾸지 않음)"""
+        throttled = error is not None and self._classifier(error)
+        with self._condition:
+            self._in_flight -= 1
+            if error is None:
+                self._successes += 1
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            elif throttled:
+                self._throttles += 1
+                if token == self._epoch:
+                    self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+                    self._epoch += 1
+                    self._decreases += 1
+                    logger.warning(
+                        f"{self.name} 호출량 제한 감지, 동시 호출 한도 {math.floor(self._limit)}로 감소"
+                    )
+            self._condition.notify_all()
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """자리를 확보한 뒤 func 호출"""
+        token = self.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self.release(token, e)
+            raise
+        self.release(token)
+        return result
+
+
+class ConcurrencyLimiterRegistry:
+    """모델 ID별 동시 호출 제한기 모음 (GeminiClient/VeoClient가 공유)"""
+
+    def __init__(self, max_limit: int = CONCURRENCY_MAX_LIMIT, **limiter_options: Any) -> None:
+        self._max_limit = max_limit
+        self._options = limiter_options
+        self._lock = threading.Lock()
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def get(self, model: str) -> AdaptiveConcurrencyLimiter:
+        """모델 ID의 제한기 (없으면 생성)"""
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                limiter = self._limiters[model] = AdaptiveConcurrencyLimiter(
+                    model, max_limit=self._max_limit, **self._options
+                )
+            return limiter
+
+    def stats(self) -> dict[str, dict]:
+        """모델 ID별 한도/진행 중/대기 중 호출 수"""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {model: limiter.stats for model, limiter in limiters.items()}
@@ -0,0 +1,187 @@
+"""
+요청 헤징 (꼬리 지연 단축)
+첫 요청이 관측된 p90 지연을 넘기면 같은 요청을 한 번 더 보내고 먼저 끝난 응답을 사용
+"""
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, TypeVar
+
+from ...config.constants import (
+    HEDGE_BUDGET_RATIO,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MAX_WORKERS,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_QUANTILE,
+)
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """키(모델/호출 이름)별 최근 성공 지연 시간 분위수 (스레드 안전)"""
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """성공한 호출의 지연 시간 추가"""
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self._window)).append(seconds)
+
+    def count(self, key: str) -> int:
+        """보유 표본 수"""
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def quantile(self, key: str, q: float) -> float | None:
+        """q 분위 지연 시간 (표본이 없으면 None, 최근접 순위 방식)"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))]
+
+
+class HedgeBudget:
+    """헤지 요청 예산 (스레드 안전): 헤지 수를 전체 요청 수의 ratio 이하로 제한"""
+
+    def __init__(self, ratio: float = HEDGE_BUDGET_RATIO) -> None:
+        self._ratio = ratio
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedges = 0
+        self._denied = 0
+
+    def record_request(self) -> None:
+        """첫 요청 기록"""
+        with self._lock:
+            self._requests += 1
+
+    def try_acquire(self) -> bool:
+        """헤지 1회 사용 (예산이 없으면 False)"""
+        with self._lock:
+            if self._hedges + 1 <= self._ratio * self._requests:
+                self._hedges += 1
+                return True
+            self._denied += 1
+            return False
+
+    @property
+    def stats(self) -> dict:
+        """요청/헤지/거절 수"""
+        with self._lock:
+            return {"requests": self._requests, "hedges": self._hedges, "denied": self._denied}
+
+
+class RequestHedger:
+    """멱등 호출 헤징
+
+    같은 키의 성공 지연 표본이 min_samples개 이상 쌓이면, 첫 요청이 quantile 분위 지연
+    (최소 min_delay초)을 넘길 때 예산 안에서 같은 요청을 한 번 더 보냅니다. 먼저 성공한
+    응답을 돌려주고, 나머지 요청은 시작 전이면 취소하고 이미 진행 중이면 결과를 버립니다
+    (동기 SDK 호출은 중간에 끊을 수 없음). 버려진 요청이 성공하면 on_discarded로 알려
+    사용량 기록에 반영할 수 있습니다. 두 요청이 모두 실패하면 첫 요청의 오류를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        quantile: float = HEDGE_QUANTILE,
+        budget: HedgeBudget | None = None,
+        tracker: LatencyTracker | None = None,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY,
+        max_workers: int = HEDGE_MAX_WORKERS,
+    ) -> None:
+        self._quantile = quantile
+        self._budget = budget or HedgeBudget()
+        self._tracker = tracker or LatencyTracker()
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    @property
+    def budget(self) -> HedgeBudget:
+        """헤지 예산"""
+        return self._budget
+
+    @property
+    def tracker(self) -> LatencyTracker:
+        """지연 시간 표본"""
+        return self._tracker
+
+    def hedge_delay(self, key: str) -> float | None:
+        """헤지 요청을 보낼 대기 시간 (표본이 부족하면 None = 헤징 안 함)"""
+        if self._tracker.count(key) < self._min_samples:
+            return None
+        return max(self._min_delay, self._tracker.quantile(key, self._quantile) or 0.0)
+
+    def _submit(self, key: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> Future:
+        """요청 실행, 성공하면 자기 지연 시간을 표본에 추가"""
+        def _run() -> T:
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            self._tracker.record(key, time.perf_counter() - started)
+            return result
+
+        return self._executor.submit(_run)
+
+    def call(
+        self,
+        key: str,
+        func: Callable[..., T],
+        *args: Any,
+        on_discarded: Callable[[T], None] | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """func 호출 (필요하면 헤지 요청을 추가로 보내고 먼저 성공한 결과 반환)"""
+        self._budget.record_request()
+        delay = self.hedge_delay(key)
+        if delay is None:
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            self._tracker.record(key, time.perf_counter() - started)
+            return result
+
+        primary = self._submit(key, func, *args, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._budget.try_acquire():
+            return primary.result()
+
+        logger.info(f"{key}: {delay:.1f}초 안에 응답이 없어 헤지 요청 전송")
+        hedge = self._submit(key, func, *args, **kwargs)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is None:
+                continue
+            for loser in {primary, hedge} - {winner}:
+                self._discard(loser, on_discarded)
+            if winner is hedge:
+                logger.info(f"{key}: 헤지 요청이 먼저 응답")
+            return winner.result()
+        return primary.result()
+
+    @staticmethod
+    def _discard(future: Future, on_discarded: Callable[[Any], None] | None) -> None:
+        """진 요청 정리 (시작 전이면 취소, 진행 중이면 끝난 뒤 성공 결과만 on_discarded로 전달)"""
+        if future.cancel() or on_discarded is None:
+            return
+
+        def _notify(finished: Future) -> None:
+            if not finished.cancelled() and finished.exception() is None:
+                try:
+                    on_discarded(finished.result())
+                except Exception as e:
+                    logger.warning(f"헤지 결과 정리 실패: {e}")
+
+        future.add_done_callback(_notify)
@@ -0,0 +1,118 @@
+"""
+토큰 버킷 호출 한도 제어기
+초당 호출 수(QPS)와 일일 호출 한도를 함께 관리
+"""
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable
+
+from ...core.exceptions import RateLimitExceededError
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 네이버 Open API 일일 한도는 한국 시간 자정에 초기화
+KST = timezone(timedelta(hours=9))
+
+_TOKEN_EPSILON = 1e-9  # 토큰 비교 허용 오차
+_MIN_WAIT = 1e-3       # 최소 대기(초) - 시계가 움직이지 않는 극소 대기 방지
+
+
+def _kst_today() -> date:
+    """한국 시간 기준 오늘 날짜"""
+    return datetime.now(KST).date()
+
+
+class TokenBucketRateLimiter:
+    """스레드 안전 토큰 버킷
+
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓입니다. acquire()는 토큰이 생길 때까지
+    대기하므로 여러 스레드가 한 인스턴스를 공유하면 전체 호출량이 rate 이하로 유지됩니다.
+    일일 한도를 넘기면 대기하지 않고 RateLimitExceededError를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        daily_limit: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        today: Callable[[], date] = _kst_today,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self._rate = rate
+        self._burst = float(burst if burst is not None else max(1, int(rate)))
+        self._daily_limit = daily_limit
+        self._clock = clock
+        self._sleep = sleep
+        self._today = today
+
+        self._lock = threading.Lock()
+        self._tokens = self._burst
+        self._updated_at = clock()
+        self._day = today()
+        self._daily_count = 0
+
+    @property
+    def daily_count(self) -> int:
+        """오늘 사용한 호출 수"""
+        with self._lock:
+            self._roll_day()
+            return self._daily_count
+
+    @property
+    def daily_remaining(self) -> int | None:
+        """오늘 남은 호출 수 (한도 없음: None)"""
+        if self._daily_limit is None:
+            return None
+        return max(0, self._daily_limit - self.daily_count)
+
+    def acquire(self) -> None:
+        """토큰 1개 획득 (필요하면 대기)"""
+        while True:
+            with self._lock:
+                self._roll_day()
+                if self._daily_limit is not None and self._daily_count >= self._daily_limit:
+                    raise RateLimitExceededError(
+                        "일일 API 호출 한도를 모두 사용했습니다.",
+                        {"daily_limit": self._daily_limit, "day": self._day.isoformat()},
+                    )
+                self._refill()
+                # 부동소수점 누적 오차로 0.9999...에 머무르지 않도록 허용 오차 적용
+                if self._tokens >= 1 - _TOKEN_EPSILON:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    self._daily_count += 1
+                    return
+                wait = max((1 - self._tokens) / self._rate, _MIN_WAIT)
+            # 잠금 밖에서 대기해야 다른 스레드가 상태를 확인할 수 있음
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 속도 제한(429)을 알렸을 때 모든 호출자를 seconds 동안 멈춤
+
+        토큰을 음수로 만들어 공유 중인 다른 스레드도 같은 시간만큼 기다리게 합니다.
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self._rate)
+        logger.warning(f"API 속도 제한 감지: {seconds:.2f}초 동안 호출을 늦춥니다.")
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충 (잠금 안에서 호출)"""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+
+    def _roll_day(self) -> None:
+        """날짜가 바뀌면 일일 호출 수 초기화 (잠금 안에서 호출)"""
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._daily_count = 0
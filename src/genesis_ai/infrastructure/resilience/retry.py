@@ -0,0 +1,234 @@
+"""
+공통 재시도 엔진
+외부 호출 오류를 재시도 가능/불가로 분류하고, Retry-After와 decorrelated jitter 백오프로 재시도하며
+실행 단위 재시도 예산으로 장애 시 재시도가 부하를 키우지 않도록 제한
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Mapping, TypeVar
+
+from ...config.constants import (
+    RETRY_BASE_DELAY,
+    RETRY_BUDGET_MIN,
+    RETRY_BUDGET_RATIO,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRYABLE_STATUS_CODES,
+)
+from ...core.exceptions import (
+    ConfigurationError,
+    GenesisAIError,
+    RateLimitExceededError,
+    ValidationError,
+)
+from ...utils.logger import get_logger
+from .backoff import parse_retry_after
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 이름만으로 일시적 네트워크 오류로 보는 예외 (requests, urllib3, google-api-core 등)
+_TRANSIENT_ERROR_NAMES = frozenset({
+    "ConnectionError",
+    "Timeout",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "TimeoutError",
+    "ConnectionResetError",
+    "RemoteDisconnected",
+    "ProtocolError",
+    "ServiceUnavailable",
+    "TooManyRequests",
+    "InternalServerError",
+    "GatewayTimeout",
+    "BadGateway",
+    "DeadlineExceeded",
+})
+
+
+def _status_code(error: BaseException) -> int | None:
+    """오류에서 HTTP 상태 코드 추출 (GenesisAIError details, requests/genai/googleapiclient/api-core)"""
+    if isinstance(error, GenesisAIError):
+        status = error.details.get("status_code")
+        return int(status) if status is not None else None
+    for attr in ("status_code", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    # googleapiclient HttpError.resp.status, requests HTTPError.response.status_code
+    resp = getattr(error, "resp", None)
+    if resp is not None and isinstance(getattr(resp, "status", None), int):
+        return resp.status
+    response = getattr(error, "response", None)
+    if response is not None and isinstance(getattr(response, "status_code", None), int):
+        return response.status_code
+    return None
+
+
+def retry_after_of(error: BaseException) -> float | None:
+    """오류에 담긴 Retry-After(초) (없으면 None)"""
+    if isinstance(error, GenesisAIError) and error.details.get("retry_after") is not None:
+        return float(error.details["retry_after"])
+    for source in (getattr(error, "response", None), getattr(error, "resp", None)):
+        headers = getattr(source, "headers", None) or (source if isinstance(source, Mapping) else None)
+        if headers:
+            delay = parse_retry_after(
+                {"Retry-After": headers.get("Retry-After") or headers.get("retry-after")}
+            )
+            if delay is not None:
+                return delay
+    cause = error.__cause__ or error.__context__
+    return retry_after_of(cause) if cause is not None else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도 가능 오류 판별
+
+    - 설정/검증 오류, 일일 호출 한도 소진은 다시 해도 같으므로 재시도하지 않음
+    - details["retryable"]이 지정되어 있으면 그대로 따름
+    - HTTP 408/429/5xx, 연결 오류/타임아웃은 재시도
+    - GenesisAIError로 감싼 오류는 원인(__cause__/__context__)까지 확인
+    """
+    if isinstance(error, (ConfigurationError, ValidationError, RateLimitExceededError)):
+        return False
+    if isinstance(error, GenesisAIError) and "retryable" in error.details:
+        return bool(error.details["retryable"])
+
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    if type(error).__name__ in _TRANSIENT_ERROR_NAMES or isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    cause = error.__cause__ or error.__context__
+    return is_retryable(cause) if cause is not None else False
+
+
+def is_throttled(error: BaseException) -> bool:
+    """호출량 제한(HTTP 429, RESOURCE_EXHAUSTED) 오류 여부 (원인 오류까지 확인)"""
+    if isinstance(error, RateLimitExceededError):
+        return False
+    if _status_code(error) == 429 or "RESOURCE_EXHAUSTED" in str(error):
+        return True
+    cause = error.__cause__ or error.__context__
+    return is_throttled(cause) if cause is not None else False
+
+
+class RetryBudget:
+    """실행 단위 재시도 예산 (스레드 안전)
+
+    재시도는 min_retries + ratio × (첫 시도 수)까지만 허용합니다. 장애로 모든 호출이 실패해도
+    전체 호출량이 첫 시도의 (1 + ratio)배를 크게 넘지 않습니다. start_run()으로 새 실행을 시작합니다.
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_retries: int = RETRY_BUDGET_MIN) -> None:
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._denied = 0
+
+    def start_run(self) -> None:
+        """새 실행 시작 (집계 초기화)"""
+        with self._lock:
+            self._requests = self._retries = self._denied = 0
+
+    def record_request(self) -> None:
+        """첫 시도 기록"""
+        with self._lock:
+            self._requests += 1
+
+    def try_acquire(self) -> bool:
+        """재시도 1회 사용 (예산이 없으면 False)"""
+        with self._lock:
+            if self._retries < self._min_retries + self._ratio * self._requests:
+                self._retries += 1
+                return True
+            self._denied += 1
+            return False
+
+    @property
+    def stats(self) -> dict:
+        """첫 시도/재시도/거절 수"""
+        with self._lock:
+            return {"requests": self._requests, "retries": self._retries, "denied": self._denied}
+
+
+class RetryPolicy:
+    """재시도 정책 (decorrelated jitter 백오프 + Retry-After + 재시도 예산)
+
+    대기 시간은 min(max_delay, uniform(base_delay, 직전 대기 × 3))이고, 서버가 Retry-After를
+    주면 그 값을 max_delay 이내에서 따릅니다.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        budget: RetryBudget | None = None,
+        classifier: Callable[[BaseException], bool] = is_retryable,
+        sleep: Callable[[float], None] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._classifier = classifier
+        # 호출 시점에 time.sleep을 찾아 테스트에서 패치할 수 있도록 함
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+
+    @property
+    def budget(self) -> RetryBudget | None:
+        """공유 재시도 예산 (없으면 None)"""
+        return self._budget
+
+    def next_delay(self, previous: float, error: BaseException | None = None) -> float:
+        """다음 대기 시간"""
+        retry_after = retry_after_of(error) if error is not None else None
+        if retry_after is not None:
+            return min(retry_after, self._max_delay)
+        upper = max(self._base_delay, previous * 3)
+        return min(self._max_delay, self._rng.uniform(self._base_delay, upper))
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        operation: str = "",
+        wait: Callable[[BaseException, float], None] | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """func 호출, 재시도 가능 오류면 백오프 후 다시 시도 (소진/불가 시 마지막 오류를 그대로 발생)
+
+        wait를 주면 sleep 대신 wait(오류, 대기 시간)을 호출합니다 (공유 호출 한도 제어기 일시 정지 등).
+        """
+        name = operation or getattr(func, "__name__", "call")
+        if self._budget is not None:
+            self._budget.record_request()
+
+        delay = self._base_delay
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_attempts or not self._classifier(e):
+                    raise
+                if self._budget is not None and not self._budget.try_acquire():
+                    logger.warning(f"재시도 예산 소진, 재시도 생략: {name} - {e}")
+                    raise
+                delay = self.next_delay(delay, e)
+                logger.warning(
+                    f"{name} 실패({type(e).__name__}), {delay:.2f}초 후 재시도 "
+                    f"({attempt}/{self.max_attempts - 1})"
+                )
+                if wait is not None:
+                    wait(e, delay)
+                else:
+                    (self._sleep or time.sleep)(delay)
+                attempt += 1
@@ -0,0 +1,174 @@
+"""
+댓글 코퍼스 로컬 저장소
+상품별 누적 댓글 + 비디오별 수집 워터마크(최신 publishedAt, 본 댓글 ID 블룸 필터)
+"""
+import base64
+import json
+import math
+import os
+import re
+import threading
+from pathlib import Path
+
+from ...config.constants import COMMENT_BLOOM_CAPACITY, COMMENT_BLOOM_ERROR_RATE
+from ...core.analysis.comment_batch import format_timestamp, parse_timestamp
+from ...core.exceptions import StorageError
+from ...utils.bloom_filter import BloomFilter
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 파일 이름으로 쓸 수 없는 문자 치환용
+_UNSAFE_NAME = re.compile(r"[^\w.-]+")
+
+
+class VideoWatermark:
+    """비디오별 수집 워터마크"""
+
+    def __init__(self, published_after: float, seen: BloomFilter) -> None:
+        # published_after: 지금까지 저장된 댓글 중 가장 최신 작성시각 (epoch 초)
+        self.published_after = published_after
+        self.seen = seen
+
+
+class CommentCorpusStore:
+    """상품별 댓글 코퍼스 저장소
+
+    디렉토리 구조:
+        {base_dir}/comments/{상품}/watermarks.json   - 비디오별 워터마크
+        {base_dir}/comments/{상품}/{video_id}.jsonl  - 비디오별 누적 댓글
+    """
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self._root = Path(base_dir) / "comments"
+        self._lock = threading.Lock()
+
+    def _product_dir(self, product_name: str) -> Path:
+        """상품 디렉토리 경로"""
+        return self._root / _UNSAFE_NAME.sub("_", product_name)
+
+    def _read_watermarks(self, product_name: str) -> dict:
+        """워터마크 파일 읽기 (없으면 빈 dict)"""
+        path = self._product_dir(product_name) / "watermarks.json"
+        if not path.exists():
+            return {}
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_watermarks(self, product_name: str, watermarks: dict) -> None:
+        """워터마크 파일 원자적 쓰기 (임시 파일 작성 후 교체)"""
+        path = self._product_dir(product_name) / "watermarks.json"
+        temp_path = path.with_suffix(".json.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(watermarks, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def get_watermark(self, product_name: str, video_id: str) -> VideoWatermark | None:
+        """비디오 워터마크 조회 (한 번도 수집하지 않았으면 None)"""
+        with self._lock:
+            entry = self._read_watermarks(product_name).get(video_id)
+        if entry is None:
+            return None
+        published_after = parse_timestamp(entry.get("latest_published_at"))
+        return VideoWatermark(
+            published_after=float("-inf") if math.isnan(published_after) else published_after,
+            seen=BloomFilter.from_bytes(base64.b64decode(entry["seen"])),
+        )
+
+    def load_comments(self, product_name: str, video_id: str) -> list[dict]:
+        """비디오의 누적 댓글 전체"""
+        path = self._product_dir(product_name) / f"{_UNSAFE_NAME.sub('_', video_id)}.jsonl"
+        if not path.exists():
+            return []
+        with path.open(encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def load_corpus(self, product_name: str) -> list[dict]:
+        """상품의 전체 누적 댓글 (비디오 구분 없이)"""
+        product_dir = self._product_dir(product_name)
+        if not product_dir.exists():
+            return []
+        comments: list[dict] = []
+        for path in sorted(product_dir.glob("*.jsonl")):
+            comments.extend(self.load_comments(product_name, path.stem))
+        return comments
+
+    def _load_comment_ids(self, product_name: str, video_id: str) -> set[str]:
+        """비디오의 저장된 댓글 ID 전체 (정확한 중복 판정용)"""
+        return {
+            comment["comment_id"]
+            for comment in self.load_comments(product_name, video_id)
+            if comment.get("comment_id")
+        }
+
+    def merge(
+        self,
+        product_name: str,
+        video_id: str,
+        comments: list[dict],
+        advance_watermark: bool = True,
+    ) -> int:
+        """새 댓글을 코퍼스에 추가하고 워터마크 갱신 (실제로 추가된 댓글 수 반환)
+
+        중복 판정은 저장된 댓글 ID로 정확히 하고, 블룸 필터는 다음 조회에서 경계 댓글을
+        건너뛰는 용도로만 갱신합니다. advance_watermark=False(수집이 중간에 끊긴 경우)면
+        댓글은 저장하되 최신 작성시각 워터마크는 옮기지 않아 빠진 구간을 다음에 다시 조회합니다.
+        """
+        try:
+            with self._lock:
+                product_dir = self._product_dir(product_name)
+                product_dir.mkdir(parents=True, exist_ok=True)
+
+                watermarks = self._read_watermarks(product_name)
+                entry = watermarks.get(video_id)
+                if entry:
+                    latest = parse_timestamp(entry.get("latest_published_at"))
+                    if math.isnan(latest):
+                        latest = float("-inf")
+                else:
+                    latest = float("-inf")
+
+                # 이미 저장된 댓글 ID는 건너뛰어 재수집 시에도 코퍼스에 중복이 쌓이지 않게 함
+                known_ids = self._load_comment_ids(product_name, video_id)
+                new_comments = []
+                for comment in comments:
+                    comment_id = comment.get("comment_id")
+                    if comment_id:
+                        if comment_id in known_ids:
+                            continue
+                        known_ids.add(comment_id)
+                    new_comments.append(comment)
+
+                if advance_watermark:
+                    for comment in new_comments:
+                        published = parse_timestamp(comment.get("published_at"))
+                        if not math.isnan(published) and published > latest:
+                            latest = published
+
+                if new_comments:
+                    path = product_dir / f"{_UNSAFE_NAME.sub('_', video_id)}.jsonl"
+                    with path.open("a", encoding="utf-8") as f:
+                        for comment in new_comments:
+                            f.write(json.dumps(comment, ensure_ascii=False) + "\n")
+
+                # 블룸 필터는 용량에 맞춰 저장된 ID 전체로 다시 만들어 오탐률이 커지지 않게 함
+                capacity = COMMENT_BLOOM_CAPACITY
+                while capacity < len(known_ids):
+                    capacity *= 2
+                seen = BloomFilter(capacity, COMMENT_BLOOM_ERROR_RATE)
+                for comment_id in known_ids:
+                    seen.add(comment_id)
+
+                watermarks[video_id] = {
+                    "latest_published_at": format_timestamp(latest) if latest > float("-inf") else "",
+                    "seen": base64.b64encode(seen.to_bytes()).decode("ascii"),
+                    "comment_count": (entry or {}).get("comment_count", 0) + len(new_comments),
+                }
+                self._write_watermarks(product_name, watermarks)
+
+            logger.info(f"댓글 코퍼스 병합: {product_name}/{video_id} +{len(new_comments)}개")
+            return len(new_comments)
+
+        except OSError as e:
+            logger.error(f"댓글 코퍼스 저장 실패: {e}")
+            raise StorageError(f"댓글 코퍼스 저장 실패: {e}", {"video_id": video_id})
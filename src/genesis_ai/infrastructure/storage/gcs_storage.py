@@ -8,6 +8,7 @@ from google.cloud import storage
 
 from ...core.exceptions import GCSDownloadError, GCSUploadError, StorageError
 from ...utils.logger import get_logger
+from ..resilience import RetryBudget, RetryPolicy
 
 logger = get_logger(__name__)
 
@@ -15,9 +16,15 @@ logger = get_logger(__name__)
 class GCSStorage:
     """Google Cloud Storage 서비스"""
 
-    def __init__(self, bucket_name: str, project_id: str | None = None) -> None:
+    def __init__(
+        self,
+        bucket_name: str,
+        project_id: str | None = None,
+        retry_budget: RetryBudget | None = None,
+    ) -> None:
         self._bucket_name = bucket_name
         self._project_id = project_id
+        self._retry_policy = RetryPolicy(budget=retry_budget)
         self._client = None
 
     def _get_client(self) -> storage.Client:
@@ -30,6 +37,10 @@ class GCSStorage:
         """버킷 인스턴스 반환"""
         return self._get_client().bucket(self._bucket_name)
 
+    def _retry(self, func, *args, **kwargs):
+        """GCS 호출 (429/5xx/연결 오류는 공통 재시도 정책으로 재시도)"""
+        return self._retry_policy.call(func, *args, operation="GCS", **kwargs)
+
     def is_configured(self) -> bool:
         """설정 확인"""
         return bool(self._bucket_name)
@@ -54,14 +65,13 @@ class GCSStorage:
             blob = bucket.blob(path)
 
             if content_type == "application/json" and isinstance(data, dict):
-                blob.upload_from_string(
+                self._retry(
+                    blob.upload_from_string,
                     json.dumps(data, ensure_ascii=False, indent=2),
                     content_type=content_type,
                 )
-            elif isinstance(data, str):
-                blob.upload_from_string(data, content_type=content_type)
-            elif isinstance(data, bytes):
-                blob.upload_from_string(data, content_type=content_type)
+            elif isinstance(data, (str, bytes)):
+                self._retry(blob.upload_from_string, data, content_type=content_type)
             else:
                 raise ValueError(f"지원하지 않는 데이터 타입: {type(data)}")
 
@@ -77,7 +87,7 @@ class GCSStorage:
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
-            return blob.download_as_bytes()
+            return self._retry(blob.download_as_bytes)
         except Exception as e:
             logger.error(f"GCS 다운로드 실패: {e}")
             raise GCSDownloadError(f"GCS 다운로드 실패: {e}", {"path": path})
@@ -87,7 +97,7 @@ class GCSStorage:
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
-            return blob.download_as_text()
+            return self._retry(blob.download_as_text)
         except Exception as e:
             logger.error(f"GCS 텍스트 다운로드 실패: {e}")
             return None
@@ -107,8 +117,8 @@ class GCSStorage:
         """파일 목록 조회"""
         try:
             bucket = self._get_bucket()
-            blobs = bucket.list_blobs(prefix=prefix)
-            return [blob.name for blob in blobs]
+            # list_blobs는 순회할 때 요청하므로 순회까지 한 번에 재시도
+            return self._retry(lambda: [blob.name for blob in bucket.list_blobs(prefix=prefix)])
         except Exception as e:
             logger.error(f"GCS 목록 조회 실패: {e}")
             return []
@@ -119,7 +129,7 @@ class GCSStorage:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
 
-            if blob.exists():
+            if self._retry(blob.exists):
                 return f"https://storage.googleapis.com/{self._bucket_name}/{path}"
             return None
         except Exception as e:
@@ -134,7 +144,7 @@ class GCSStorage:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
 
-            if blob.exists():
+            if self._retry(blob.exists):
                 return blob.generate_signed_url(
                     expiration=timedelta(minutes=expiration_minutes),
                     method="GET",
@@ -149,7 +159,7 @@ class GCSStorage:
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
-            blob.delete()
+            self._retry(blob.delete)
             logger.info(f"GCS 파일 삭제: {path}")
             return True
         except Exception as e:
@@ -161,7 +171,7 @@ class GCSStorage:
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
-            return blob.exists()
+            return self._retry(blob.exists)
         except Exception:
             return False
 
@@ -170,7 +180,7 @@ class GCSStorage:
         try:
             bucket = self._get_bucket()
             source_blob = bucket.blob(source_path)
-            bucket.copy_blob(source_blob, bucket, dest_path)
+            self._retry(bucket.copy_blob, source_blob, bucket, dest_path)
             logger.info(f"GCS 파일 복사: {source_path} -> {dest_path}")
             return True
         except Exception as e:
@@ -0,0 +1,297 @@
+"""
+네이버 상품 가격 스냅샷 저장소
+검색 결과를 검색어/날짜별로 나눈 추가 전용(append-only) 컬럼형 세그먼트 파일로 보관
+
+디렉토리 구조:
+    {base_dir}/prices/{검색어}/{YYYY-MM-DD}/{HHMMSS}-{id}.seg  - 스냅샷 1회 = 세그먼트 1개
+    {base_dir}/prices/_index/{00~3f}.tsv                        - 상품 ID → 세그먼트/행 색인
+
+세그먼트 형식:
+    b"GPS1" + 헤더 길이(uint32) + 헤더 JSON + 컬럼 블록들
+    헤더에는 컬럼별 (offset, length)와 가격 요약(min/max/sum/count)을 담아,
+    일별 요약은 헤더만, 상품 이력은 색인이 가리키는 행의 가격 8바이트만 읽습니다.
+"""
+import hashlib
+import json
+import os
+import re
+import struct
+import threading
+import uuid
+from array import array
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from ...config.constants import PRICE_INDEX_SHARDS
+from ...core.exceptions import StorageError
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MAGIC = b"GPS1"
+_HEADER_LENGTH = struct.Struct("<I")
+_PRICE = struct.Struct("<q")
+_SEPARATOR = "\x00"
+_UNSAFE_NAME = re.compile(r"[^\w.-]+")
+
+
+def _encode_strings(values: Sequence[str]) -> bytes:
+    """문자열 컬럼 → \\x00 구분 UTF-8 바이트"""
+    return _SEPARATOR.join(v.replace(_SEPARATOR, "") for v in values).encode("utf-8")
+
+
+def _decode_strings(data: bytes, rows: int) -> list[str]:
+    """\\x00 구분 UTF-8 바이트 → 문자열 컬럼"""
+    if rows == 0:
+        return []
+    return data.decode("utf-8").split(_SEPARATOR)
+
+
+class PriceSnapshotStore:
+    """가격 스냅샷 저장소 (검색어/날짜 파티션, 세그먼트 단위 추가 전용)"""
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self._root = Path(base_dir) / "prices"
+        self._index_dir = self._root / "_index"
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 경로
+    # ------------------------------------------------------------------
+
+    def _query_dir(self, query: str) -> Path:
+        """검색어 파티션 디렉토리"""
+        return self._root / _UNSAFE_NAME.sub("_", query)
+
+    def _index_path(self, product_id: str) -> Path:
+        """상품 ID 색인 샤드 경로"""
+        digest = hashlib.blake2b(product_id.encode("utf-8"), digest_size=2).digest()
+        shard = int.from_bytes(digest, "little") % PRICE_INDEX_SHARDS
+        return self._index_dir / f"{shard:02x}.tsv"
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        query: str,
+        products: Sequence[dict],
+        captured_at: datetime | None = None,
+    ) -> Path | None:
+        """검색 결과 1회분을 세그먼트로 추가 (상품이 없으면 None)"""
+        if not products:
+            return None
+        captured_at = (captured_at or datetime.now(timezone.utc)).astimezone(timezone.utc)
+
+        product_ids = [str(p.get("product_id", "")) for p in products]
+        prices = array("q", [int(p.get("price", 0) or 0) for p in products])
+        columns = {
+            "product_id": _encode_strings(product_ids),
+            "price": prices.tobytes(),
+            "mall": _encode_strings([p.get("mall", "") for p in products]),
+            "brand": _encode_strings([p.get("brand", "") for p in products]),
+        }
+        priced = [price for price in prices if price > 0]
+        header = {
+            "query": query,
+            "captured_at": captured_at.isoformat(),
+            "rows": len(products),
+            "stats": {
+                "min": min(priced) if priced else 0,
+                "max": max(priced) if priced else 0,
+                "sum": sum(priced),
+                "count": len(priced),
+            },
+            "columns": {},
+        }
+        # 헤더 길이가 컬럼 offset에 영향을 주므로 offset은 헤더 끝 기준 상대 위치로 기록
+        offset = 0
+        for name, data in columns.items():
+            header["columns"][name] = [offset, len(data)]
+            offset += len(data)
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+        partition = self._query_dir(query) / captured_at.date().isoformat()
+        name = f"{captured_at.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.seg"
+        path = partition / name
+
+        try:
+            with self._lock:
+                partition.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(".tmp")
+                with temp_path.open("wb") as f:
+                    f.write(_MAGIC)
+                    f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+                    f.write(header_bytes)
+                    for data in columns.values():
+                        f.write(data)
+                os.replace(temp_path, path)
+                self._append_index(path, product_ids)
+        except OSError as e:
+            logger.error(f"가격 스냅샷 저장 실패: {e}")
+            raise StorageError(f"가격 스냅샷 저장 실패: {e}", {"query": query})
+
+        logger.info(f"가격 스냅샷 저장: '{query}' {len(products)}개 ({path.name})")
+        return path
+
+    def _append_index(self, segment: Path, product_ids: Sequence[str]) -> None:
+        """상품 ID 색인에 (세그먼트, 행 번호) 추가 (잠금 안에서 호출)"""
+        relative = segment.relative_to(self._root).as_posix()
+        lines_by_shard: dict[Path, list[str]] = {}
+        for row, product_id in enumerate(product_ids):
+            if product_id:
+                lines_by_shard.setdefault(self._index_path(product_id), []).append(
+                    f"{product_id}\t{relative}\t{row}\n"
+                )
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        for shard, lines in lines_by_shard.items():
+            with shard.open("a", encoding="utf-8") as f:
+                f.writelines(lines)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_header(f) -> tuple[dict, int]:
+        """세그먼트 헤더와 컬럼 데이터 시작 위치"""
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise StorageError("가격 스냅샷 형식 오류", {"path": getattr(f, "name", "")})
+        (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+        header = json.loads(f.read(length).decode("utf-8"))
+        return header, len(_MAGIC) + _HEADER_LENGTH.size + length
+
+    def _segments(
+        self,
+        query: str,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> Iterator[Path]:
+        """기간 안의 세그먼트 경로 (날짜 파티션 이름으로 걸러 불필요한 디렉토리는 열지 않음)"""
+        query_dir = self._query_dir(query)
+        if not query_dir.exists():
+            return
+        for partition in sorted(query_dir.iterdir()):
+            day = partition.name
+            if since and day < since.isoformat():
+                continue
+            if until and day > until.isoformat():
+                continue
+            yield from sorted(partition.glob("*.seg"))
+
+    def partitions(self, query: str) -> list[str]:
+        """검색어의 날짜 파티션 목록"""
+        query_dir = self._query_dir(query)
+        if not query_dir.exists():
+            return []
+        return sorted(p.name for p in query_dir.iterdir() if p.is_dir())
+
+    def read_segment(self, path: Path, columns: Sequence[str] | None = None) -> dict:
+        """세그먼트 1개를 컬럼별로 읽기 (columns로 필요한 컬럼만 선택)"""
+        with path.open("rb") as f:
+            header, base = self._read_header(f)
+            rows = header["rows"]
+            result: dict = {"captured_at": header["captured_at"], "rows": rows}
+            for name in columns or header["columns"]:
+                offset, length = header["columns"][name]
+                f.seek(base + offset)
+                data = f.read(length)
+                if name == "price":
+                    values = array("q")
+                    values.frombytes(data)
+                    result[name] = values
+                else:
+                    result[name] = _decode_strings(data, rows)
+        return result
+
+    def iter_snapshots(
+        self,
+        query: str,
+        since: date | None = None,
+        until: date | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[dict]:
+        """기간 안의 스냅샷을 하나씩 읽는 이터레이터 (한 번에 한 세그먼트만 메모리에 올림)"""
+        for path in self._segments(query, since, until):
+            yield self.read_segment(path, columns)
+
+    def daily_summary(
+        self,
+        query: str,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> list[dict]:
+        """검색어의 일별 최저/평균/최고 가격 (세그먼트 헤더만 읽음)"""
+        days: dict[str, dict] = {}
+        for path in self._segments(query, since, until):
+            with path.open("rb") as f:
+                header, _ = self._read_header(f)
+            stats = header["stats"]
+            day = days.setdefault(path.parent.name, {
+                "min": None, "max": 0, "sum": 0, "count": 0, "snapshots": 0,
+            })
+            day["snapshots"] += 1
+            if stats["count"]:
+                day["min"] = stats["min"] if day["min"] is None else min(day["min"], stats["min"])
+                day["max"] = max(day["max"], stats["max"])
+                day["sum"] += stats["sum"]
+                day["count"] += stats["count"]
+
+        return [
+            {
+                "date": day,
+                "min_price": values["min"] or 0,
+                "avg_price": values["sum"] // values["count"] if values["count"] else 0,
+                "max_price": values["max"],
+                "listings": values["count"],
+                "snapshots": values["snapshots"],
+            }
+            for day, values in sorted(days.items())
+        ]
+
+    def price_history(
+        self,
+        product_id: str,
+        query: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> list[dict]:
+        """상품 가격 이력 (색인이 가리키는 행의 가격만 읽음, 시간순)"""
+        index_path = self._index_path(product_id)
+        if not index_path.exists():
+            return []
+
+        # 세그먼트별로 행 번호를 모아 파일을 한 번씩만 엶
+        rows_by_segment: dict[str, list[int]] = {}
+        with index_path.open(encoding="utf-8") as f:
+            for line in f:
+                indexed_id, relative, row = line.rstrip("\n").split("\t")
+                if indexed_id == product_id:
+                    rows_by_segment.setdefault(relative, []).append(int(row))
+
+        query_prefix = f"{self._query_dir(query).name}/" if query else None
+        history: list[dict] = []
+        for relative, rows in rows_by_segment.items():
+            if query_prefix and not relative.startswith(query_prefix):
+                continue
+            day = relative.split("/")[1]
+            if (since and day < since.isoformat()) or (until and day > until.isoformat()):
+                continue
+            path = self._root / relative
+            if not path.exists():
+                continue
+            with path.open("rb") as f:
+                header, base = self._read_header(f)
+                price_offset = header["columns"]["price"][0]
+                for row in rows:
+                    f.seek(base + price_offset + row * _PRICE.size)
+                    (price,) = _PRICE.unpack(f.read(_PRICE.size))
+                    history.append({
+                        "captured_at": header["captured_at"],
+                        "query": header["query"],
+                        "price": price,
+                    })
+
+        return sorted(history, key=lambda h: h["captured_at"])
@@ -0,0 +1,98 @@
+"""
+썸네일 콘텐츠 주소 저장소
+이미지 프롬프트(제품/훅 문구/스타일 포함)와 모델 ID의 해시를 키로 후처리된 썸네일 변형을 보관
+
+디렉토리 구조:
+    {base_dir}/thumbnails/{키 앞 2자}/{키}/meta.json        - 훅 문구/스타일/모델/변형 목록
+    {base_dir}/thumbnails/{키 앞 2자}/{키}/{변형}.{확장자}  - 변형별 이미지 바이트
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from ...core.exceptions import StorageError
+from ...core.models import ImageVariant
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ThumbnailStore:
+    """썸네일 콘텐츠 주소 저장소 (같은 키에 새로 저장하면 덮어씀)"""
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self._root = Path(base_dir) / "thumbnails"
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: str, model: str) -> str:
+        """이미지 프롬프트 + 모델 ID → 저장 키 (SHA-256 hex)"""
+        return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        """키 디렉토리 경로"""
+        return self._root / key[:2] / key
+
+    def get(self, key: str) -> dict[str, ImageVariant] | None:
+        """저장된 변형 (없거나 파일이 손상되었으면 None)"""
+        entry = self._entry_dir(key)
+        try:
+            with self._lock:
+                meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+                return {
+                    name: ImageVariant(name=name, data=(entry / info["file"]).read_bytes(), **info["image"])
+                    for name, info in meta["variants"].items()
+                }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"썸네일 저장소 항목 손상, 무시: {key[:12]} - {e}")
+            return None
+
+    def lookup(self, keys: list[str]) -> dict[str, dict[str, ImageVariant]]:
+        """여러 키 중 저장된 것만 → {키: 변형}"""
+        found = {}
+        for key in keys:
+            variants = self.get(key)
+            if variants is not None:
+                found[key] = variants
+        return found
+
+    def put(self, key: str, variants: dict[str, ImageVariant], **meta: str) -> None:
+        """변형 저장 (meta: 훅 문구/스타일/모델 등 참고 정보)
+
+        변형 파일을 먼저 쓰고 meta.json을 마지막에 원자적으로 교체하므로, 쓰는 도중에
+        읽어도 이전 항목이나 새 항목 중 하나만 보입니다.
+        """
+        entry = self._entry_dir(key)
+        record = {
+            **meta,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "variants": {
+                name: {
+                    "file": f"{name}-{hashlib.sha256(variant.data).hexdigest()[:12]}.{variant.extension}",
+                    "image": {"mime_type": variant.mime_type, "width": variant.width, "height": variant.height},
+                }
+                for name, variant in variants.items()
+            },
+        }
+        try:
+            with self._lock:
+                entry.mkdir(parents=True, exist_ok=True)
+                for name, variant in variants.items():
+                    path = entry / record["variants"][name]["file"]
+                    if not path.exists():
+                        path.write_bytes(variant.data)
+                tmp = entry / f"meta.json.{os.getpid()}.{threading.get_ident()}.tmp"
+                tmp.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, entry / "meta.json")
+                # 새 변형으로 교체된 이전 파일 정리
+                keep = {info["file"] for info in record["variants"].values()} | {"meta.json"}
+                for path in entry.iterdir():
+                    if path.name not in keep and not path.name.endswith(".tmp"):
+                        path.unlink(missing_ok=True)
+        except OSError as e:
+            raise StorageError(f"썸네일 저장 실패: {e}", {"key": key})
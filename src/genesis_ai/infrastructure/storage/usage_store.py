@@ -0,0 +1,133 @@
+"""
+실행별 모델 사용량 보고서 저장소
+파이프라인 실행마다 호출 이름별 토큰/비용 합계를 한 줄씩 쌓고, 최근 실행을 모아 집계/회귀 경고를 만듦
+
+파일 구조:
+    {base_dir}/usage/runs.jsonl  - 실행 1회 = JSON 1줄 (제품, 실행 시각, 합계, 호출 이름별 합계)
+"""
+import json
+import statistics
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from ...config.constants import (
+    USAGE_REGRESSION_MIN_RUNS,
+    USAGE_REGRESSION_RATIO,
+    USAGE_REPORT_WINDOW,
+)
+from ...core.exceptions import StorageError
+from ...core.models import UsageSummary
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _prompt_per_call(group: dict) -> float:
+    """호출당 입력 토큰 수"""
+    return group["prompt_tokens"] / group["calls"] if group.get("calls") else 0.0
+
+
+class UsageReportStore:
+    """실행별 사용량 보고서 저장소 (추가 전용 JSONL)"""
+
+    def __init__(self, base_dir: str | Path) -> None:
+        self._path = Path(base_dir) / "usage" / "runs.jsonl"
+        self._lock = threading.Lock()
+
+    def append(self, product_name: str, usage: UsageSummary, success: bool = True) -> None:
+        """실행 1회 사용량 추가 (호출이 없으면 기록하지 않음)"""
+        if not usage.calls:
+            return
+        record = {
+            "product_name": product_name,
+            "executed_at": datetime.now().isoformat(timespec="seconds"),
+            "success": success,
+            "totals": usage.totals,
+            "by_operation": usage.by_operation,
+        }
+        try:
+            with self._lock:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with self._path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            raise StorageError(f"사용량 보고서 저장 실패: {e}", {"path": str(self._path)})
+
+    def load_runs(self, limit: int | None = None) -> list[dict]:
+        """최근 실행 기록 (오래된 것부터, 손상된 줄은 건너뜀)"""
+        if not self._path.exists():
+            return []
+        runs = []
+        with self._lock, self._path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return runs[-limit:] if limit else runs
+
+    def report(self, window: int = USAGE_REPORT_WINDOW) -> dict:
+        """최근 window개 실행 집계
+
+        Returns:
+            runs, totals(토큰/비용 합계), avg_cost_usd, by_operation(호출 이름별 호출 수,
+            호출당 평균 입력 토큰, 비용 합계), regressions(마지막 실행의 호출당 입력 토큰이
+            이전 실행 중앙값의 USAGE_REGRESSION_RATIO배를 넘은 호출 이름)
+        """
+        runs = self.load_runs(window)
+        totals: dict[str, float] = {}
+        operations: dict[str, dict] = {}
+        for run in runs:
+            for name, value in run["totals"].items():
+                totals[name] = totals.get(name, 0) + value
+            for operation, group in run["by_operation"].items():
+                entry = operations.setdefault(
+                    operation, {"model": group.get("model", ""), "calls": 0, "prompt_tokens": 0, "cost_usd": 0.0}
+                )
+                entry["calls"] += group["calls"]
+                entry["prompt_tokens"] += group["prompt_tokens"]
+                entry["cost_usd"] += group["cost_usd"]
+
+        by_operation = {
+            operation: {
+                "model": entry["model"],
+                "calls": entry["calls"],
+                "avg_prompt_tokens": round(_prompt_per_call(entry), 1),
+                "cost_usd": round(entry["cost_usd"], 6),
+            }
+            for operation, entry in operations.items()
+        }
+        return {
+            "runs": len(runs),
+            "totals": totals,
+            "avg_cost_usd": round(totals.get("cost_usd", 0) / len(runs), 6) if runs else 0.0,
+            "by_operation": by_operation,
+            "regressions": self._regressions(runs),
+        }
+
+    @staticmethod
+    def _regressions(runs: list[dict]) -> list[dict]:
+        """마지막 실행에서 호출당 입력 토큰이 크게 늘어난 호출 이름"""
+        if len(runs) <= USAGE_REGRESSION_MIN_RUNS:
+            return []
+        latest, previous = runs[-1], runs[:-1]
+        regressions = []
+        for operation, group in latest["by_operation"].items():
+            history = [
+                _prompt_per_call(run["by_operation"][operation])
+                for run in previous
+                if operation in run["by_operation"]
+            ]
+            if len(history) < USAGE_REGRESSION_MIN_RUNS:
+                continue
+            baseline = statistics.median(history)
+            current = _prompt_per_call(group)
+            if baseline > 0 and current > baseline * USAGE_REGRESSION_RATIO:
+                regressions.append({
+                    "operation": operation,
+                    "baseline_prompt_tokens": round(baseline, 1),
+                    "prompt_tokens": round(current, 1),
+                    "ratio": round(current / baseline, 2),
+                })
+        return regressions
@@ -0,0 +1,11 @@
+"""
+사용량 계측 모듈 (모델 호출 토큰/지연/비용 원장)
+"""
+from .usage_ledger import UsageLedger, build_usage, estimate_cost, usage_from_response
+
+__all__ = [
+    "UsageLedger",
+    "build_usage",
+    "estimate_cost",
+    "usage_from_response",
+]
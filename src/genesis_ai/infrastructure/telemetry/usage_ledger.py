@@ -0,0 +1,139 @@
+"""
+모델 호출 사용량 원장
+Gemini/Veo 호출마다 토큰 수, 지연 시간, 모델 ID, 추정 비용을 실행 단위로 기록
+"""
+import threading
+from typing import Any
+
+from ...config.constants import GEMINI_PRICING, VEO_PRICE_PER_SECOND
+from ...core.models import ModelCallUsage, UsageSummary
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PER_MILLION = 1_000_000
+
+
+def usage_from_response(response: Any) -> dict[str, int]:
+    """generate_content 응답의 usage_metadata → 토큰 수 (없는 항목은 0)"""
+    metadata = getattr(response, "usage_metadata", None)
+    if metadata is None:
+        return {}
+    fields = {
+        "prompt_tokens": "prompt_token_count",
+        "candidate_tokens": "candidates_token_count",
+        "cached_tokens": "cached_content_token_count",
+        "thoughts_tokens": "thoughts_token_count",
+    }
+    return {name: int(getattr(metadata, attr, None) or 0) for name, attr in fields.items()}
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int = 0,
+    candidate_tokens: int = 0,
+    cached_tokens: int = 0,
+    thoughts_tokens: int = 0,
+    video_seconds: float = 0.0,
+) -> float:
+    """추정 비용(USD) (단가표에 없는 모델은 0)"""
+    if video_seconds:
+        return video_seconds * VEO_PRICE_PER_SECOND.get(model, 0.0)
+    pricing = GEMINI_PRICING.get(model)
+    if pricing is None:
+        return 0.0
+    uncached = max(prompt_tokens - cached_tokens, 0)
+    return (
+        uncached * pricing["prompt"]
+        + cached_tokens * pricing["cached"]
+        + (candidate_tokens + thoughts_tokens) * pricing["output"]
+    ) / _PER_MILLION
+
+
+def build_usage(
+    operation: str,
+    model: str,
+    latency_seconds: float,
+    response: Any = None,
+    video_seconds: float = 0.0,
+    tier: str = "",
+    baseline_model: str | None = None,
+    escalated: bool = False,
+) -> ModelCallUsage:
+    """호출 1회 사용량 (response가 있으면 usage_metadata에서 토큰 수를 읽음)
+
+    baseline_model을 주면 같은 토큰을 그 모델로 처리했을 때 대비 절감 비용을 계산합니다.
+    escalated=True(결과를 버리고 상위 모델로 넘긴 호출)면 이 호출 비용 전체가 손실입니다.
+    """
+    tokens = usage_from_response(response) if response is not None else {}
+    cost = estimate_cost(model, video_seconds=video_seconds, **tokens)
+    saved = 0.0
+    if escalated:
+        saved = -cost
+    elif baseline_model is not None:
+        saved = estimate_cost(baseline_model, video_seconds=video_seconds, **tokens) - cost
+    return ModelCallUsage(
+        operation=operation,
+        model=model,
+        video_seconds=video_seconds,
+        latency_seconds=max(latency_seconds, 0.0),
+        cost_usd=cost,
+        tier=tier,
+        cost_saved_usd=saved,
+        **tokens,
+    )
+
+
+class UsageLedger:
+    """실행 단위 사용량 원장 (스레드 안전)
+
+    클라이언트들이 공유하고, start_run()으로 새 실행을 시작하면 기록을 비웁니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: list[ModelCallUsage] = []
+        self._unpriced: set[str] = set()
+
+    def start_run(self) -> None:
+        """새 실행 시작 (기록 초기화)"""
+        with self._lock:
+            self._calls = []
+
+    def add(self, usage: ModelCallUsage) -> None:
+        """호출 1회 사용량 추가"""
+        model = usage.model
+        with self._lock:
+            self._calls.append(usage)
+            warn_unpriced = (
+                model not in GEMINI_PRICING
+                and model not in VEO_PRICE_PER_SECOND
+                and model not in self._unpriced
+            )
+            if warn_unpriced:
+                self._unpriced.add(model)
+        if warn_unpriced:
+            logger.warning(f"단가표에 없는 모델, 비용 0으로 기록: {model}")
+        logger.debug(
+            f"{usage.operation} 사용량: 입력 {usage.prompt_tokens}(캐시 {usage.cached_tokens}), "
+            f"출력 {usage.candidate_tokens}, {usage.latency_seconds:.2f}초, ${usage.cost_usd:.4f}"
+        )
+
+    def record(
+        self,
+        operation: str,
+        model: str,
+        latency_seconds: float,
+        response: Any = None,
+        video_seconds: float = 0.0,
+    ) -> ModelCallUsage:
+        """호출 1회 기록 (response가 있으면 usage_metadata에서 토큰 수를 읽음)"""
+        usage = build_usage(operation, model, latency_seconds, response, video_seconds)
+        self.add(usage)
+        return usage
+
+    def snapshot(self) -> UsageSummary:
+        """현재 실행의 원장과 합계"""
+        with self._lock:
+            calls = list(self._calls)
+        return UsageSummary.from_calls(calls)
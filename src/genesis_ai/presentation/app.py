@@ -5,6 +5,7 @@ SOLID 원칙 기반 리팩토링 버전
 
 import streamlit as st
 
+from genesis_ai.config.constants import MAX_NAVER_COUNT
 from genesis_ai.config.products import get_product_names, get_product_by_name
 from genesis_ai.config.settings import get_settings
 from genesis_ai.core.models import PipelineStep
@@ -243,8 +244,11 @@ def render_pipeline_tab() -> None:
             youtube_count = st.slider("YouTube 검색 수", 1, 10, 3)
             include_comments = st.checkbox("댓글 분석 포함", value=True)
         with c2:
-            naver_count = st.slider("네이버 쇼핑 검색 수", 5, 30, 10)
+            naver_count = st.slider("네이버 쇼핑 검색 수", 5, MAX_NAVER_COUNT, 10, step=5)
             generate_video = st.checkbox("비디오 생성", value=True)
+            new_thumbnail = st.checkbox(
+                "썸네일 새로 생성", value=False, help="같은 훅 문구/스타일로 만든 썸네일이 있어도 새 변형을 생성"
+            )
 
     if st.button("🚀 파이프라인 실행", use_container_width=True, type="primary"):
         _execute_pipeline(
@@ -253,6 +257,7 @@ def render_pipeline_tab() -> None:
             naver_count=naver_count,
             include_comments=include_comments,
             generate_video=generate_video,
+            new_thumbnail=new_thumbnail,
         )
 
     # 이전 실행 결과 표시
@@ -265,6 +270,7 @@ def _execute_pipeline(
     naver_count: int,
     include_comments: bool,
     generate_video: bool,
+    new_thumbnail: bool = False,
 ) -> None:
     """파이프라인 실행 로직"""
     from genesis_ai.core.models import PipelineConfig, PipelineProgress
@@ -277,16 +283,36 @@ def _execute_pipeline(
         include_comments=include_comments,
         generate_video=generate_video,
         generate_thumbnail=True,
+        thumbnail_new_variation=new_thumbnail,
     )
 
     # 진행 상황 표시용 placeholder
     status_container = st.status("파이프라인 실행 중...", expanded=True)
 
+    # 전략 필드가 완성되는 대로 먼저 보여줄 영역 (스트리밍 응답)
+    # 필드마다 자리를 따로 두어, pro 모델로 상향되어 다시 도착한 값은 덮어씀
+    live_strategy = st.container()
+    live_fields = {
+        field: live_strategy.empty() for field in ("target_audience", "hook_suggestions", "keywords")
+    }
+
     def progress_callback(progress: PipelineProgress) -> None:
         """진행 상황 콜백"""
         status_container.update(label=f"진행률: {progress.percentage}%")
         status_container.write(f"📍 {progress.message}")
 
+    def strategy_callback(field: str, value) -> None:
+        """전략 필드 도착 콜백 (타겟/훅/키워드만 미리 표시)"""
+        if field == "target_audience" and isinstance(value, dict):
+            live_fields[field].markdown(
+                f"**🎯 타겟 고객:** {value.get('primary', '')}"
+                + (f" / {value['secondary']}" if value.get("secondary") else "")
+            )
+        elif field == "hook_suggestions" and value:
+            live_fields[field].markdown("**⚡ 훅 문구 제안**\n" + "\n".join(f"- {hook}" for hook in value))
+        elif field == "keywords" and value:
+            live_fields[field].markdown("**🔑 키워드:** " + ", ".join(value))
+
     try:
         # 파이프라인 서비스 가져오기
         pipeline_service = get_pipeline_service()
@@ -296,6 +322,7 @@ def _execute_pipeline(
             product=product,
             config=config,
             progress_callback=progress_callback,
+            strategy_callback=strategy_callback,
         )
 
         # 결과 저장
@@ -317,11 +344,14 @@ def _execute_pipeline(
                     },
                 )
             if result.strategy:
-                SessionManager.set("marketing_strategy", result.strategy)
+                SessionManager.set("marketing_strategy", result.strategy.model_dump(mode="json"))
             if result.generated_content:
                 if result.generated_content.thumbnail_data:
+                    # 세션에는 UI 표시용 preview 변형만 보관 (없으면 원본)
+                    preview = result.generated_content.thumbnail_variants.get("preview")
                     SessionManager.set(
-                        "generated_thumbnail", result.generated_content.thumbnail_data
+                        "generated_thumbnail",
+                        preview.data if preview else result.generated_content.thumbnail_data,
                     )
                 if result.generated_content.video_url:
                     SessionManager.set(
@@ -336,6 +366,7 @@ def _execute_pipeline(
                     "product_name": result.product_name,
                     "duration_seconds": result.duration_seconds,
                     "executed_at": result.executed_at.isoformat(),
+                    "usage": result.usage.model_dump(exclude={"calls"}) if result.usage else None,
                 },
             )
 
@@ -370,6 +401,10 @@ def _display_pipeline_result() -> None:
         duration = result.get("duration_seconds", 0)
         st.metric("소요 시간", f"{duration:.1f}초")
 
+    usage = result.get("usage")
+    if usage and usage["totals"].get("calls"):
+        _display_usage(usage)
+
     # 수집된 데이터 결과 표시 (Pain & Gain Points)
     collected_data = SessionManager.get("collected_data")
     if collected_data:
@@ -425,19 +460,58 @@ def _display_pipeline_result() -> None:
         _display_strategy_results(strategy)
 
 
+def _display_usage(usage: dict) -> None:
+    """모델 호출 토큰/비용 요약과 최근 실행 집계"""
+    from genesis_ai.infrastructure.factories import get_usage_report_store
+
+    totals = usage["totals"]
+    with st.expander(f"🧾 모델 사용량 (추정 ${totals['cost_usd']:.4f})"):
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("호출", f"{int(totals['calls'])}회")
+        c2.metric("입력 토큰", f"{int(totals['prompt_tokens']):,}")
+        c3.metric("출력 토큰", f"{int(totals['candidate_tokens']):,}")
+        c4.metric("영상", f"{totals['video_seconds']:.0f}초")
+        st.dataframe(
+            [{"호출": name, **values} for name, values in usage["by_operation"].items()],
+            use_container_width=True,
+        )
+
+        report = get_usage_report_store().report()
+        if report["runs"]:
+            st.caption(
+                f"최근 {report['runs']}회 실행: 총 ${report['totals'].get('cost_usd', 0):.4f}, "
+                f"실행당 평균 ${report['avg_cost_usd']:.4f}"
+            )
+        for regression in report["regressions"]:
+            st.warning(
+                f"입력 토큰 증가: {regression['operation']} "
+                f"{regression['baseline_prompt_tokens']:,} → {regression['prompt_tokens']:,} "
+                f"({regression['ratio']}배)"
+            )
+
+
 def _display_strategy_results(strategy: dict) -> None:
     """마케팅 전략 결과를 컬러 카드로 표시"""
 
+    generation = strategy.get("generation") or {}
+    if generation.get("model"):
+        escalation = generation.get("escalation_reason")
+        st.caption(
+            f"🧠 {generation['tier']} 티어({generation['model']}) 응답 · "
+            f"{generation.get('latency_seconds', 0):.1f}초 · 절감 ${generation.get('cost_saved_usd', 0):.4f}"
+            + (f" · 상향 사유: {escalation}" if escalation else "")
+        )
+
     # 1. 타겟 페르소나 (Purple Card)
-    if "target_persona" in strategy:
+    if strategy.get("target_persona"):
         with st.expander("👤 **Target Persona Deep Dive**", expanded=True):
             p = strategy["target_persona"]
             st.markdown(
                 f"""
             <div class="neo-card purple" style="text-align: left; padding: 15px; margin-bottom: 15px;">
                 <div class="neo-metric-label" style="color:#550055 !important;">TARGET PERSONA</div>
-                <div style="font-size: 1.1rem; font-weight: 700;">🎯 {p.get("age", "N/A")}</div>
-                <div style="margin-top: 8px; font-size: 0.95rem; opacity: 0.9;">💡 {p.get("description", "")}</div>
+                <div style="font-size: 1.1rem; font-weight: 700;">🎯 {p.get("primary") or "N/A"}{f" ({p['age_range']})" if p.get("age_range") else ""}</div>
+                <div style="margin-top: 8px; font-size: 0.95rem; opacity: 0.9;">💡 {p.get("secondary", "")}</div>
             </div>
             """,
                 unsafe_allow_html=True,
@@ -454,7 +528,7 @@ def _display_strategy_results(strategy: dict) -> None:
                     st.success(f"{d}")
 
     # 2. 바이럴 후킹 (Yellow Card)
-    if "hooking_points" in strategy:
+    if strategy.get("hooking_points"):
         with st.expander("⚡ **Viral Hooks (X-Algorithm Ranked)**", expanded=False):
             st.markdown(
                 """
@@ -471,11 +545,11 @@ def _display_strategy_results(strategy: dict) -> None:
                     f"""
                 <li style="margin-bottom: 12px; border-bottom: 1px dashed rgba(0,0,0,0.1); padding-bottom: 8px;">
                     <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 4px;">
-                        <span style="font-weight: 800; font-size: 1rem; color: #222;">[{hp.get("type", "General")}]</span>
+                        <span style="font-weight: 800; font-size: 1rem; color: #222;">[{hp.get("hook_type") or "General"}]</span>
                         <span style="background:black; color:white; padding: 2px 8px; border-radius: 0; font-weight: 700; font-size: 0.8rem;">Viral Score: {score}</span>
                     </div>
                     <div style="font-size: 1.05rem; font-weight: 600; margin-bottom: 4px;">"{hp.get("hook")}"</div>
-                    <div style="font-size: 0.85rem; color: #555; font-style: italic;">└ {hp.get("explanation")}</div>
+                    <div style="font-size: 0.85rem; color: #555; font-style: italic;">└ {hp.get("explanation") or ""}</div>
                 </li>
                 """,
                     unsafe_allow_html=True,
@@ -512,7 +586,7 @@ def render_naver_tab() -> None:
     search_query = st.text_input(
         "검색어", value=product.get("name", ""), key="naver_search"
     )
-    max_results = st.slider("검색 결과 수", 5, 30, 10, key="naver_max")
+    max_results = st.slider("검색 결과 수", 5, MAX_NAVER_COUNT, 10, step=5, key="naver_max")
 
     if st.button("🔍 검색", use_container_width=True, key="naver_btn"):
         st.info("네이버 쇼핑 검색 기능은 서비스 레이어와 연결 후 활성화됩니다.")
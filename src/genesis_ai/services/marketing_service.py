@@ -5,7 +5,7 @@ AI 기반 마케팅 전략 생성 비즈니스 로직
 from typing import Any, Callable, Optional
 
 from ..core.exceptions import StrategyGenerationError
-from ..core.models import MarketingStrategy
+from ..core.models import MarketingAnalysis, MarketingStrategy
 from ..infrastructure.clients.gemini_client import GeminiClient
 from ..utils.logger import get_logger
 
@@ -54,21 +54,34 @@ class MarketingService:
         self,
         collected_data: dict,
         progress_callback: Optional[Callable[[str, int], None]] = None,
-    ) -> dict[str, Any]:
-        """마케팅 전략 생성"""
+        field_callback: Optional[Callable[[str, Any], None]] = None,
+        quality: str = "auto",
+    ) -> MarketingStrategy:
+        """마케팅 전략 생성
+
+        field_callback: 전략 필드가 완성될 때마다 (필드명, 값)으로 호출
+        quality: "auto"(빠른 모델 먼저, 필요 시 pro로 상향) 또는 "final"(pro 모델만)
+        """
         logger.info("마케팅 전략 생성 시작")
 
         try:
             result = self._client.generate_marketing_strategy(
                 collected_data=collected_data,
                 progress_callback=progress_callback,
+                field_callback=field_callback,
+                quality=quality,
             )
 
             if "error" in result:
                 raise StrategyGenerationError(result["error"])
 
+            strategy = MarketingStrategy.from_analysis(
+                collected_data.get("product", {}).get("name", "제품"),
+                MarketingAnalysis.model_validate(result),
+                generation=result.get("_cascade"),
+            )
             logger.info("마케팅 전략 생성 완료")
-            return result
+            return strategy
 
         except StrategyGenerationError:
             raise
@@ -89,11 +102,12 @@ class MarketingService:
             count=count,
         )
 
-    def extract_key_insights(self, strategy: dict) -> dict:
+    def extract_key_insights(self, strategy: MarketingStrategy) -> dict:
         """전략에서 핵심 인사이트 추출"""
+        persona = strategy.target_persona
         return {
-            "target_audience": strategy.get("target_audience", {}),
-            "hooks": strategy.get("hook_suggestions", [])[:3],
-            "keywords": strategy.get("keywords", [])[:5],
-            "summary": strategy.get("summary", ""),
+            "target_audience": persona.model_dump() if persona else {},
+            "hooks": strategy.hook_texts[:3],
+            "keywords": strategy.keywords[:5],
+            "summary": strategy.summary,
         }
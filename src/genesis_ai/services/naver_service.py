@@ -2,11 +2,15 @@
 네이버 서비스
 네이버 쇼핑 데이터 수집 비즈니스 로직
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
-from ..core.exceptions import DataCollectionError
+from ..config.constants import NAVER_QUERY_CONCURRENCY, NAVER_QUERY_TEMPLATES
+from ..core.analysis import canonicalize_listings
+from ..core.exceptions import DataCollectionError, StorageError
 from ..core.models import CompetitorStats, NaverSearchResult
 from ..infrastructure.clients.naver_client import NaverClient
+from ..infrastructure.storage.price_store import PriceSnapshotStore
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,12 +19,117 @@ logger = get_logger(__name__)
 class NaverService:
     """네이버 쇼핑 데이터 수집 서비스"""
 
-    def __init__(self, client: NaverClient) -> None:
+    def __init__(
+        self,
+        client: NaverClient,
+        price_store: PriceSnapshotStore | None = None,
+    ) -> None:
         self._client = client
+        self._price_store = price_store
 
     def search_products(self, query: str, max_results: int = 10) -> list[dict]:
-        """상품 검색"""
-        return self._client.search_shopping(query, max_results)
+        """상품 검색 (100개 초과 시 여러 페이지를 동시에 조회해 병합)"""
+        return self._client.search_shopping_all(query, total=max_results)
+
+    @staticmethod
+    def build_queries(product: dict, templates: list[str] | None = None) -> list[str]:
+        """제품 정보로 검색어 템플릿을 채운 검색어 목록 (빈 값/중복 제외)"""
+        queries: list[str] = []
+        for template in templates or NAVER_QUERY_TEMPLATES:
+            try:
+                query = template.format(**product).strip()
+            except (KeyError, IndexError):
+                # 제품에 없는 필드를 쓰는 템플릿은 건너뜀
+                continue
+            if query and query not in queries:
+                queries.append(query)
+        return queries
+
+    def search_many(self, queries: list[str], max_results: int = 10) -> dict:
+        """여러 검색어를 동시에 검색하고 productId 기준으로 병합
+
+        각 상품에는 어떤 검색어에서 몇 위로 나왔는지(query_ranks)를 남기고,
+        병합 목록은 검색어들 중 가장 좋은 순위 기준으로 정렬합니다.
+        일부 검색어가 실패해도 나머지 결과로 진행하며, 모두 실패하면 예외를 발생시킵니다.
+        """
+        if not queries:
+            return {"products": [], "query_counts": {}, "failed_queries": []}
+
+        def _search(query: str) -> list[dict]:
+            return self.search_products(query, max_results)
+
+        # 검색어별 요청은 클라이언트의 공유 호출 한도 제어기를 함께 거침
+        with ThreadPoolExecutor(max_workers=min(NAVER_QUERY_CONCURRENCY, len(queries))) as executor:
+            futures = [(query, executor.submit(_search, query)) for query in queries]
+
+        merged: dict[str, dict] = {}
+        first_query: dict[str, int] = {}
+        anonymous: list[dict] = []
+        query_counts: dict[str, int] = {}
+        failed: list[str] = []
+        last_error: Exception | None = None
+
+        for query_index, (query, future) in enumerate(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.warning(f"네이버 검색어 실패: '{query}' - {e}")
+                failed.append(query)
+                last_error = e
+                continue
+
+            query_counts[query] = len(results)
+            self._record_snapshot(query, results)
+            for position, item in enumerate(results, start=1):
+                rank = item.get("rank", position)
+                product_id = item.get("product_id")
+                if not product_id:
+                    anonymous.append({**item, "queries": [query], "query_ranks": {query: rank}})
+                    continue
+                if product_id in merged:
+                    entry = merged[product_id]
+                    entry["queries"].append(query)
+                    entry["query_ranks"][query] = rank
+                else:
+                    merged[product_id] = {**item, "queries": [query], "query_ranks": {query: rank}}
+                    first_query[product_id] = query_index
+
+        if len(failed) == len(queries) and last_error is not None:
+            raise last_error
+
+        # 가장 좋은 순위 우선, 같으면 먼저 나온 검색어 우선
+        products = sorted(
+            merged.values(),
+            key=lambda p: (min(p["query_ranks"].values()), first_query[p["product_id"]]),
+        )
+        products.extend(anonymous)
+
+        logger.info(
+            f"네이버 다중 검색 병합: {len(queries)}개 검색어 -> {len(products)}개 상품 "
+            f"(검색어별 {query_counts})"
+        )
+        return {"products": products, "query_counts": query_counts, "failed_queries": failed}
+
+    def _record_snapshot(self, query: str, products: list[dict]) -> None:
+        """검색 결과를 가격 스냅샷으로 저장 (저장 실패는 수집을 막지 않음)"""
+        if self._price_store is None:
+            return
+        try:
+            self._price_store.append(query, products)
+        except StorageError as e:
+            logger.warning(f"가격 스냅샷 저장 생략: {e}")
+
+    def price_history(self, product_id: str, query: str | None = None) -> list[dict]:
+        """상품 가격 이력 (저장소가 없으면 빈 목록)"""
+        if self._price_store is None:
+            return []
+        return self._price_store.price_history(product_id, query=query)
+
+    def daily_price_summary(self, query: str) -> list[dict]:
+        """검색어의 일별 최저/평균 가격 (저장소가 없으면 빈 목록)"""
+        if self._price_store is None:
+            return []
+        return self._price_store.daily_summary(query)
 
     def analyze_competitors(self, products: list[dict]) -> dict:
         """경쟁사 분석"""
@@ -31,22 +140,29 @@ class NaverService:
         product: dict,
         max_results: int = 10,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        query_templates: Optional[list[str]] = None,
     ) -> dict:
-        """제품 기반 네이버 쇼핑 데이터 수집"""
+        """제품 기반 네이버 쇼핑 데이터 수집 (제품명 + 타겟/카테고리 검색어 동시 검색)"""
         logger.info(f"네이버 쇼핑 데이터 수집 시작: {product.get('name', 'N/A')}")
 
         try:
             if progress_callback:
                 progress_callback("네이버 쇼핑 검색 중...", 10)
 
-            # 제품명으로 검색
-            products = self.search_products(product["name"], max_results)
+            # 제품명뿐 아니라 타겟/카테고리 검색어까지 동시에 검색해 경쟁 상품군을 넓힘
+            queries = self.build_queries(product, query_templates)
+            search_result = self.search_many(queries, max_results)
+            listings = search_result["products"]
+
+            # 여러 판매처에 올라온 같은 상품은 하나로 묶어 통계/프롬프트가 실제 상품 수를 반영하게 함
+            products = canonicalize_listings(listings)
 
             if progress_callback:
                 progress_callback("경쟁사 분석 중...", 50)
 
             # 경쟁사 분석
             competitor_stats = self.analyze_competitors(products)
+            competitor_stats["total_listings"] = len(listings)
 
             if progress_callback:
                 progress_callback("네이버 데이터 수집 완료", 100)
@@ -56,19 +172,24 @@ class NaverService:
                 "products": products,
                 "competitor_stats": competitor_stats,
                 "total_count": len(products),
+                "listing_count": len(listings),
+                "queries": queries,
+                "query_counts": search_result["query_counts"],
             }
 
-            logger.info(f"네이버 쇼핑 데이터 수집 완료: {len(products)}개 상품")
+            logger.info(
+                f"네이버 쇼핑 데이터 수집 완료: 판매 항목 {len(listings)}개 -> 상품 {len(products)}개"
+            )
             return result
 
         except Exception as e:
             logger.error(f"네이버 쇼핑 데이터 수집 실패: {e}")
             raise DataCollectionError(f"네이버 쇼핑 데이터 수집 실패: {e}")
 
-    def get_price_summary(self, products: list[dict]) -> str:
-        """가격 요약 문자열 생성"""
+    def get_price_summary(self, products: list[dict], stats: dict | None = None) -> str:
+        """가격 요약 문자열 생성 (이미 계산한 competitor_stats가 있으면 재사용)"""
         if not products:
             return "데이터 없음"
 
-        stats = self.analyze_competitors(products)
+        stats = stats or self.analyze_competitors(products)
         return f"최저 {stats['min_price']:,}원 ~ 최고 {stats['max_price']:,}원 (평균 {stats['avg_price']:,}원)"
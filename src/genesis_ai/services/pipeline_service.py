@@ -3,18 +3,24 @@
 전체 마케팅 파이프라인 오케스트레이션
 """
 import time
-from typing import Callable, Optional
+from datetime import datetime
+from typing import Any, Callable, Optional
 
-from ..core.exceptions import PipelineError
+from ..core.exceptions import PipelineError, StorageError
 from ..core.interfaces import IStorageService
 from ..core.models import (
     CollectedData,
     GeneratedContent,
+    MarketingStrategy,
     PipelineConfig,
     PipelineProgress,
     PipelineResult,
     PipelineStep,
+    UsageSummary,
 )
+from ..infrastructure.resilience import ConcurrencyLimiterRegistry, RetryBudget
+from ..infrastructure.storage.usage_store import UsageReportStore
+from ..infrastructure.telemetry import UsageLedger
 from ..utils.logger import get_logger
 from .marketing_service import MarketingService
 from .naver_service import NaverService
@@ -36,6 +42,10 @@ class PipelineService:
         thumbnail_service: ThumbnailService,
         video_service: VideoService,
         storage_service: IStorageService,
+        retry_budget: RetryBudget | None = None,
+        usage_ledger: UsageLedger | None = None,
+        usage_store: UsageReportStore | None = None,
+        concurrency_limiters: ConcurrencyLimiterRegistry | None = None,
     ) -> None:
         self._youtube = youtube_service
         self._naver = naver_service
@@ -43,21 +53,63 @@ class PipelineService:
         self._thumbnail = thumbnail_service
         self._video = video_service
         self._storage = storage_service
+        self._retry_budget = retry_budget
+        self._usage_ledger = usage_ledger
+        self._usage_store = usage_store
+        self._concurrency_limiters = concurrency_limiters
+
+    def _upload_thumbnail(self, product_name: str, content: GeneratedContent) -> None:
+        """썸네일 업로드 (hd 변형 우선, 없으면 original)"""
+        variant = content.thumbnail_variants.get("hd") or content.thumbnail_variants.get("original")
+        if variant is None:
+            return
+        path = f"thumbnails/{product_name}/{datetime.now():%Y%m%d_%H%M%S}.{variant.extension}"
+        self._storage.upload(variant.data, path, content_type=variant.mime_type)
+        content.thumbnail_url = self._storage.get_public_url(path)
+
+    def _finish_usage(self, product_name: str, success: bool) -> UsageSummary | None:
+        """이번 실행의 사용량 원장 확정, 보고서 저장 및 입력 토큰 회귀 경고"""
+        if self._usage_ledger is None:
+            return None
+        usage = self._usage_ledger.snapshot()
+        totals = usage.totals
+        logger.info(
+            f"모델 호출 사용량: {int(totals['calls'])}회, 입력 {int(totals['prompt_tokens']):,} 토큰"
+            f"(캐시 {int(totals['cached_tokens']):,}), 출력 {int(totals['candidate_tokens']):,} 토큰, "
+            f"영상 {totals['video_seconds']:.0f}초, 추정 ${totals['cost_usd']:.4f}"
+        )
+        if self._usage_store is not None:
+            try:
+                self._usage_store.append(product_name, usage, success)
+                for regression in self._usage_store.report()["regressions"]:
+                    logger.warning(
+                        f"입력 토큰 증가 감지: {regression['operation']} "
+                        f"{regression['baseline_prompt_tokens']:,} → {regression['prompt_tokens']:,} "
+                        f"({regression['ratio']}배)"
+                    )
+            except StorageError as e:
+                logger.warning(f"사용량 보고서 기록 실패: {e}")
+        return usage
 
     def execute(
         self,
         product: dict,
         config: PipelineConfig,
         progress_callback: Optional[Callable[[PipelineProgress], None]] = None,
+        strategy_callback: Optional[Callable[[str, Any], None]] = None,
     ) -> PipelineResult:
-        """파이프라인 실행"""
+        """파이프라인 실행 (strategy_callback: 전략 필드가 완성될 때마다 (필드명, 값)으로 호출)"""
         logger.info(f"파이프라인 실행 시작: {product.get('name', 'N/A')}")
         start_time = time.time()
+        if self._retry_budget is not None:
+            self._retry_budget.start_run()
+        if self._usage_ledger is not None:
+            self._usage_ledger.start_run()
 
         progress = PipelineProgress()
         collected_data = CollectedData()
         generated_content = GeneratedContent()
-        strategy: dict = {}
+        strategy: MarketingStrategy | None = None
 
         def update_progress(step: PipelineStep, message: str = "") -> None:
             progress.update(step, message)
@@ -74,16 +126,20 @@ class PipelineService:
                 product=product,
                 max_results=config.youtube_count,
                 include_comments=config.include_comments,
+                dedup_comments=config.dedup_comments,
+                incremental=config.incremental_comments,
             )
             collected_data.youtube_data = youtube_data
             collected_data.pain_points = youtube_data.get("pain_points", [])
             collected_data.gain_points = youtube_data.get("gain_points", [])
+            collected_data.keyword_stats = youtube_data.get("keyword_stats", {})
 
             # Naver 데이터 수집
             update_progress(PipelineStep.NAVER_COLLECTION, "네이버 쇼핑 데이터 수집 중...")
             naver_data = self._naver.collect_product_data(
                 product=product,
                 max_results=config.naver_count,
+                query_templates=config.naver_queries,
             )
             collected_data.naver_data = naver_data
 
@@ -95,6 +151,8 @@ class PipelineService:
                     "youtube_data": youtube_data,
                     "naver_data": naver_data,
                 },
+                field_callback=strategy_callback,
+                quality=config.strategy_quality,
             )
 
             # Step 3: 썸네일 생성
@@ -106,18 +164,22 @@ class PipelineService:
                         product=product,
                         strategy=strategy,
                         count=config.thumbnail_count,
+                        new_variation=config.thumbnail_new_variation,
                     )
                     generated_content.multi_thumbnails = thumbnails
                     if thumbnails:
                         generated_content.thumbnail_data = thumbnails[0].get("image")
+                        generated_content.thumbnail_variants = thumbnails[0].get("variants", {})
                 else:
-                    hooks = strategy.get("hook_suggestions", [])
+                    hooks = strategy.hook_texts
                     hook_text = hooks[0] if hooks else f"{product.get('name', '제품')}!"
-                    thumbnail = self._thumbnail.generate(
+                    variants = self._thumbnail.generate_variants(
                         product=product,
                         hook_text=hook_text,
+                        new_variation=config.thumbnail_new_variation,
                     )
-                    generated_content.thumbnail_data = thumbnail
+                    generated_content.thumbnail_variants = variants
+                    generated_content.thumbnail_data = variants["original"].data
 
             # Step 4: 비디오 생성
             if config.generate_video:
@@ -136,13 +198,18 @@ class PipelineService:
             # Step 5: 업로드 (옵션)
             if config.upload_to_gcs:
                 update_progress(PipelineStep.UPLOAD, "GCS 업로드 중...")
-                # TODO: GCS 업로드 구현
+                self._upload_thumbnail(product.get("name", ""), generated_content)
+                # TODO: 비디오 GCS 업로드 구현
 
             # 완료
             update_progress(PipelineStep.COMPLETED, "파이프라인 완료!")
             duration = time.time() - start_time
 
             logger.info(f"파이프라인 실행 완료: {duration:.2f}초")
+            if self._retry_budget is not None:
+                logger.info(f"외부 호출 재시도 현황: {self._retry_budget.stats}")
+            if self._concurrency_limiters is not None:
+                logger.info(f"모델별 동시 호출 한도: {self._concurrency_limiters.stats()}")
 
             return PipelineResult(
                 success=True,
@@ -152,6 +219,7 @@ class PipelineService:
                 strategy=strategy,
                 generated_content=generated_content,
                 duration_seconds=duration,
+                usage=self._finish_usage(product.get("name", ""), success=True),
             )
 
         except Exception as e:
@@ -168,6 +236,7 @@ class PipelineService:
                 generated_content=generated_content,
                 error_message=str(e),
                 duration_seconds=duration,
+                usage=self._finish_usage(product.get("name", ""), success=False),
             )
 
     def execute_data_collection_only(
@@ -189,10 +258,13 @@ class PipelineService:
                 product=product,
                 max_results=config.youtube_count,
                 include_comments=config.include_comments,
+                dedup_comments=config.dedup_comments,
+                incremental=config.incremental_comments,
             )
             collected_data.youtube_data = youtube_data
             collected_data.pain_points = youtube_data.get("pain_points", [])
             collected_data.gain_points = youtube_data.get("gain_points", [])
+            collected_data.keyword_stats = youtube_data.get("keyword_stats", {})
 
             if progress_callback:
                 progress_callback("네이버 쇼핑 데이터 수집 중...", 60)
@@ -200,6 +272,7 @@ class PipelineService:
             naver_data = self._naver.collect_product_data(
                 product=product,
                 max_results=config.naver_count,
+                query_templates=config.naver_queries,
             )
             collected_data.naver_data = naver_data
 
@@ -4,8 +4,12 @@ AI 기반 마케팅 썸네일 생성 비즈니스 로직
 """
 from typing import Callable, Optional
 
-from ..core.exceptions import ThumbnailGenerationError
+from ..config.constants import MULTI_THUMBNAIL_STYLES
+from ..core.exceptions import StorageError, ThumbnailGenerationError
+from ..core.models import ImageVariant, MarketingStrategy
 from ..infrastructure.clients.gemini_client import GeminiClient
+from ..infrastructure.media import ThumbnailProcessor, passthrough_variants
+from ..infrastructure.storage.thumbnail_store import ThumbnailStore
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,8 +18,62 @@ logger = get_logger(__name__)
 class ThumbnailService:
     """썸네일 생성 서비스"""
 
-    def __init__(self, client: GeminiClient) -> None:
+    def __init__(
+        self,
+        client: GeminiClient,
+        processor: ThumbnailProcessor | None = None,
+        store: ThumbnailStore | None = None,
+    ) -> None:
         self._client = client
+        self._processor = processor
+        # 제품/훅 문구/스타일/모델이 같은 썸네일 재사용 (None이면 항상 새로 생성)
+        self._store = store
+
+    def _store_key(self, product: dict, hook_text: str, style: str) -> str:
+        """썸네일 저장소 키 (이미지 프롬프트 + 이미지 모델 ID 해시)"""
+        return ThumbnailStore.make_key(
+            self._client.thumbnail_prompt(product, hook_text, style), self._client.image_model
+        )
+
+    def _save(self, product: dict, hook_text: str, style: str, variants: dict[str, ImageVariant]) -> None:
+        """썸네일 저장소에 변형 저장 (실패해도 생성 결과는 그대로 사용)"""
+        if self._store is None:
+            return
+        try:
+            self._store.put(
+                self._store_key(product, hook_text, style),
+                variants,
+                product_name=product.get("name", ""),
+                hook_text=hook_text,
+                style=style,
+                model=self._client.image_model,
+            )
+        except StorageError as e:
+            logger.warning(f"썸네일 저장 실패 ({hook_text}): {e}")
+
+    def lookup(
+        self,
+        product: dict,
+        hook_texts: list[str],
+        styles: list[str] | None = None,
+    ) -> list[dict[str, ImageVariant] | None]:
+        """훅 문구별로 이미 저장된 썸네일 변형 (hook_texts 순서, 없으면 None)
+
+        스타일은 generate_multiple과 같은 방식(styles를 차례로 반복)으로 배정합니다.
+        """
+        if self._store is None:
+            return [None] * len(hook_texts)
+        styles = styles or MULTI_THUMBNAIL_STYLES
+        return [
+            self._store.get(self._store_key(product, hook_text, styles[i % len(styles)]))
+            for i, hook_text in enumerate(hook_texts)
+        ]
+
+    def postprocess(self, image: bytes) -> dict[str, ImageVariant]:
+        """생성된 이미지 → 용도별 변형 (후처리기가 없으면 원본만)"""
+        if self._processor is None:
+            return passthrough_variants(image)
+        return self._processor.process(image)
 
     def generate(
         self,
@@ -23,8 +81,9 @@ class ThumbnailService:
         hook_text: str,
         style: str = "드라마틱",
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        use_cache: bool = True,
     ) -> bytes | None:
-        """썸네일 생성"""
+        """썸네일 생성 (원본 바이트)"""
         logger.info(f"썸네일 생성 시작: {product.get('name', 'N/A')}")
 
         try:
@@ -33,6 +92,7 @@ class ThumbnailService:
                 hook_text=hook_text,
                 style=style,
                 progress_callback=progress_callback,
+                use_cache=use_cache,
             )
 
             if result:
@@ -47,25 +107,87 @@ class ThumbnailService:
             logger.error(f"썸네일 생성 실패: {e}")
             raise ThumbnailGenerationError(f"썸네일 생성 실패: {e}")
 
+    def generate_variants(
+        self,
+        product: dict,
+        hook_text: str,
+        style: str = "드라마틱",
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        new_variation: bool = False,
+    ) -> dict[str, ImageVariant]:
+        """썸네일 생성 → 용도별 변형 (저장소에 있으면 재사용)
+
+        new_variation=True면 저장소와 응답 캐시를 건너뛰고 새로 생성해 저장된 항목을 교체합니다.
+        """
+        if not new_variation and self._store is not None:
+            cached = self._store.get(self._store_key(product, hook_text, style))
+            if cached is not None:
+                logger.info(f"저장된 썸네일 재사용: {hook_text} ({style})")
+                return cached
+
+        image = self.generate(product, hook_text, style, progress_callback, use_cache=not new_variation)
+        variants = self.postprocess(image)
+        self._save(product, hook_text, style, variants)
+        return variants
+
     def generate_multiple(
         self,
         product: dict,
         hook_texts: list[str],
         styles: list[str] | None = None,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        new_variation: bool = False,
     ) -> list[dict]:
-        """다중 썸네일 생성"""
+        """다중 썸네일 생성
+
+        저장소에 이미 있는 훅 문구는 생성하지 않고 재사용하며(cached=True), 나머지만 생성해
+        저장합니다. 결과마다 용도별 변형(variants)을 붙이고, image는 original 변형 바이트입니다.
+        new_variation=True면 저장소와 응답 캐시를 건너뛰고 모두 새로 생성합니다.
+        """
         logger.info(f"다중 썸네일 생성 시작: {len(hook_texts)}개")
 
+        styles = styles or MULTI_THUMBNAIL_STYLES
+        jobs = [(hook_text, styles[i % len(styles)]) for i, hook_text in enumerate(hook_texts)]
+        stored = [None] * len(jobs) if new_variation else self.lookup(product, hook_texts, styles)
+        missing = [job for job, variants in zip(jobs, stored) if variants is None]
+
         try:
-            results = self._client.generate_multiple_thumbnails(
-                product=product,
-                hook_texts=hook_texts,
-                styles=styles,
-                progress_callback=progress_callback,
+            generated: dict[tuple[str, str], dict] = {}
+            if missing:
+                results = self._client.generate_multiple_thumbnails(
+                    product=product,
+                    hook_texts=[hook_text for hook_text, _ in missing],
+                    styles=[style for _, style in missing],
+                    progress_callback=progress_callback,
+                    use_cache=not new_variation,
+                )
+                images = [result["image"] for result in results]
+                if self._processor is None:
+                    all_variants = [passthrough_variants(image) for image in images]
+                else:
+                    all_variants = self._processor.process_many(images)
+                for result, variants in zip(results, all_variants):
+                    self._save(product, result["hook_text"], result["style"], variants)
+                    generated[(result["hook_text"], result["style"])] = {
+                        **result, "image": variants["original"].data, "variants": variants, "cached": False,
+                    }
+
+            results = []
+            for (hook_text, style), variants in zip(jobs, stored):
+                if variants is not None:
+                    results.append({
+                        "image": variants["original"].data,
+                        "variants": variants,
+                        "hook_text": hook_text,
+                        "style": style,
+                        "cached": True,
+                    })
+                elif (hook_text, style) in generated:
+                    results.append(generated[(hook_text, style)])
+
+            logger.info(
+                f"다중 썸네일 생성 완료: {len(results)}개 (저장소 재사용 {len(jobs) - len(missing)}개)"
             )
-
-            logger.info(f"다중 썸네일 생성 완료: {len(results)}개")
             return results
 
         except Exception as e:
@@ -75,13 +197,14 @@ class ThumbnailService:
     def generate_from_strategy(
         self,
         product: dict,
-        strategy: dict,
+        strategy: MarketingStrategy,
         count: int = 3,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        new_variation: bool = False,
     ) -> list[dict]:
-        """전략 기반 썸네일 생성"""
+        """전략 기반 썸네일 생성 (이미 생성한 훅 문구는 저장소에서 재사용)"""
         # 전략에서 훅 텍스트 추출
-        hooks = strategy.get("hook_suggestions", [])
+        hooks = strategy.hook_texts
         if not hooks:
             hooks = [f"{product.get('name', '제품')} 지금 바로!"]
 
@@ -91,4 +214,5 @@ class ThumbnailService:
             product=product,
             hook_texts=hook_texts,
             progress_callback=progress_callback,
+            new_variation=new_variation,
         )
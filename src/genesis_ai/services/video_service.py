@@ -5,6 +5,7 @@ AI 기반 마케팅 비디오 생성 비즈니스 로직
 from typing import Callable, Optional
 
 from ..core.exceptions import VideoGenerationError
+from ..core.models import MarketingStrategy
 from ..infrastructure.clients.veo_client import VeoClient
 from ..utils.logger import get_logger
 
@@ -89,7 +90,7 @@ class VideoService:
     def generate_marketing_video(
         self,
         product: dict,
-        strategy: dict,
+        strategy: MarketingStrategy,
         duration_seconds: int = 8,
         progress_callback: Optional[Callable[[str, int], None]] = None,
     ) -> bytes | str:
@@ -97,7 +98,7 @@ class VideoService:
         logger.info(f"마케팅 비디오 생성 시작: {product.get('name', 'N/A')}")
 
         # 전략에서 훅 텍스트 추출
-        hooks = strategy.get("hook_suggestions", [])
+        hooks = strategy.hook_texts
         hook_text = hooks[0] if hooks else f"{product.get('name', '제품')}!"
 
         # 인사이트 구성
@@ -4,6 +4,12 @@ YouTube 데이터 수집 비즈니스 로직
 """
 from typing import Callable, Optional
 
+from ..core.analysis import (
+    CommentBatch,
+    analyze_gain_points,
+    analyze_pain_points,
+    collapse_near_duplicates,
+)
 from ..core.exceptions import DataCollectionError
 from ..core.models import YouTubeSearchResult
 from ..infrastructure.clients.youtube_client import YouTubeClient
@@ -40,6 +46,8 @@ class YouTubeService:
         max_results: int = 5,
         include_comments: bool = True,
         progress_callback: Optional[Callable[[str, int], None]] = None,
+        dedup_comments: bool = True,
+        incremental: bool = True,
     ) -> dict:
         """제품 기반 YouTube 데이터 수집"""
         logger.info(f"YouTube 데이터 수집 시작: {product.get('name', 'N/A')}")
@@ -52,6 +60,8 @@ class YouTubeService:
                 product=product,
                 max_results=max_results,
                 include_comments=include_comments,
+                dedup_comments=dedup_comments,
+                incremental=incremental,
             )
 
             if progress_callback:
@@ -64,15 +74,24 @@ class YouTubeService:
             logger.error(f"YouTube 데이터 수집 실패: {e}")
             raise DataCollectionError(f"YouTube 데이터 수집 실패: {e}")
 
-    def analyze_comments(self, comments: list[dict]) -> dict:
+    def analyze_comments(self, comments: list[dict], dedup_comments: bool = True) -> dict:
         """댓글 분석 (페인/게인 포인트)"""
-        pain_points = self._client._extract_pain_points(comments)
-        gain_points = self._client._extract_gain_points(comments)
+        # 한 번만 배치로 변환해 페인/게인 추출과 통계에 재사용
+        batch = CommentBatch.from_dicts(comments)
+        # 복붙/유사 댓글은 대표 하나로 합쳐 페인/게인 포인트가 도배되지 않게 함
+        unique = collapse_near_duplicates(batch) if dedup_comments else batch
+        pain = analyze_pain_points(unique)
+        gain = analyze_gain_points(unique)
+        pain_points = pain["points"]
+        gain_points = gain["points"]
 
         return {
-            "total_comments": len(comments),
+            "total_comments": len(batch),
+            "unique_comments": len(unique),
             "pain_points": pain_points,
             "gain_points": gain_points,
             "pain_count": len(pain_points),
             "gain_count": len(gain_points),
+            "comment_stats": unique.stats(),
+            "keyword_stats": {"pain": pain["summary"], "gain": gain["summary"]},
         }
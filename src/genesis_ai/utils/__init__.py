@@ -1,6 +1,8 @@
 """
 유틸리티 패키지
 """
+from .bloom_filter import BloomFilter
+from .json_stream import IncrementalJSONParser
 from .logger import (
     get_logger,
     log_api_call,
@@ -35,4 +37,6 @@ __all__ = [
     "log_function",
     "log_app_start",
     "log_app_ready",
+    "BloomFilter",
+    "IncrementalJSONParser",
 ]
@@ -0,0 +1,60 @@
+"""
+블룸 필터
+이미 본 ID를 적은 메모리로 기억하기 위한 확률적 집합
+"""
+import hashlib
+import math
+import struct
+
+# 직렬화 헤더: 비트 수(uint32) + 해시 함수 수(uint8) + 추가된 항목 수(uint32)
+_HEADER = struct.Struct("<IBI")
+
+
+class BloomFilter:
+    """블룸 필터 (거짓 양성은 있을 수 있지만 거짓 음성은 없음)"""
+
+    def __init__(self, capacity: int = 1000, error_rate: float = 0.01) -> None:
+        # 목표 용량/오탐률로부터 최적 비트 수와 해시 함수 수 계산
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._size = max(size, 8)
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        """더블 해싱으로 k개의 비트 위치 계산"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hash_count)]
+
+    def add(self, item: str) -> None:
+        """항목 추가"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """추가된 항목 수 (중복 추가 포함)"""
+        return self._count
+
+    def to_bytes(self) -> bytes:
+        """바이트로 직렬화"""
+        return _HEADER.pack(self._size, self._hash_count, self._count) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """바이트에서 복원"""
+        size, hash_count, count = _HEADER.unpack_from(data)
+        bloom = cls.__new__(cls)
+        bloom._size = size
+        bloom._hash_count = hash_count
+        bloom._count = count
+        bloom._bits = bytearray(data[_HEADER.size :])
+        return bloom
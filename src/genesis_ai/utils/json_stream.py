@@ -0,0 +1,86 @@
+"""
+증분 JSON 파서
+스트리밍으로 조각조각 도착하는 JSON 객체에서 최상위 필드를 완성되는 즉시 꺼냄
+"""
+import json
+from typing import Any
+
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체의 필드 단위 증분 파서
+
+    feed()로 텍스트 조각을 넣으면 이번 조각으로 값이 완성된 최상위 필드를 (키, 값) 목록으로
+    돌려줍니다. 첫 '{' 이전의 텍스트(```json 펜스 등)는 무시하고, 이미 훑은 위치부터 이어서
+    스캔하므로 전체 비용은 입력 길이에 비례합니다.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: int | None = None
+        self._done = False
+        self.fields: dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """텍스트 조각 추가 → 새로 완성된 (키, 값) 목록"""
+        if self._done or not chunk:
+            return []
+        self._text += chunk
+        completed: list[tuple[str, Any]] = []
+        text = self._text
+
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                if self._depth == 1 and self._member_start is None:
+                    self._member_start = pos
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1 and char != "{":
+                    # 최상위가 객체가 아니면 필드 단위로 꺼낼 수 없음
+                    self._done = True
+                    break
+            elif char in "}]":
+                if self._depth == 1:
+                    self._emit(text, pos, completed)
+                    self._depth = 0
+                    self._done = True
+                    break
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                self._emit(text, pos, completed)
+
+        self._pos = len(text)
+        return completed
+
+    def _emit(self, text: str, end: int, completed: list[tuple[str, Any]]) -> None:
+        """member_start부터 end 직전까지의 "키": 값 한 쌍 파싱"""
+        if self._member_start is None:
+            return
+        member = text[self._member_start:end]
+        self._member_start = None
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return
+        for key, value in parsed.items():
+            self.fields[key] = value
+            completed.append((key, value))
@@ -0,0 +1,131 @@
+"""
+댓글 컬럼형 배치 및 키워드 추출 단위 테스트
+"""
+import math
+
+import pytest
+
+from src.genesis_ai.config.constants import PAIN_KEYWORDS
+from src.genesis_ai.core.analysis import (
+    CommentBatch,
+    StringColumn,
+    analyze_pain_points,
+    extract_gain_points,
+    extract_pain_points,
+)
+
+
+@pytest.fixture
+def sample_comments():
+    """테스트용 댓글 목록"""
+    return [
+        {"text": "효과 좋아요", "likes": 5, "author": "a", "published_at": "2024-01-02T00:00:00Z"},
+        {"text": "냄새가 너무 심해서 실망", "likes": 12, "author": "b", "published_at": "2024-01-01T00:00:00Z"},
+        {"text": "그냥 그래요", "likes": 0, "author": "c", "published_at": ""},
+        {"text": "환불했어요 별로", "likes": 3, "author": "d", "published_at": "2024-01-03T00:00:00Z"},
+    ]
+
+
+def _legacy_extract(comments, keywords):
+    """리팩토링 전 dict 루프 방식 (비교 기준)"""
+    points = []
+    for comment in comments:
+        for keyword in keywords:
+            if keyword in comment["text"]:
+                points.append({"text": comment["text"][:200], "keyword": keyword, "likes": comment["likes"]})
+                break
+    return points[:10]
+
+
+class TestStringColumn:
+    """StringColumn 테스트"""
+
+    def test_roundtrip(self):
+        """값 보존"""
+        column = StringColumn.from_values(["가나", "", "다라마"])
+        assert list(column) == ["가나", "", "다라마"]
+
+    def test_rows_containing_does_not_cross_rows(self):
+        """행 경계를 넘는 매치 방지"""
+        column = StringColumn.from_values(["ab", "cd", "abab"])
+        assert column.rows_containing("bc") == []
+        assert column.rows_containing("ab") == [0, 2]
+
+    def test_concat(self):
+        """컬럼 병합"""
+        merged = StringColumn.concat([StringColumn.from_values(["a"]), StringColumn.from_values(["b", "c"])])
+        assert list(merged) == ["a", "b", "c"]
+        assert merged.rows_containing("c") == [2]
+
+
+class TestCommentBatch:
+    """CommentBatch 테스트"""
+
+    def test_to_dicts_roundtrip(self, sample_comments):
+        """dict 변환 호환성"""
+        batch = CommentBatch.from_dicts(sample_comments)
+        assert batch.to_dicts() == sample_comments
+
+    def test_top_indices(self, sample_comments):
+        """좋아요 순 정렬"""
+        batch = CommentBatch.from_dicts(sample_comments)
+        assert batch.top_indices(2) == [1, 0]
+
+    def test_stats(self, sample_comments):
+        """기본 통계"""
+        stats = CommentBatch.from_dicts(sample_comments).stats()
+        assert stats["count"] == 4
+        assert stats["total_likes"] == 20
+        assert stats["max_likes"] == 12
+        assert stats["first_published_at"] == "2024-01-01T00:00:00Z"
+        assert stats["last_published_at"] == "2024-01-03T00:00:00Z"
+
+    def test_missing_timestamp_is_nan(self, sample_comments):
+        """작성시각 누락 처리"""
+        batch = CommentBatch.from_dicts(sample_comments)
+        assert math.isnan(batch.timestamps[2])
+
+    def test_empty_batch(self):
+        """빈 배치"""
+        batch = CommentBatch.concat([])
+        assert len(batch) == 0
+        assert batch.stats()["count"] == 0
+        assert extract_pain_points(batch) == []
+
+
+class TestKeywordExtraction:
+    """키워드 추출 테스트"""
+
+    def test_matches_legacy_behavior(self, sample_comments):
+        """기존 dict 루프와 동일한 결과"""
+        assert extract_pain_points(sample_comments) == _legacy_extract(sample_comments, PAIN_KEYWORDS)
+
+    def test_first_keyword_in_list_order(self):
+        """목록상 먼저 나오는 키워드 우선"""
+        comments = [{"text": "반품하고 실망", "likes": 1}]
+        assert extract_pain_points(comments)[0]["keyword"] == "실망"
+
+    def test_limit(self):
+        """최대 10개 제한"""
+        comments = [{"text": f"최고 {i}", "likes": i} for i in range(30)]
+        assert len(extract_gain_points(CommentBatch.from_dicts(comments))) == 10
+
+    def test_summary_counts_every_keyword_hit(self):
+        """키워드 빈도/좋아요 가중/동시 출현 요약"""
+        comments = [
+            {"text": "냄새 때문에 환불", "likes": 6},
+            {"text": "냄새가 심해요", "likes": 2},
+            {"text": "배송 빠르고 좋아요", "likes": 10},
+            {"text": "별로예요", "likes": 2},
+        ]
+        result = analyze_pain_points(comments)
+        summary = result["summary"]
+        by_keyword = {s["keyword"]: s for s in summary["keywords"]}
+
+        assert result["points"] == extract_pain_points(comments)
+        assert summary["total_comments"] == 4
+        assert summary["matched_comments"] == 3
+        assert by_keyword["냄새"]["count"] == 2
+        assert by_keyword["냄새"]["ratio"] == pytest.approx(0.667)
+        assert by_keyword["냄새"]["like_ratio"] == pytest.approx(0.8)
+        assert summary["co_occurrence"] == [{"keywords": ["냄새", "환불"], "count": 1}]
@@ -0,0 +1,59 @@
+"""
+유사 중복 댓글 병합 단위 테스트
+"""
+from unittest.mock import MagicMock
+
+from src.genesis_ai.core.analysis import (
+    CommentBatch,
+    NearDuplicateClusterer,
+    collapse_near_duplicates,
+    normalize_comment,
+)
+from src.genesis_ai.services.youtube_service import YouTubeService
+
+
+def test_normalize_comment():
+    """공백/문장부호 제거"""
+    assert normalize_comment("효과 좋아요!!") == normalize_comment("효과좋아요")
+    assert normalize_comment("👍👍") == "👍👍"
+
+
+def test_cluster_groups_near_duplicates():
+    """유사 댓글 클러스터링"""
+    batch = CommentBatch.from_dicts([
+        {"text": "효과 좋아요", "likes": 1},
+        {"text": "바퀴벌레가 싹 사라졌어요 최고", "likes": 2},
+        {"text": "효과 좋아요!!", "likes": 4},
+        {"text": "바퀴벌레가 싹 사라졌어요 최고예요", "likes": 1},
+        {"text": "냄새가 너무 심해요", "likes": 0},
+    ])
+    assert NearDuplicateClusterer().cluster(batch) == [[0, 2], [1, 3], [4]]
+
+
+def test_collapse_aggregates_likes():
+    """대표 댓글 선택 및 좋아요 합산"""
+    batch = CommentBatch.from_dicts([
+        {"text": "효과 좋아요", "likes": 1},
+        {"text": "효과 좋아요!!", "likes": 4},
+        {"text": "냄새 별로", "likes": 2},
+    ])
+    collapsed = collapse_near_duplicates(batch)
+    assert list(collapsed.texts) == ["효과 좋아요!!", "냄새 별로"]
+    assert list(collapsed.likes) == [5, 2]
+
+
+def test_collapse_empty():
+    """빈 배치"""
+    assert len(collapse_near_duplicates(CommentBatch.empty())) == 0
+
+
+def test_service_analyze_comments_collapses_duplicates():
+    """서비스 댓글 분석도 유사 중복을 병합"""
+    comments = [{"text": "냄새가 너무 심해요", "likes": 1}] * 5 + [{"text": "환불했어요", "likes": 2}]
+    service = YouTubeService(client=MagicMock())
+
+    result = service.analyze_comments(comments)
+    assert result["total_comments"] == 6
+    assert result["unique_comments"] == 2
+    assert result["pain_count"] == 2
+    assert service.analyze_comments(comments, dedup_comments=False)["pain_count"] == 6
@@ -0,0 +1,141 @@
+"""
+증분 댓글 수집 (워터마크 저장소) 단위 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.genesis_ai.infrastructure.clients.youtube_client import YouTubeClient
+from src.genesis_ai.infrastructure.storage.comment_store import CommentCorpusStore
+from src.genesis_ai.utils.bloom_filter import BloomFilter
+
+
+def _item(comment_id: str, text: str, published_at: str, likes: int = 0) -> dict:
+    """commentThreads 응답 항목"""
+    return {
+        "id": comment_id,
+        "snippet": {
+            "topLevelComment": {
+                "snippet": {
+                    "textDisplay": text,
+                    "likeCount": likes,
+                    "authorDisplayName": "tester",
+                    "publishedAt": published_at,
+                }
+            }
+        },
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉토리 저장소"""
+    return CommentCorpusStore(tmp_path)
+
+
+class TestBloomFilter:
+    """BloomFilter 테스트"""
+
+    def test_membership_and_roundtrip(self):
+        """추가한 항목 조회 및 직렬화"""
+        bloom = BloomFilter(capacity=100)
+        for i in range(100):
+            bloom.add(f"id-{i}")
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert all(f"id-{i}" in restored for i in range(100))
+        assert len(restored) == 100
+
+
+class TestCommentCorpusStore:
+    """CommentCorpusStore 테스트"""
+
+    def test_merge_updates_watermark(self, store):
+        """병합 후 워터마크 갱신"""
+        added = store.merge("벅스델타", "v1", [
+            {"comment_id": "c1", "text": "a", "likes": 1, "published_at": "2024-01-01T00:00:00Z"},
+            {"comment_id": "c2", "text": "b", "likes": 2, "published_at": "2024-01-05T00:00:00Z"},
+        ])
+        watermark = store.get_watermark("벅스델타", "v1")
+        assert added == 2
+        assert "c1" in watermark.seen
+        assert watermark.published_after == pytest.approx(1704412800.0)
+
+    def test_merge_skips_seen_comments(self, store):
+        """이미 저장된 댓글은 중복 저장하지 않음"""
+        comment = {"comment_id": "c1", "text": "a", "likes": 1, "published_at": "2024-01-01T00:00:00Z"}
+        store.merge("p", "v1", [comment])
+        assert store.merge("p", "v1", [comment]) == 0
+        assert len(store.load_corpus("p")) == 1
+
+    def test_dedup_is_exact_beyond_bloom_capacity(self, store, monkeypatch):
+        """블룸 필터 용량을 넘어도 새 댓글은 누락 없이 저장"""
+        monkeypatch.setattr(
+            "src.genesis_ai.infrastructure.storage.comment_store.COMMENT_BLOOM_CAPACITY", 10
+        )
+        comments = [
+            {"comment_id": f"c{i}", "text": "a", "likes": 0, "published_at": "2024-01-01T00:00:00Z"}
+            for i in range(200)
+        ]
+        assert store.merge("p", "v1", comments[:100]) == 100
+        assert store.merge("p", "v1", comments) == 100
+        assert all(f"c{i}" in store.get_watermark("p", "v1").seen for i in range(200))
+
+    def test_unknown_video(self, store):
+        """수집 이력 없음"""
+        assert store.get_watermark("p", "nope") is None
+        assert store.load_comments("p", "nope") == []
+
+
+class TestIncrementalCollection:
+    """YouTubeClient 증분 수집 테스트"""
+
+    def test_second_run_fetches_only_new_comments(self, store):
+        """두 번째 실행은 워터마크 이후 댓글만 조회"""
+        client = YouTubeClient(api_key="test", comment_store=store)
+        youtube = MagicMock()
+        client._youtube = youtube
+
+        youtube.commentThreads().list().execute.return_value = {
+            "items": [_item("c1", "첫 댓글", "2024-01-01T00:00:00Z")]
+        }
+        first = client._collect_comments("p", "v1", incremental=True)
+        assert [c["comment_id"] for c in first] == ["c1"]
+
+        youtube.commentThreads().list().execute.return_value = {
+            "items": [
+                _item("c2", "새 댓글", "2024-01-02T00:00:00Z"),
+                _item("c1", "첫 댓글", "2024-01-01T00:00:00Z"),
+                _item("c0", "오래된 댓글", "2023-12-01T00:00:00Z"),
+            ]
+        }
+        second = client._collect_comments("p", "v1", incremental=True)
+        assert sorted(c["comment_id"] for c in second) == ["c1", "c2"]
+
+    def test_partial_fetch_keeps_watermark(self, store):
+        """다음 페이지 조회가 실패하면 새 댓글은 저장하되 워터마크는 유지"""
+        client = YouTubeClient(api_key="test", comment_store=store)
+        store.merge("p", "v1", [
+            {"comment_id": "c1", "text": "a", "likes": 0, "published_at": "2024-01-01T00:00:00Z"},
+        ])
+        youtube = MagicMock()
+        client._youtube = youtube
+        youtube.commentThreads().list().execute.side_effect = [
+            {"items": [_item("c3", "최신 댓글", "2024-01-03T00:00:00Z")], "nextPageToken": "next"},
+            RuntimeError("quota"),
+        ]
+
+        comments = client._collect_comments("p", "v1", incremental=True)
+        watermark = store.get_watermark("p", "v1")
+
+        assert sorted(c["comment_id"] for c in comments) == ["c1", "c3"]
+        assert watermark.published_after == pytest.approx(1704067200.0)
+
+    def test_seed_failure_does_not_write_watermark(self, store):
+        """첫 수집 실패 시 워터마크를 만들지 않아 다음 실행에서 다시 시드 수집"""
+        client = YouTubeClient(api_key="test", comment_store=store)
+        youtube = MagicMock()
+        client._youtube = youtube
+        youtube.commentThreads().list().execute.side_effect = RuntimeError("timeout")
+
+        assert client._collect_comments("p", "v1", incremental=True) == []
+        assert store.get_watermark("p", "v1") is None
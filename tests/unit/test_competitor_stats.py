@@ -0,0 +1,71 @@
+"""
+경쟁 상품 통계 엔진 단위 테스트
+"""
+import pytest
+
+from src.genesis_ai.core.analysis import auto_bin_edges, compute_competitor_stats, quantile
+
+
+def _product(price: int, brand: str = "", mall: str = "", categories: tuple = ()) -> dict:
+    """테스트용 상품"""
+    product = {"price": price, "brand": brand, "mall": mall}
+    for level, name in enumerate(categories, start=1):
+        product[f"category{level}"] = name
+    return product
+
+
+@pytest.fixture
+def products():
+    """브랜드/판매처/카테고리가 섞인 상품 목록"""
+    return [
+        _product(5000, "A", "몰1", ("생활", "해충", "살충제")),
+        _product(15000, "B", "몰1", ("생활", "해충", "모기향")),
+        _product(25000, "A", "몰2", ("생활", "해충", "살충제")),
+        _product(120000, "C", "몰3", ("가전", "제습기")),
+        _product(0, "A", "몰2", ("생활", "해충", "살충제")),
+    ]
+
+
+def test_legacy_keys_unchanged(products):
+    """기존 결과 키/값 유지"""
+    stats = compute_competitor_stats(products)
+    assert stats["total_products"] == 5
+    assert (stats["min_price"], stats["max_price"], stats["avg_price"]) == (5000, 120000, 41250)
+    assert stats["top_brands"] == ["A", "B", "C"]
+    assert stats["top_malls"] == ["몰1", "몰2", "몰3"]
+    assert stats["price_distribution"] == {
+        "0-10000": 1, "10000-30000": 2, "30000-50000": 0, "50000-100000": 0, "100000+": 1,
+    }
+
+
+def test_group_and_category_stats(products):
+    """브랜드별 가격 통계 및 카테고리 집계"""
+    stats = compute_competitor_stats(products)
+    brand_a = stats["brand_stats"][0]
+    assert brand_a == {
+        "name": "A", "count": 3, "min_price": 5000, "max_price": 25000,
+        "avg_price": 15000, "median_price": 15000,
+    }
+    assert stats["category_stats"]["category1"][0] == {"path": "생활", "count": 4, "avg_price": 15000}
+    assert stats["category_stats"]["category3"][0]["path"] == "생활 > 해충 > 살충제"
+    assert stats["category_stats"]["category4"] == []
+    assert stats["quantiles"]["p50"] == 20000
+
+
+def test_custom_and_auto_bins():
+    """사용자 지정/자동 가격 구간"""
+    products = [_product(price) for price in range(1000, 101000, 1000)]
+    custom = compute_competitor_stats(products, bin_edges=[50000])
+    assert custom["price_distribution"] == {"0-50000": 49, "50000+": 51}
+
+    edges = auto_bin_edges([p["price"] for p in products])
+    assert edges == sorted(edges) and 2 <= len(edges) <= 12
+    auto = compute_competitor_stats(products, bin_edges="auto")
+    assert sum(b["count"] for b in auto["price_bins"]) == 100
+
+
+def test_empty_inputs():
+    """상품 없음 / 가격 없음"""
+    assert compute_competitor_stats([])["total_products"] == 0
+    assert compute_competitor_stats([_product(0, "A")])["top_brands"] == []
+    assert quantile([], 0.5) == 0.0
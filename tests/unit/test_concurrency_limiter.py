@@ -0,0 +1,99 @@
+"""
+적응형 동시 호출 제한기(AIMD) 단위 테스트
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.genesis_ai.core.exceptions import GeminiAPIError, RateLimitExceededError
+from src.genesis_ai.infrastructure.clients.gemini_client import GeminiClient
+from src.genesis_ai.infrastructure.resilience import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiterRegistry,
+)
+
+
+class ResourceExhausted(Exception):
+    """genai ClientError 모양의 429 오류"""
+
+    code = 429
+
+
+def test_additive_increase_and_single_decrease_per_congestion():
+    """성공마다 1/한도씩 증가, 같은 혼잡 구간의 429 여러 건은 한 번만 절반으로 감소"""
+    limiter = AdaptiveConcurrencyLimiter("gemini", initial_limit=2, max_limit=8)
+    for _ in range(3):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 3  # 2 → 2.5 → 2.9 → 3.24
+
+    tokens = [limiter.acquire() for _ in range(3)]
+    for token in tokens:
+        limiter.release(token, ResourceExhausted("429 RESOURCE_EXHAUSTED"))
+    assert limiter.limit == 1
+    assert limiter.stats["throttles"] == 3
+    assert limiter.stats["decreases"] == 1
+
+    # 감소 이후 시작한 호출의 429는 다시 반영 (최소 한도 아래로는 내려가지 않음)
+    limiter.release(limiter.acquire(), GeminiAPIError("실패", {"status_code": 429}))
+    assert limiter.limit == 1
+    assert limiter.stats["decreases"] == 2
+
+    # 호출량 제한이 아닌 오류는 한도를 바꾸지 않음
+    limiter.release(limiter.acquire(), ValueError("파싱"))
+    assert limiter.stats == {
+        "limit": 1, "in_flight": 0, "queued": 0, "successes": 3, "throttles": 4, "decreases": 2,
+    }
+
+
+def test_waiters_are_queued_until_a_slot_frees():
+    """한도가 차면 대기(queue depth로 노출), 자리가 나면 진행, 대기 시간 초과는 오류"""
+    limiter = AdaptiveConcurrencyLimiter("gemini", initial_limit=1, acquire_timeout=5)
+    token = limiter.acquire()
+    done = threading.Event()
+
+    def worker():
+        limiter.release(limiter.acquire())
+        done.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while limiter.stats["queued"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert limiter.stats["queued"] == 1
+    assert not done.is_set()
+
+    limiter.release(token)
+    thread.join(timeout=5)
+    assert done.is_set()
+    assert limiter.stats["queued"] == 0
+
+    impatient = AdaptiveConcurrencyLimiter("veo", initial_limit=1, acquire_timeout=0.01)
+    impatient.acquire()
+    with pytest.raises(RateLimitExceededError):
+        impatient.acquire()
+
+
+def test_gemini_calls_go_through_model_limiter():
+    """GeminiClient 호출은 모델 ID별 제한기를 거치고, 429 후 재시도는 줄어든 한도로 진행"""
+    registry = ConcurrencyLimiterRegistry()
+    client = GeminiClient(project_id="p", location="l", concurrency_limiters=registry)
+    client._retry_policy._sleep = lambda _: None
+    outcomes = [ResourceExhausted("429"), SimpleNamespace(text="ok")]
+
+    def generate_content(**kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client._client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+
+    assert client.generate_text("안녕", use_cache=False) == "ok"
+    stats = registry.stats()["gemini-3-pro-preview"]
+    assert stats["throttles"] == 1
+    assert stats["successes"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["limit"] == 2
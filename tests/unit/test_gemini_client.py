@@ -0,0 +1,214 @@
+"""
+GeminiClient 프롬프트 구성 단위 테스트
+"""
+import threading
+from types import SimpleNamespace
+
+from src.genesis_ai.core.models import MarketingAnalysis
+from src.genesis_ai.infrastructure.cache import ResponseCache
+from src.genesis_ai.infrastructure.clients.gemini_client import GeminiClient
+from src.genesis_ai.infrastructure.telemetry import UsageLedger
+
+
+class FakeModels:
+    """generate_content 호출 기록"""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls: list[dict] = []
+
+    def generate_content(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(text=self.text)
+
+
+ANALYSIS = '{"target_audience": {"primary": "주부"}, "hook_suggestions": ["훅"], "summary": "요약"}'
+
+
+def _client(text: str = ANALYSIS) -> tuple[GeminiClient, FakeModels]:
+    client = GeminiClient(project_id="p", location="l", prompt_token_budget=500)
+    models = FakeModels(text)
+    client._client = SimpleNamespace(models=models)
+    return client, models
+
+
+def test_analyze_marketing_data_uses_packed_prompt():
+    """수집 데이터는 압축 텍스트로 들어가고 절감 토큰이 결과에 기록됨"""
+    client, models = _client()
+    products = [
+        {"rank": i, "title": f"상품 {i}", "price": 1000 + i, "image": "https://img/x", "link": "https://y"}
+        for i in range(1, 1001)
+    ]
+    naver_data = {"products": products, "competitor_stats": {"total_products": 1000, "min_price": 1001}}
+
+    result = client.analyze_marketing_data({}, naver_data, "벅스델타", use_search_grounding=False)
+
+    prompt = models.calls[0]["contents"]
+    assert "https://" not in prompt
+    assert "상품 1000개" in prompt
+    assert result["summary"] == "요약"
+    assert result["_prompt_stats"]["saved_tokens"] > 0
+    assert result["_prompt_stats"]["tokens"] <= 500
+
+
+def test_analysis_response_cached_and_bypassable(tmp_path):
+    """같은 입력은 캐시 응답을 쓰고, use_cache=False면 다시 호출"""
+    client, models = _client()
+    client._response_cache = ResponseCache(tmp_path)
+    naver_data = {"competitor_stats": {"total_products": 3, "min_price": 1000}}
+
+    first = client.analyze_marketing_data({}, naver_data, "벅스델타", use_search_grounding=False)
+    second = client.analyze_marketing_data({}, naver_data, "벅스델타", use_search_grounding=False)
+    assert len(models.calls) == 1
+    assert second["summary"] == first["summary"]
+
+    client.analyze_marketing_data({}, naver_data, "벅스델타", use_search_grounding=False, use_cache=False)
+    assert len(models.calls) == 2
+
+
+def test_analysis_parsed_by_schema_without_regeneration(tmp_path):
+    """응답 스키마로 생성하고 한 번에 파싱, 스키마에 맞지 않으면 재생성/캐시 없이 오류 반환"""
+    client, models = _client()
+    result = client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False, use_cache=False)
+    assert models.calls[0]["config"].response_schema is MarketingAnalysis
+    assert result["target_audience"]["pain_points"] == []
+    assert result["competitor_analysis"]["price_range"] == ""
+
+    client, models = _client('설명 {"summary": "요약"} 끝')
+    client._response_cache = ResponseCache(tmp_path)
+    result = client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False)
+    assert "스키마 검증 실패" in result["error"]
+    assert len(models.calls) == 1
+    assert len(client.response_cache) == 0
+
+
+def test_multiple_thumbnails_run_concurrently_and_keep_order():
+    """동시 생성, 진행 콜백은 완료 순, 결과는 원래 순서, 실패는 제외"""
+    client, _ = _client()
+    started = threading.Barrier(3, timeout=5)
+    release = {"첫째": threading.Event(), "둘째": threading.Event(), "셋째": threading.Event()}
+
+    def fake_thumbnail(product, hook_text, style, progress_callback=None, use_cache=True):
+        started.wait()  # 세 작업이 동시에 시작되어야 통과
+        release[hook_text].wait(timeout=5)
+        return None if hook_text == "둘째" else hook_text.encode()
+
+    def on_progress(message: str, _: int) -> None:
+        # 셋째 → 둘째 → 첫째 순으로 끝나도록 완료 통지를 받을 때 다음 작업을 풀어줌
+        messages.append(message)
+        if message.endswith("셋째"):
+            release["둘째"].set()
+        elif message.endswith("둘째"):
+            release["첫째"].set()
+
+    client.generate_thumbnail = fake_thumbnail
+    messages: list[str] = []
+    release["셋째"].set()
+
+    results = client.generate_multiple_thumbnails(
+        {"name": "벅스델타"}, ["첫째", "둘째", "셋째"],
+        progress_callback=on_progress,
+        max_concurrency=3,
+    )
+
+    assert [r["hook_text"] for r in results] == ["첫째", "셋째"]
+    assert [r["style"] for r in results] == ["드라마틱", "모던"]
+    completed = [m for m in messages if m.startswith("썸네일 ") and "/" in m]
+    assert completed == ["썸네일 1/3 완료: 셋째", "썸네일 2/3 실패: 둘째", "썸네일 3/3 완료: 첫째"]
+
+
+def test_analysis_streams_fields_to_callback():
+    """field_callback이 있으면 스트리밍으로 받아 필드가 완성될 때마다 호출"""
+    response = '{"target_audience": {"primary": "주부"}, "hook_suggestions": ["훅"], "keywords": ["살충제"]}'
+    client, models = _client(response)
+
+    def fake_stream(**kwargs):
+        models.calls.append(kwargs)
+        for i in range(0, len(response), 5):
+            yield SimpleNamespace(text=response[i:i + 5])
+
+    models.generate_content_stream = fake_stream
+    fields: list[str] = []
+
+    result = client.analyze_marketing_data(
+        {}, {}, "벅스델타", use_search_grounding=False,
+        field_callback=lambda field, value: fields.append(field),
+    )
+
+    assert fields == ["target_audience", "hook_suggestions", "keywords"]
+    assert result["keywords"] == ["살충제"]
+
+
+GOOD_ANALYSIS = (
+    '{"target_audience": {"primary": "주부"}, "hook_suggestions": ["벌레 싹!", "3초 컷", "냄새 없이"],'
+    ' "keywords": ["살충제", "바퀴벌레", "무향"], "summary": "요약"}'
+)
+
+
+class TieredModels:
+    """모델 ID별 응답 텍스트를 돌려주는 generate_content (usage_metadata 포함)"""
+
+    def __init__(self, responses: dict[str, str]) -> None:
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def generate_content(self, **kwargs):
+        self.calls.append(kwargs["model"])
+        metadata = SimpleNamespace(
+            prompt_token_count=1000, candidates_token_count=200,
+            cached_content_token_count=0, thoughts_token_count=0,
+        )
+        return SimpleNamespace(text=self.responses[kwargs["model"]], usage_metadata=metadata)
+
+
+def _cascade_client(responses: dict[str, str]) -> tuple[GeminiClient, TieredModels, UsageLedger]:
+    ledger = UsageLedger()
+    client = GeminiClient(project_id="p", location="l", fast_model="gemini-2.5-flash", usage_ledger=ledger)
+    models = TieredModels(responses)
+    client._client = SimpleNamespace(models=models)
+    return client, models, ledger
+
+
+def test_cascade_answers_from_fast_model_when_checks_pass():
+    """빠른 모델 응답이 스키마/품질 검사를 통과하면 pro 모델을 호출하지 않음"""
+    client, models, ledger = _cascade_client({"gemini-2.5-flash": GOOD_ANALYSIS})
+
+    result = client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False)
+
+    assert models.calls == ["gemini-2.5-flash"]
+    assert result["_cascade"]["tier"] == "fast"
+    assert result["_cascade"]["escalation_reason"] is None
+    assert result["_cascade"]["cost_saved_usd"] > 0
+    assert ledger.snapshot().calls[0].tier == "fast"
+
+
+def test_cascade_escalates_on_schema_or_quality_failure_and_final_skips_fast():
+    """스키마/품질 검사 실패 시에만 pro로 상향, final 요청은 처음부터 pro"""
+    client, models, ledger = _cascade_client({
+        "gemini-2.5-flash": '{"summary": "타겟 없음"}',
+        "gemini-3-pro-preview": GOOD_ANALYSIS,
+    })
+
+    result = client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False)
+    assert models.calls == ["gemini-2.5-flash", "gemini-3-pro-preview"]
+    assert result["_cascade"]["tier"] == "pro"
+    assert "스키마 검증 실패" in result["_cascade"]["escalation_reason"]
+    fast_call = ledger.snapshot().calls[0]
+    assert fast_call.cost_saved_usd == -fast_call.cost_usd
+
+    models.responses["gemini-2.5-flash"] = ANALYSIS  # 스키마는 맞지만 훅/키워드 부족
+    client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False, use_cache=False)
+    assert models.calls[2:] == ["gemini-2.5-flash", "gemini-3-pro-preview"]
+
+    client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False, quality="final")
+    assert models.calls[4:] == ["gemini-3-pro-preview"]
+
+
+def test_generate_text_validator_escalates():
+    """텍스트 생성은 caller의 validator가 실패 사유를 돌려줄 때 상향"""
+    client, models, _ = _cascade_client({"gemini-2.5-flash": "짧음", "gemini-3-pro-preview": "충분히 긴 훅 문구"})
+
+    text = client.generate_text("훅 다듬기", use_cache=False, validator=lambda t: "너무 짧음" if len(t) < 5 else None)
+
+    assert text == "충분히 긴 훅 문구"
+    assert models.calls == ["gemini-2.5-flash", "gemini-3-pro-preview"]
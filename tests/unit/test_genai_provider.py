@@ -0,0 +1,42 @@
+"""
+공용 genai 클라이언트 제공자 단위 테스트
+"""
+import threading
+
+from google.oauth2.credentials import Credentials
+
+from src.genesis_ai.infrastructure.clients import GeminiClient, GenaiClientProvider, VeoClient
+
+
+def test_concurrent_get_creates_one_client_per_region_on_one_transport():
+    """여러 스레드가 동시에 요청해도 (프로젝트, 리전)별 클라이언트는 하나, 연결 풀은 전체에서 하나"""
+    provider = GenaiClientProvider(credentials=Credentials(token="test"))
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(provider.get("project", "us-central1"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in results}) == 1
+    other = provider.get("project", "global")
+    assert other is not results[0]
+    assert other._api_client._httpx_client is results[0]._api_client._httpx_client
+    assert provider.stats["clients"] == 2
+    provider.close()
+    assert provider.stats["clients"] == 0
+
+
+def test_gemini_and_veo_share_the_provider_client():
+    """같은 제공자를 쓰는 GeminiClient/VeoClient는 같은 genai.Client를 사용"""
+    provider = GenaiClientProvider(credentials=Credentials(token="test"))
+    gemini = GeminiClient("project", "us-central1", genai_provider=provider)
+    veo = VeoClient("project", "us-central1", "bucket", genai_provider=provider)
+    assert gemini._get_client() is veo._get_client()
+    provider.close()
@@ -0,0 +1,120 @@
+"""
+요청 헤징 단위 테스트
+"""
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+
+from src.genesis_ai.infrastructure.clients.gemini_client import GeminiClient
+from src.genesis_ai.infrastructure.resilience import HedgeBudget, LatencyTracker, RequestHedger
+from src.genesis_ai.infrastructure.telemetry import UsageLedger
+
+
+def _warmed_hedger(key: str, ratio: float = 1.0, samples: int = 20, seconds: float = 0.01) -> RequestHedger:
+    """key에 지연 표본을 미리 채운 헤저 (헤지 대기 시간 = seconds)"""
+    tracker = LatencyTracker()
+    for _ in range(samples):
+        tracker.record(key, seconds)
+    return RequestHedger(
+        budget=HedgeBudget(ratio), tracker=tracker, min_samples=samples, min_delay=0.0
+    )
+
+
+def _slow_first(release: threading.Event):
+    """첫 호출은 release까지 대기, 이후 호출은 즉시 응답하는 함수"""
+    counter = itertools.count()
+
+    def func():
+        index = next(counter)
+        if index == 0:
+            release.wait(5)
+        return f"call-{index}"
+
+    return func
+
+
+def test_latency_quantile_and_budget_cap():
+    """p90은 최근접 순위, 헤지는 전체 요청 수의 ratio 이하로만 허용"""
+    tracker = LatencyTracker(window=10)
+    for seconds in range(1, 11):
+        tracker.record("m", float(seconds))
+    assert tracker.quantile("m", 0.9) == 9.0
+    assert tracker.quantile("other", 0.9) is None
+
+    budget = HedgeBudget(0.05)
+    for _ in range(19):
+        budget.record_request()
+    assert budget.try_acquire() is False
+    budget.record_request()
+    assert budget.try_acquire() is True
+    assert budget.try_acquire() is False
+    assert budget.stats == {"requests": 20, "hedges": 1, "denied": 2}
+
+
+def test_no_hedge_without_enough_samples():
+    """표본이 부족하면 첫 요청만 보냄 (지연 시간은 표본으로 쌓임)"""
+    hedger = RequestHedger(budget=HedgeBudget(1.0), min_samples=3)
+    assert hedger.hedge_delay("k") is None
+    assert hedger.call("k", lambda: "ok") == "ok"
+    assert hedger.tracker.count("k") == 1
+    assert hedger.budget.stats["hedges"] == 0
+
+
+def test_slow_primary_is_hedged_and_loser_reported():
+    """첫 요청이 p90을 넘기면 헤지 요청의 응답을 쓰고, 늦게 끝난 첫 요청은 on_discarded로 전달"""
+    hedger = _warmed_hedger("k")
+    release = threading.Event()
+    discarded: list[str] = []
+    reported = threading.Event()
+
+    def on_discarded(result: str) -> None:
+        discarded.append(result)
+        reported.set()
+
+    assert hedger.call("k", _slow_first(release), on_discarded=on_discarded) == "call-1"
+    release.set()
+    assert reported.wait(5)
+    assert discarded == ["call-0"]
+    assert hedger.budget.stats["hedges"] == 1
+
+
+def test_budget_exhausted_waits_for_primary():
+    """예산이 없으면 헤지 없이 첫 요청 응답을 기다림"""
+    hedger = _warmed_hedger("k", ratio=0.0)
+    release = threading.Event()
+    threading.Timer(0.05, release.set).start()
+    assert hedger.call("k", _slow_first(release)) == "call-0"
+    assert hedger.budget.stats == {"requests": 1, "hedges": 0, "denied": 1}
+
+
+def test_gemini_text_generation_hedges_and_records_discarded_usage():
+    """텍스트 생성은 헤지 응답을 쓰고, 버려진 응답 비용은 hedge 티어 손실로 기록"""
+    hedger = _warmed_hedger("gemini-3-pro-preview:Gemini 텍스트 생성")
+    ledger = UsageLedger()
+    client = GeminiClient("p", "l", hedger=hedger, usage_ledger=ledger)
+    release = threading.Event()
+    counter = itertools.count()
+
+    def generate_content(**_):
+        index = next(counter)
+        if index == 0:
+            release.wait(5)
+        usage = SimpleNamespace(
+            prompt_token_count=100, candidates_token_count=10,
+            cached_content_token_count=0, thoughts_token_count=0,
+        )
+        return SimpleNamespace(text=f"응답-{index}", usage_metadata=usage)
+
+    client._client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+
+    assert client.generate_text("프롬프트", use_cache=False, quality="final") == "응답-1"
+    release.set()
+    for _ in range(100):
+        if len(ledger.snapshot().calls) == 2:
+            break
+        time.sleep(0.01)
+    calls = ledger.snapshot().calls
+    assert sorted(call.tier for call in calls) == ["hedge", "pro"]
+    hedge_call = next(call for call in calls if call.tier == "hedge")
+    assert hedge_call.cost_saved_usd == -hedge_call.cost_usd
@@ -0,0 +1,43 @@
+"""
+증분 JSON 파서 단위 테스트
+"""
+import json
+
+from src.genesis_ai.utils import IncrementalJSONParser
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_fields_emitted_as_soon_as_complete():
+    """필드는 다음 구분자(, 또는 })가 도착하는 즉시 완성"""
+    parser = IncrementalJSONParser()
+
+    assert parser.feed('{"target_audience": {"primary": "주부", "pain_points": ["냄') == []
+    assert parser.feed('새"]}, "hook') == [
+        ("target_audience", {"primary": "주부", "pain_points": ["냄새"]})
+    ]
+    assert parser.feed('_suggestions": ["a, b", "c}"]') == []
+    assert parser.feed(', "keywords": []}') == [
+        ("hook_suggestions", ["a, b", "c}"]),
+        ("keywords", []),
+    ]
+    assert parser.done
+
+
+def test_any_chunking_matches_json_loads():
+    """조각 크기와 무관하게 json.loads와 같은 결과 (이스케이프/펜스 포함)"""
+    payload = {
+        "summary": '따옴표 \\" 와 역슬래시 \\\\ 포함',
+        "nested": {"a": [1, {"b": "}"}], "c": None},
+        "keywords": ["x", "y"],
+        "score": 3.5,
+    }
+    text = "```json\n" + json.dumps(payload, ensure_ascii=False, indent=2) + "\n```"
+
+    for size in (1, 3, 7, len(text)):
+        parser = IncrementalJSONParser()
+        for chunk in _chunks(text, size):
+            parser.feed(chunk)
+        assert parser.fields == payload
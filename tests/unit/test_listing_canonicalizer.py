@@ -0,0 +1,48 @@
+"""
+네이버 상품 정규화 단위 테스트
+"""
+from src.genesis_ai.core.analysis import (
+    canonical_key,
+    canonicalize_listings,
+    clean_title,
+    normalize_title,
+)
+
+
+def test_clean_title():
+    """HTML 태그/엔티티 정리"""
+    assert clean_title("<b>벅스델타</b> &amp; 살충제  500ml") == "벅스델타 & 살충제 500ml"
+
+
+def test_normalize_title_ignores_quantity_and_order():
+    """용량/수량 토큰, 문장부호, 단어 순서 무시"""
+    assert normalize_title("[특가] 벅스델타 바퀴벌레 살충제 500ml x2") == normalize_title(
+        "벅스델타 살충제 바퀴벌레 1.5L 3개입"
+    )
+    assert normalize_title("홈키파 1+1") == "홈키파"
+
+
+def test_canonical_key_depends_on_brand():
+    """브랜드가 다르면 다른 상품"""
+    assert canonical_key("바퀴벌레 살충제", "A") != canonical_key("바퀴벌레 살충제", "B")
+
+
+def test_canonicalize_groups_offers():
+    """판매처별 항목을 대표 상품 + offers로 묶음"""
+    listings = [
+        {"product_id": "1", "rank": 1, "title": "<b>벅스델타</b> 살충제 500ml", "brand": "벅스델타",
+         "mall": "몰1", "price": 12000, "queries": ["벅스델타"]},
+        {"product_id": "2", "rank": 2, "title": "다른 상품", "brand": "", "mall": "몰1", "price": 5000},
+        {"product_id": "3", "rank": 3, "title": "벅스델타 살충제 2개", "brand": "벅스델타",
+         "mall": "몰2", "price": 9900, "queries": ["살충제"]},
+    ]
+
+    products = canonicalize_listings(listings)
+
+    assert len(products) == 2
+    first = products[0]
+    assert first["title"] == "벅스델타 살충제 500ml"
+    assert (first["price"], first["max_price"], first["mall"]) == (9900, 12000, "몰2")
+    assert first["offer_count"] == 2 and first["mall_count"] == 2
+    assert [o["product_id"] for o in first["offers"]] == ["1", "3"]
+    assert first["queries"] == ["벅스델타", "살충제"]
@@ -11,6 +11,7 @@ from src.genesis_ai.core.models import (
     PipelineProgress,
     PipelineStep,
     HookingPoint,
+    MarketingAnalysis,
     MarketingStrategy,
 )
 
@@ -129,3 +130,26 @@ class TestHookingPoint:
 
         with pytest.raises(ValidationError):
             HookingPoint(hook="테스트", hook_type="test", viral_score=-1)
+
+
+class TestMarketingStrategy:
+    """MarketingStrategy 모델 테스트"""
+
+    def test_from_analysis(self):
+        """스키마 응답 JSON → 분석 → 전략"""
+        analysis = MarketingAnalysis.model_validate_json(
+            '{"target_audience": {"primary": "주부", "pain_points": ["냄새"]},'
+            ' "hook_suggestions": ["벌레 싹!", "3초 컷"], "keywords": ["살충제"], "summary": "요약"}'
+        )
+        strategy = MarketingStrategy.from_analysis("벅스델타", analysis)
+
+        assert strategy.target_persona.pain_points == ["냄새"]
+        assert strategy.hook_texts == ["벌레 싹!", "3초 컷"]
+        assert strategy.hooking_points[0].hook_type == "suggestion"
+        assert strategy.keywords == ["살충제"]
+        assert strategy.competitor_analysis.key_features == []
+
+    def test_analysis_requires_target_audience(self):
+        """필수 필드가 없으면 검증 실패"""
+        with pytest.raises(ValidationError):
+            MarketingAnalysis.model_validate_json('{"summary": "요약"}')
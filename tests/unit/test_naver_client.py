@@ -0,0 +1,207 @@
+"""
+NaverClient 단위 테스트
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.genesis_ai.core.exceptions import NaverAPIError
+from src.genesis_ai.infrastructure.clients.naver_client import NaverClient
+
+
+def _response(status_code: int = 200, items: list[dict] | None = None) -> MagicMock:
+    """가짜 HTTP 응답"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = {"items": items or [], "total": len(items or [])}
+    return response
+
+
+@pytest.fixture
+def client():
+    """테스트용 클라이언트"""
+    naver = NaverClient(client_id="id", client_secret="secret")
+    yield naver
+    naver.close()
+
+
+class TestSession:
+    """연결 풀 세션 테스트"""
+
+    def test_session_has_default_headers(self, client):
+        """인증 헤더 사전 구성"""
+        session = client._get_session()
+        assert session.headers["X-Naver-Client-Id"] == "id"
+        assert session.headers["X-Naver-Client-Secret"] == "secret"
+
+    def test_session_reused_within_thread(self, client):
+        """같은 스레드에서는 세션 재사용"""
+        assert client._get_session() is client._get_session()
+
+    def test_threads_share_connection_pool(self, client):
+        """스레드별 세션이 같은 어댑터(연결 풀)를 공유"""
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(client._get_session()))
+        thread.start()
+        thread.join()
+
+        assert sessions[0] is not client._get_session()
+        assert sessions[0].get_adapter("https://x") is client._get_session().get_adapter("https://x")
+
+    def test_search_uses_session(self, client):
+        """검색 시 세션 사용 및 결과 변환"""
+        items = [{"productId": "1", "title": "<b>살충제</b>", "lprice": "1000"}]
+        with patch.object(client, "_get_session") as get_session:
+            get_session.return_value.get.return_value = _response(items=items)
+            products = client.search_shopping("살충제", display=1)
+
+        assert products[0]["title"] == "살충제"
+        assert products[0]["price"] == 1000
+
+    def test_search_error_status(self, client):
+        """비정상 응답 코드"""
+        with patch.object(client, "_get_session") as get_session:
+            get_session.return_value.get.return_value = _response(status_code=401)
+            with pytest.raises(NaverAPIError):
+                client.search_shopping("살충제")
+
+
+class TestRetry:
+    """429/5xx 재시도 테스트"""
+
+    def test_retries_server_errors(self, client):
+        """5xx 응답은 백오프 후 재시도"""
+        items = [{"productId": "1", "title": "살충제", "lprice": "1000"}]
+        with patch.object(client, "_get_session") as get_session, \
+                patch("src.genesis_ai.infrastructure.clients.naver_client.time.sleep") as sleep:
+            get_session.return_value.get.side_effect = [_response(503), _response(items=items)]
+            products = client.search_shopping("살충제")
+
+        assert len(products) == 1
+        assert sleep.call_count == 1
+
+    def test_429_pauses_shared_limiter(self, client):
+        """429 응답은 Retry-After만큼 공유 제어기를 멈춤"""
+        throttled = _response(429)
+        throttled.headers = {"Retry-After": "2"}
+        with patch.object(client, "_get_session") as get_session, \
+                patch.object(client.rate_limiter, "pause") as pause:
+            get_session.return_value.get.side_effect = [throttled, _response(items=[])]
+            client.search_shopping("살충제")
+
+        pause.assert_called_once_with(2.0)
+
+    def test_retries_connection_errors(self, client):
+        """연결 오류/타임아웃도 재시도"""
+        with patch.object(client, "_get_session") as get_session, \
+                patch("src.genesis_ai.infrastructure.clients.naver_client.time.sleep"):
+            get_session.return_value.get.side_effect = [
+                requests.ConnectionError("reset"),
+                requests.Timeout("slow"),
+                _response(items=[{"productId": "1", "title": "살충제", "lprice": "1000"}]),
+            ]
+            products = client.search_shopping("살충제")
+
+        assert len(products) == 1
+
+    def test_gives_up_after_max_retries(self):
+        """재시도 소진 시 NaverAPIError"""
+        naver = NaverClient(client_id="id", client_secret="secret", max_retries=2)
+        with patch.object(naver, "_get_session") as get_session, \
+                patch("src.genesis_ai.infrastructure.clients.naver_client.time.sleep"):
+            get_session.return_value.get.return_value = _response(500)
+            with pytest.raises(NaverAPIError):
+                naver.search_shopping("살충제")
+
+        assert get_session.return_value.get.call_count == 3
+
+
+class TestCache:
+    """검색 결과 캐시 테스트"""
+
+    def test_repeated_page_served_from_cache(self, client):
+        """같은 (query, display, start, sort) 재요청은 API를 호출하지 않음"""
+        items = [{"productId": "1", "title": "살충제", "lprice": "1000"}]
+        with patch.object(client, "_get_session") as get_session:
+            get_session.return_value.get.return_value = _response(items=items)
+            first = client.search_shopping("살충제", display=1)
+            second = client.search_shopping("살충제", display=1)
+            client.search_shopping("살충제", display=1, sort="asc")
+
+        assert first == second
+        assert get_session.return_value.get.call_count == 2
+        assert client.cache.stats["hits"] == 1
+
+    def test_cache_disabled(self):
+        """ttl 0이면 캐시 사용 안 함"""
+        assert NaverClient(client_id="id", client_secret="secret", cache_ttl=0).cache is None
+
+
+class TestPagination:
+    """다중 페이지 검색 테스트"""
+
+    @staticmethod
+    def _fake_fetch(catalog_size: int, duplicates: set[int] | None = None):
+        """start/display에 맞춰 가짜 상품을 돌려주는 _fetch_page 대체 함수"""
+        calls = []
+
+        def fetch(query, display, start, sort):
+            calls.append((start, display))
+            end = min(start + display - 1, catalog_size)
+            products = [
+                {"rank": r, "product_id": str(r - 1 if r in (duplicates or set()) else r), "price": r}
+                for r in range(start, end + 1)
+            ]
+            return products, catalog_size
+
+        return fetch, calls
+
+    def test_respects_start_limit(self, client):
+        """start 한도(1000)를 넘는 페이지는 요청하지 않음"""
+        fetch, calls = self._fake_fetch(catalog_size=100000)
+        with patch.object(client, "_fetch_page", side_effect=fetch):
+            products = client.search_shopping_all("살충제", total=5000)
+
+        assert len(products) == 1000
+        assert max(start for start, _ in calls) <= 1000
+
+    def test_merges_pages_in_rank_order(self, client):
+        """순위 순서 병합"""
+        fetch, calls = self._fake_fetch(catalog_size=1000)
+        with patch.object(client, "_fetch_page", side_effect=fetch):
+            products = client.search_shopping_all("살충제", total=250)
+
+        assert [p["rank"] for p in products] == list(range(1, 251))
+        assert sorted(calls) == [(1, 100), (101, 100), (201, 50)]
+
+    def test_deduplicates_by_product_id(self, client):
+        """productId 기준 중복 제거"""
+        fetch, calls = self._fake_fetch(catalog_size=1000, duplicates={101})
+        with patch.object(client, "_fetch_page", side_effect=fetch):
+            products = client.search_shopping_all("살충제", total=200)
+
+        ids = [p["product_id"] for p in products]
+        # 중복으로 빠진 1개를 채우기 위해 다음 순위를 추가로 요청
+        assert len(ids) == len(set(ids)) == 200
+        assert (201, 1) in calls
+
+    def test_stops_at_end_of_results(self, client):
+        """전체 결과 수를 넘는 페이지는 결과에 포함되지 않음"""
+        fetch, _ = self._fake_fetch(catalog_size=130)
+        with patch.object(client, "_fetch_page", side_effect=fetch):
+            products = client.search_shopping_all("살충제", total=500)
+
+        assert len(products) == 130
+
+    def test_iterator_is_lazy(self, client):
+        """지연 이터레이터는 필요한 만큼만 소비"""
+        fetch, _ = self._fake_fetch(catalog_size=1000)
+        with patch.object(client, "_fetch_page", side_effect=fetch):
+            iterator = client.iter_shopping("살충제", total=1000, max_workers=1)
+            first = [next(iterator) for _ in range(3)]
+            iterator.close()
+
+        assert [p["rank"] for p in first] == [1, 2, 3]
@@ -0,0 +1,65 @@
+"""
+NaverService 다중 검색어 병합 단위 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.genesis_ai.core.exceptions import DataCollectionError, NaverAPIError
+from src.genesis_ai.services.naver_service import NaverService
+
+PRODUCT = {"name": "벅스델타", "target": "바퀴벌레", "category": "살충제"}
+
+
+def _listing(product_id: str, rank: int, price: int = 1000) -> dict:
+    """검색 결과 상품"""
+    return {"product_id": product_id, "rank": rank, "title": product_id, "price": price}
+
+
+@pytest.fixture
+def service():
+    """검색어별 가짜 결과를 돌려주는 서비스"""
+    results = {
+        "벅스델타": [_listing("a", 1), _listing("b", 2)],
+        "바퀴벌레 퇴치": [_listing("c", 1), _listing("a", 2)],
+        "살충제": [_listing("d", 1)],
+    }
+    client = MagicMock()
+    client.search_shopping_all.side_effect = lambda query, total: results[query]
+    client.analyze_competitors.side_effect = lambda products: {"total_products": len(products)}
+    return NaverService(client=client)
+
+
+def test_build_queries_skips_missing_fields():
+    """제품에 없는 필드를 쓰는 템플릿은 제외"""
+    queries = NaverService.build_queries({"name": "벅스델타"}, ["{name}", "{target} 퇴치", "{name}"])
+    assert queries == ["벅스델타"]
+
+
+def test_merges_by_product_id_with_provenance(service):
+    """productId 기준 병합 및 검색어별 출처 기록"""
+    data = service.collect_product_data(PRODUCT)
+    by_id = {p["product_id"]: p for p in data["products"]}
+
+    assert [p["product_id"] for p in data["products"]] == ["a", "c", "d", "b"]
+    assert by_id["a"]["queries"] == ["벅스델타", "바퀴벌레 퇴치"]
+    assert by_id["a"]["query_ranks"] == {"벅스델타": 1, "바퀴벌레 퇴치": 2}
+    assert data["query_counts"] == {"벅스델타": 2, "바퀴벌레 퇴치": 2, "살충제": 1}
+    assert data["competitor_stats"]["total_products"] == 4
+
+
+def test_partial_failure_keeps_other_queries(service):
+    """일부 검색어 실패 시 나머지로 진행, 전부 실패하면 예외"""
+    ok = service._client.search_shopping_all.side_effect
+
+    def flaky(query, total):
+        if query == "살충제":
+            raise NaverAPIError("timeout")
+        return ok(query, total)
+
+    service._client.search_shopping_all.side_effect = flaky
+    assert service.search_many(["벅스델타", "살충제"])["failed_queries"] == ["살충제"]
+
+    service._client.search_shopping_all.side_effect = NaverAPIError("down")
+    with pytest.raises(DataCollectionError):
+        service.collect_product_data(PRODUCT)
@@ -0,0 +1,60 @@
+"""
+가격 스냅샷 저장소 단위 테스트
+"""
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.genesis_ai.infrastructure.storage.price_store import PriceSnapshotStore
+
+
+def _at(day: int, hour: int = 0) -> datetime:
+    """2024-01-{day} UTC"""
+    return datetime(2024, 1, day, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """이틀치 스냅샷이 들어 있는 저장소"""
+    store = PriceSnapshotStore(tmp_path)
+    store.append("살충제", [
+        {"product_id": "a", "price": 10000, "mall": "몰1", "brand": "A"},
+        {"product_id": "b", "price": 20000, "mall": "몰2", "brand": ""},
+    ], captured_at=_at(1, 9))
+    store.append("살충제", [
+        {"product_id": "a", "price": 9000, "mall": "몰1", "brand": "A"},
+    ], captured_at=_at(1, 21))
+    store.append("살충제", [
+        {"product_id": "a", "price": 8000, "mall": "몰1", "brand": "A"},
+        {"product_id": "c", "price": 0, "mall": "몰3", "brand": "C"},
+    ], captured_at=_at(2, 9))
+    store.append("모기향", [{"product_id": "a", "price": 7000}], captured_at=_at(2, 10))
+    return store
+
+
+def test_partitions_and_segment_columns(store):
+    """날짜 파티션 및 컬럼 읽기"""
+    assert store.partitions("살충제") == ["2024-01-01", "2024-01-02"]
+    first = next(store.iter_snapshots("살충제", columns=["product_id", "price"]))
+    assert first["product_id"] == ["a", "b"]
+    assert list(first["price"]) == [10000, 20000]
+    assert "mall" not in first
+
+
+def test_price_history(store):
+    """상품 가격 이력 (검색어/기간 필터)"""
+    history = store.price_history("a")
+    assert [h["price"] for h in history] == [10000, 9000, 8000, 7000]
+    assert [h["price"] for h in store.price_history("a", query="살충제", since=date(2024, 1, 2))] == [8000]
+    assert store.price_history("zzz") == []
+
+
+def test_daily_summary(store):
+    """일별 최저/평균 가격 (가격 0 제외)"""
+    summary = store.daily_summary("살충제")
+    assert summary[0] == {
+        "date": "2024-01-01", "min_price": 9000, "avg_price": 13000,
+        "max_price": 20000, "listings": 3, "snapshots": 2,
+    }
+    assert summary[1]["min_price"] == 8000 and summary[1]["listings"] == 1
+    assert store.daily_summary("없는 검색어") == []
@@ -0,0 +1,109 @@
+"""
+프롬프트 데이터 압축 단위 테스트
+"""
+import json
+
+from src.genesis_ai.core.analysis import estimate_tokens, pack_collected_data
+
+
+def _youtube_data() -> dict:
+    product = {"name": "벅스델타", "category": "살충제", "target": "모든 해충", "description": "설명 " * 200}
+    return {
+        "product": product,
+        "videos": [
+            {
+                "title": f"영상 {i}",
+                "channel": "채널",
+                "description": "긴 설명 " * 100,
+                "transcript": "자막 내용 " * 400,
+                "thumbnail": "https://img.example/thumb.jpg",
+            }
+            for i in range(3)
+        ],
+        "comments_total": 120,
+        "unique_comments": 100,
+        "pain_points": [{"text": "냄새가 심해요", "keyword": "냄새", "likes": 3}] * 10,
+        "gain_points": [{"text": "효과 최고", "keyword": "효과", "likes": 5}] * 10,
+        "keyword_stats": {
+            "pain": {
+                "matched_comments": 30,
+                "keywords": [{"keyword": "냄새", "count": 12, "ratio": 0.4, "likes": 10, "like_ratio": 0.5}],
+                "co_occurrence": [{"keywords": ["냄새", "환불"], "count": 3}],
+            },
+        },
+        "top_comments": [{"text": f"댓글 {i}", "likes": 20 - i} for i in range(20)],
+        "comment_stats": {"count": 100, "total_likes": 500, "avg_likes": 5.0},
+    }
+
+
+def _naver_data(count: int = 1000) -> dict:
+    products = [
+        {
+            "rank": i,
+            "title": f"<b>상품</b> {i}",
+            "price": 10000 + i,
+            "image": "https://img.example/p.jpg",
+            "link": "https://shop.example/p",
+            "brand": "브랜드",
+            "mall": "몰",
+        }
+        for i in range(1, count + 1)
+    ]
+    return {
+        "products": products,
+        "competitor_stats": {
+            "total_products": count,
+            "min_price": 10001,
+            "max_price": 10000 + count,
+            "avg_price": 10500,
+            "quantiles": {"p25": 10250, "p50": 10500},
+            "price_distribution": {"10000-30000": count},
+            "brand_stats": [{"name": "브랜드", "count": count, "median_price": 10500}],
+            "mall_stats": [{"name": "몰", "count": count, "median_price": 10500}],
+        },
+    }
+
+
+def test_estimate_tokens_counts_korean_per_char():
+    """한글은 글자당, ASCII는 4글자당 1토큰"""
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("가나다") == 3
+    assert estimate_tokens("") == 0
+
+
+def test_pack_drops_links_and_truncates_transcripts():
+    """링크/썸네일/긴 설명은 빼고 자막은 앞부분만 포함"""
+    packed = pack_collected_data(_youtube_data(), _naver_data(50), budget=100_000)
+    text = packed["text"]
+
+    assert "https://" not in text
+    assert "긴 설명" not in text
+    assert "벅스델타" in text and "냄새 12회" in text and "냄새+환불 3" in text
+    assert text.count("[제품]") == 1
+    # 자막은 영상당 PROMPT_TRANSCRIPT_CHARS(300)자 이하
+    video_lines = [line for line in text.splitlines() if "(채널)" in line]
+    assert len(video_lines) == 3
+    assert all(len(line) < 400 for line in video_lines)
+    # 상위 상품은 20개까지
+    assert "20. 상품 20" in text and "21. 상품 21" not in text
+
+
+def test_pack_fits_budget_and_reports_savings():
+    """예산을 넘으면 뒤쪽 섹션부터 빠지고 절감 토큰을 보고"""
+    youtube, naver = _youtube_data(), _naver_data()
+    raw = sum(estimate_tokens(json.dumps(d, ensure_ascii=False, indent=2)) for d in (youtube, naver))
+
+    packed = pack_collected_data(youtube, naver, budget=300)
+
+    assert packed["tokens"] <= 300
+    assert packed["raw_tokens"] == raw
+    assert packed["saved_tokens"] == raw - packed["tokens"]
+    assert "[가격 통계]" in packed["text"]
+    assert "영상" in packed["omitted"]
+
+
+def test_pack_empty_data():
+    """수집 데이터가 없으면 '데이터 없음'"""
+    packed = pack_collected_data(None, {})
+    assert packed["text"] == "데이터 없음"
+    assert packed["raw_tokens"] == 0
@@ -0,0 +1,73 @@
+"""
+토큰 버킷 호출 한도 제어기 단위 테스트
+"""
+from datetime import date
+
+import pytest
+
+from src.genesis_ai.core.exceptions import RateLimitExceededError
+from src.genesis_ai.infrastructure.resilience import TokenBucketRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 가짜 시계"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.day = date(2024, 1, 1)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """가짜 시계"""
+    return FakeClock()
+
+
+def _limiter(clock: FakeClock, **kwargs) -> TokenBucketRateLimiter:
+    """가짜 시계를 쓰는 제어기"""
+    return TokenBucketRateLimiter(clock=clock, sleep=clock.sleep, today=lambda: clock.day, **kwargs)
+
+
+class TestTokenBucketRateLimiter:
+    """TokenBucketRateLimiter 테스트"""
+
+    def test_burst_then_steady_rate(self, clock):
+        """버스트 소진 후에는 초당 rate개로 제한"""
+        limiter = _limiter(clock, rate=10)
+        for _ in range(30):
+            limiter.acquire()
+        # 처음 10개는 즉시, 나머지 20개는 0.1초 간격
+        assert clock.now == pytest.approx(2.0)
+
+    def test_daily_limit(self, clock):
+        """일일 한도 초과 시 예외, 날짜가 바뀌면 초기화"""
+        limiter = _limiter(clock, rate=100, daily_limit=3)
+        for _ in range(3):
+            limiter.acquire()
+        assert limiter.daily_remaining == 0
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire()
+
+        clock.day = date(2024, 1, 2)
+        limiter.acquire()
+        assert limiter.daily_count == 1
+
+    def test_pause_delays_next_call(self, clock):
+        """429 이후 pause 시간만큼 대기"""
+        limiter = _limiter(clock, rate=10)
+        limiter.pause(2.0)
+        limiter.acquire()
+        assert clock.now >= 2.0
+
+
+def test_parse_retry_after():
+    """Retry-After 헤더 해석"""
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) is None
+    assert parse_retry_after({}) is None
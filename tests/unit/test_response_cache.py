@@ -0,0 +1,74 @@
+"""
+Gemini 응답 디스크 캐시 단위 테스트
+"""
+import pytest
+
+from src.genesis_ai.infrastructure.cache import ResponseCache
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """가짜 시계"""
+    return FakeClock()
+
+
+def test_key_normalizes_prompt_and_includes_config():
+    """줄 끝 공백은 무시하고 모델/설정이 다르면 다른 키"""
+    key = ResponseCache.make_key("text", "m", "안녕  \n세계\n", {"temperature": 0.7})
+    assert key == ResponseCache.make_key("text", "m", "\n안녕\n세계", {"temperature": 0.7})
+    assert key != ResponseCache.make_key("text", "m2", "안녕\n세계", {"temperature": 0.7})
+    assert key != ResponseCache.make_key("text", "m", "안녕\n세계", {"temperature": 0.2})
+
+
+def test_text_and_image_persist_across_instances(tmp_path, clock):
+    """텍스트는 색인에, 이미지는 파일로 저장되고 재시작 후에도 조회"""
+    cache = ResponseCache(tmp_path, clock=clock)
+    cache.set("text", "t", "응답")
+    cache.set("image", "i", b"\x89PNG")
+
+    reopened = ResponseCache(tmp_path, clock=clock)
+    assert reopened.get("text", "t") == "응답"
+    assert reopened.get("image", "i") == b"\x89PNG"
+    assert (tmp_path / "gemini" / "blobs" / "i.bin").exists()
+    assert "PNG" not in (tmp_path / "gemini" / "index.json").read_text(encoding="utf-8")
+
+
+def test_ttl_per_kind(tmp_path, clock):
+    """호출 유형별 TTL, TTL 0이면 저장하지 않음"""
+    cache = ResponseCache(tmp_path, ttls={"text": 10, "analysis": 100, "image": 0}, clock=clock)
+    cache.set("text", "t", "a")
+    cache.set("analysis", "a", "b")
+    cache.set("image", "i", b"c")
+
+    clock.now += 50
+    assert cache.get("text", "t") is None
+    assert cache.get("analysis", "a") == "b"
+    assert cache.get("image", "i") is None
+    assert len(cache) == 1
+
+
+def test_lru_eviction_by_bytes(tmp_path, clock):
+    """크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (이미지 파일도 삭제)"""
+    cache = ResponseCache(tmp_path, max_bytes=10, clock=clock)
+    cache.set("image", "old", b"12345")
+    clock.now += 1
+    cache.set("text", "recent", "abcd")
+    clock.now += 1
+    cache.get("image", "old")  # 최근 사용으로 갱신
+    clock.now += 1
+    cache.set("text", "new", "xyz")
+
+    assert cache.get("text", "recent") is None
+    assert cache.get("image", "old") == b"12345"
+    assert cache.nbytes <= 10
+    assert cache.stats["evictions"] == 1
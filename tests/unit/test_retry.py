@@ -0,0 +1,133 @@
+"""
+공통 재시도 엔진 단위 테스트
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.genesis_ai.core.exceptions import (
+    GeminiAPIError,
+    InvalidConfigError,
+    NaverAPIError,
+    RateLimitExceededError,
+)
+from src.genesis_ai.infrastructure.resilience import (
+    RetryBudget,
+    RetryPolicy,
+    is_retryable,
+    retry_after_of,
+)
+
+
+class HttpError(Exception):
+    """googleapiclient HttpError 모양의 오류"""
+
+    def __init__(self, status: int, headers: dict | None = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status, headers=headers or {})
+
+
+def _wrapped(cause: Exception) -> GeminiAPIError:
+    """except 블록 안에서 감싼 GenesisAIError"""
+    try:
+        raise cause
+    except Exception:
+        try:
+            raise GeminiAPIError("생성 실패")
+        except GeminiAPIError as e:
+            return e
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (NaverAPIError("x", {"status_code": 429}), True),
+        (NaverAPIError("x", {"status_code": 503}), True),
+        (NaverAPIError("x", {"status_code": 400}), False),
+        (NaverAPIError("x", {"status_code": 400, "retryable": True}), True),
+        (RateLimitExceededError("일일 한도"), False),
+        (InvalidConfigError("설정"), False),
+        (requests.ConnectionError("reset"), True),
+        (requests.Timeout("slow"), True),
+        (HttpError(503), True),
+        (HttpError(403), False),
+        (_wrapped(HttpError(429)), True),
+        (_wrapped(ValueError("파싱")), False),
+        (ValueError("x"), False),
+    ],
+)
+def test_classification(error, expected):
+    """GenesisAIError 계층/원인 오류 기준 재시도 가능 여부"""
+    assert is_retryable(error) is expected
+
+
+def test_retry_after_from_details_and_headers():
+    """details의 retry_after, 원인 오류의 Retry-After 헤더"""
+    assert retry_after_of(NaverAPIError("x", {"retry_after": 3})) == 3.0
+    assert retry_after_of(_wrapped(HttpError(429, {"retry-after": "7"}))) == 7.0
+    assert retry_after_of(ValueError()) is None
+
+
+def test_retries_until_success_with_decorrelated_jitter():
+    """재시도 가능 오류는 백오프 후 재시도, 대기 시간은 [base, 직전×3] 구간이고 max_delay 이하"""
+    sleeps: list[float] = []
+    outcomes = [HttpError(503), HttpError(503), HttpError(503), "ok"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=5.0, sleep=sleeps.append, rng=random.Random(0))
+    assert policy.call(flaky) == "ok"
+
+    assert len(sleeps) == 3
+    previous = 1.0
+    for delay in sleeps:
+        assert 1.0 <= delay <= min(5.0, previous * 3)
+        previous = delay
+
+
+def test_retry_after_capped_and_non_retryable_raised():
+    """Retry-After는 max_delay로 제한, 재시도 불가 오류는 즉시 발생"""
+    sleeps: list[float] = []
+    policy = RetryPolicy(max_attempts=3, max_delay=4.0, sleep=sleeps.append)
+    calls = []
+
+    def throttled():
+        calls.append(1)
+        raise NaverAPIError("x", {"status_code": 429, "retry_after": 60})
+
+    with pytest.raises(NaverAPIError):
+        policy.call(throttled)
+    assert sleeps == [4.0, 4.0]
+    assert len(calls) == 3
+
+    with pytest.raises(InvalidConfigError):
+        policy.call(lambda: (_ for _ in ()).throw(InvalidConfigError("설정")))
+    assert len(sleeps) == 2
+
+
+def test_budget_limits_retries_across_calls():
+    """공유 예산이 소진되면 재시도하지 않고, 새 실행에서 초기화"""
+    budget = RetryBudget(ratio=0.0, min_retries=2)
+    policy = RetryPolicy(max_attempts=5, sleep=lambda _: None, budget=budget)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise HttpError(503)
+
+    for _ in range(2):
+        with pytest.raises(HttpError):
+            policy.call(failing)
+
+    # 첫 호출이 예산 2회를 모두 쓰고, 두 번째 호출은 재시도 없이 실패
+    assert len(calls) == 4
+    assert budget.stats == {"requests": 2, "retries": 2, "denied": 2}
+
+    budget.start_run()
+    assert budget.try_acquire()
@@ -0,0 +1,87 @@
+"""
+썸네일 후처리 단위 테스트
+"""
+import io
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from src.genesis_ai.config.constants import THUMBNAIL_MIN_QUALITY
+from src.genesis_ai.core.exceptions import InvalidConfigError
+from src.genesis_ai.infrastructure.media import ThumbnailProcessor, transcode_variants
+from src.genesis_ai.infrastructure.media.thumbnail_processor import _encode_within
+from src.genesis_ai.services.thumbnail_service import ThumbnailService
+
+
+def _png(size: tuple[int, int] = (1600, 900), mode: str = "RGBA", noise: bool = False) -> bytes:
+    """그라데이션 + 질감 PNG (모델이 돌려주는 원본과 같은 포맷)"""
+    gradient = Image.linear_gradient("L").resize(size)
+    # 사진처럼 부드러운 질감(저해상도 노이즈 확대), noise=True면 픽셀 단위 노이즈
+    grain = (size[0] // 10, size[1] // 10)
+    middle = Image.effect_noise(size, 60) if noise else Image.effect_noise(grain, 60).resize(size, Image.Resampling.BICUBIC)
+    image = Image.merge("RGB", (gradient, middle, gradient.rotate(180))).convert(mode)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("output_format, mime_type", [("webp", "image/webp"), ("jpeg", "image/jpeg")])
+def test_transcode_builds_resized_variants_without_upscaling(output_format, mime_type):
+    """preview/hd는 비율 유지 축소, original은 원본 크기, 모두 지정 포맷으로 원본보다 작게"""
+    source = _png()
+    variants = transcode_variants(source, output_format, 80)
+
+    assert {name: (v.width, v.height) for name, v in variants.items()} == {
+        "preview": (480, 270), "hd": (1280, 720), "original": (1600, 900),
+    }
+    for variant in variants.values():
+        assert variant.mime_type == mime_type
+        assert len(variant.data) < len(source)
+        assert Image.open(io.BytesIO(variant.data)).format == output_format.upper()
+
+    small = transcode_variants(_png((640, 360)), output_format, 80)
+    assert (small["hd"].width, small["hd"].height) == (640, 360)
+
+
+def test_size_budget_lowers_quality_down_to_floor():
+    """용량 예산을 넘으면 품질을 낮추고, 최저 품질에서 멈춤"""
+    image = Image.open(io.BytesIO(_png((640, 360), "RGB", noise=True)))
+    _, quality = _encode_within(image, "jpeg", 90, max_bytes=1)
+    assert quality == THUMBNAIL_MIN_QUALITY
+    _, quality = _encode_within(image, "jpeg", 90, max_bytes=10 * 1024 * 1024)
+    assert quality == 90
+
+
+def test_process_pool_keeps_order_and_falls_back_to_original():
+    """프로세스 풀에서 순서대로 처리, 읽을 수 없는 이미지는 원본 그대로"""
+    processor = ThumbnailProcessor("webp", 75, workers=1)
+    try:
+        results = processor.process_many([_png((800, 450)), b"not an image"])
+    finally:
+        processor.close()
+
+    assert results[0]["original"].width == 800
+    assert results[0]["hd"].mime_type == "image/webp"
+    assert list(results[1]) == ["original"]
+    assert results[1]["original"].data == b"not an image"
+
+    with pytest.raises(InvalidConfigError):
+        ThumbnailProcessor("gif")
+
+
+def test_service_attaches_variants_to_multiple_thumbnails():
+    """다중 썸네일 결과에 변형을 붙이고 image는 트랜스코딩된 original로 교체"""
+    raw = _png((1280, 720))
+    client = SimpleNamespace(
+        generate_multiple_thumbnails=lambda hook_texts, styles, **_: [
+            {"image": raw, "hook_text": hook, "style": style} for hook, style in zip(hook_texts, styles)
+        ]
+    )
+    service = ThumbnailService(client, processor=ThumbnailProcessor("jpeg", workers=0))
+    [result] = service.generate_multiple({"name": "제품"}, ["훅"])
+
+    assert set(result["variants"]) == {"preview", "hd", "original"}
+    assert result["image"] == result["variants"]["original"].data
+    assert len(result["image"]) < len(raw)
+    assert list(ThumbnailService(client).postprocess(raw)) == ["original"]
@@ -0,0 +1,74 @@
+"""
+썸네일 콘텐츠 주소 저장소 단위 테스트
+"""
+from src.genesis_ai.core.models import ImageVariant
+from src.genesis_ai.infrastructure.clients.gemini_client import GeminiClient
+from src.genesis_ai.infrastructure.storage.thumbnail_store import ThumbnailStore
+from src.genesis_ai.services.thumbnail_service import ThumbnailService
+
+PRODUCT = {"name": "벅스델타", "category": "살충제"}
+
+
+def _variants(data: bytes) -> dict[str, ImageVariant]:
+    return {
+        "preview": ImageVariant(name="preview", data=data[:2], mime_type="image/webp", width=480, height=270),
+        "original": ImageVariant(name="original", data=data, mime_type="image/webp", width=1600, height=900),
+    }
+
+
+class FakeClient(GeminiClient):
+    """이미지 생성만 가짜로 바꾼 클라이언트 (프롬프트 빌드는 실제 로직)"""
+
+    def __init__(self) -> None:
+        super().__init__("p", "l", image_model="image-model")
+        self.generated: list[tuple[str, str, bool]] = []
+
+    def generate_multiple_thumbnails(self, product, hook_texts, styles=None, progress_callback=None,
+                                     max_concurrency=None, use_cache=True):
+        self.generated += [(hook, style, use_cache) for hook, style in zip(hook_texts, styles)]
+        return [
+            {"image": f"{hook}-{len(self.generated)}".encode(), "hook_text": hook, "style": style}
+            for hook, style in zip(hook_texts, styles)
+        ]
+
+
+def test_key_covers_prompt_and_model_and_entries_round_trip(tmp_path):
+    """키는 프롬프트/모델별로 다르고, 저장한 변형을 그대로 읽으며 덮어쓰면 이전 파일 정리"""
+    store = ThumbnailStore(tmp_path)
+    key = ThumbnailStore.make_key("prompt", "model-a")
+    assert key != ThumbnailStore.make_key("prompt", "model-b")
+    assert store.get(key) is None
+
+    store.put(key, _variants(b"first"), hook_text="훅")
+    assert store.get(key)["original"].data == b"first"
+    store.put(key, _variants(b"second"))
+    loaded = store.get(key)
+    assert loaded["original"].data == b"second"
+    assert (loaded["preview"].width, loaded["preview"].mime_type) == (480, "image/webp")
+    assert len(list(store._entry_dir(key).iterdir())) == 3  # meta.json + 변형 2개
+
+    (store._entry_dir(key) / "meta.json").write_text("{broken", encoding="utf-8")
+    assert store.lookup([key]) == {}
+
+
+def test_service_reuses_stored_hooks_and_new_variation_regenerates(tmp_path):
+    """저장된 훅 문구는 생성하지 않고 재사용, new_variation이면 응답 캐시까지 건너뛰고 새로 생성"""
+    client = FakeClient()
+    service = ThumbnailService(client, store=ThumbnailStore(tmp_path))
+
+    first = service.generate_multiple(PRODUCT, ["훅A", "훅B"])
+    assert [r["cached"] for r in first] == [False, False]
+    assert service.lookup(PRODUCT, ["훅A", "훅B", "훅C"])[2] is None
+
+    second = service.generate_multiple(PRODUCT, ["훅A", "훅B", "훅C"])
+    assert [r["cached"] for r in second] == [True, True, False]
+    assert second[0]["image"] == first[0]["image"]
+    assert client.generated[2:] == [("훅C", "모던", True)]
+
+    # 같은 훅 문구라도 스타일이 다르면 다른 썸네일
+    assert service.lookup(PRODUCT, ["훅A"], styles=["미니멀"]) == [None]
+
+    renewed = service.generate_multiple(PRODUCT, ["훅A"], new_variation=True)
+    assert renewed[0]["cached"] is False
+    assert client.generated[-1] == ("훅A", "드라마틱", False)
+    assert service.lookup(PRODUCT, ["훅A"])[0]["original"].data == renewed[0]["image"]
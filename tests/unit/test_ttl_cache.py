@@ -0,0 +1,63 @@
+"""
+TTL + stale-while-revalidate 캐시 단위 테스트
+"""
+import pytest
+
+from src.genesis_ai.infrastructure.cache import CacheState, TTLCache
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """가짜 시계"""
+    return FakeClock()
+
+
+def test_fresh_stale_and_expired(clock):
+    """신선/갱신 필요/만료 구간"""
+    cache = TTLCache(ttl=10, stale_ttl=20, clock=clock)
+    cache.set("k", 1)
+
+    assert cache.get("k") == (1, CacheState.FRESH)
+    clock.now = 15
+    assert cache.get("k") == (1, CacheState.STALE)
+    clock.now = 31
+    assert cache.get("k") == (None, CacheState.MISS)
+    assert len(cache) == 0
+
+
+def test_stale_value_served_while_refreshing(clock):
+    """만료 직후에는 이전 값을 바로 반환하고 백그라운드에서 갱신"""
+    cache = TTLCache(ttl=10, stale_ttl=100, clock=clock)
+    cache.set("k", "old")
+    clock.now = 50
+
+    assert cache.get_or_load("k", lambda: "new") == "old"
+    cache.close(wait=True)
+    assert cache.get("k") == ("new", CacheState.FRESH)
+    assert cache.stats["refreshes"] == 1
+
+
+def test_lru_eviction_by_entries_and_bytes(clock):
+    """항목 수/바이트 한도 초과 시 가장 오래 안 쓴 항목 제거"""
+    cache = TTLCache(ttl=10, max_entries=2, max_bytes=100, sizeof=lambda v: v, clock=clock)
+    cache.set("a", 10)
+    cache.set("b", 10)
+    cache.get("a")
+    cache.set("c", 10)
+    assert cache.get("b")[1] is CacheState.MISS
+    assert cache.get("a")[1] is CacheState.FRESH
+
+    cache.set("d", 95)
+    assert len(cache) == 1 and cache.nbytes == 95
+    cache.set("huge", 1000)
+    assert cache.get("huge")[1] is CacheState.MISS
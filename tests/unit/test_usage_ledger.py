@@ -0,0 +1,79 @@
+"""
+모델 호출 사용량 원장/보고서 단위 테스트
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src.genesis_ai.infrastructure.clients.gemini_client import GeminiClient
+from src.genesis_ai.infrastructure.storage.usage_store import UsageReportStore
+from src.genesis_ai.infrastructure.telemetry import UsageLedger, estimate_cost
+
+
+def _response(prompt: int, candidates: int, cached: int = 0, text: str = '{"target_audience": {"primary": "주부"}}'):
+    """usage_metadata가 담긴 generate_content 응답"""
+    metadata = SimpleNamespace(
+        prompt_token_count=prompt,
+        candidates_token_count=candidates,
+        cached_content_token_count=cached,
+        thoughts_token_count=None,
+    )
+    return SimpleNamespace(text=text, usage_metadata=metadata)
+
+
+def test_estimate_cost_splits_cached_and_video():
+    """캐시 토큰은 캐시 단가, 영상은 초당 단가"""
+    # 입력 1M(캐시 0.5M) + 출력 0.1M: 0.5×2.0 + 0.5×0.2 + 0.1×12.0
+    cost = estimate_cost("gemini-3-pro-preview", 1_000_000, 100_000, cached_tokens=500_000)
+    assert cost == pytest.approx(2.3)
+    assert estimate_cost("veo-3.1-fast-generate-001", video_seconds=8) == pytest.approx(1.2)
+    assert estimate_cost("unknown-model", 1000, 1000) == 0.0
+
+
+def test_gemini_calls_recorded_in_run_ledger():
+    """generate_content 응답의 usage_metadata와 지연 시간을 호출 이름별로 기록"""
+    ledger = UsageLedger()
+    client = GeminiClient(project_id="p", location="l", usage_ledger=ledger)
+    responses = [_response(1200, 300, cached=200), _response(800, 100)]
+    client._client = SimpleNamespace(
+        models=SimpleNamespace(generate_content=lambda **kwargs: responses.pop(0))
+    )
+
+    client.generate_text("첫 번째", use_cache=False)
+    client.analyze_marketing_data({}, {}, "벅스델타", use_search_grounding=False, use_cache=False)
+    usage = ledger.snapshot()
+
+    assert [call.operation for call in usage.calls] == ["Gemini 텍스트 생성", "Gemini 마케팅 분석"]
+    assert usage.calls[0].model == "gemini-3-pro-preview"
+    assert usage.totals["calls"] == 2
+    assert usage.totals["prompt_tokens"] == 2000
+    assert usage.totals["cached_tokens"] == 200
+    assert usage.totals["cost_usd"] > 0
+    assert usage.by_operation["Gemini 마케팅 분석"]["candidate_tokens"] == 100
+
+    ledger.start_run()
+    assert ledger.snapshot().calls == []
+
+
+def test_report_aggregates_runs_and_flags_prompt_regression(tmp_path):
+    """최근 실행 집계, 호출당 입력 토큰이 이전 실행 중앙값보다 크게 늘면 회귀로 표시"""
+    store = UsageReportStore(tmp_path)
+    for prompt in (1000, 1100, 900, 1000, 2500):
+        ledger = UsageLedger()
+        ledger.record("Gemini 마케팅 분석", "gemini-3-pro-preview", 1.0, _response(prompt, 100))
+        ledger.record("Gemini 이미지 생성", "gemini-3-pro-image-preview", 2.0, _response(300, 1300))
+        store.append("벅스델타", ledger.snapshot())
+    store.append("빈 실행", UsageLedger().snapshot())
+
+    report = store.report()
+
+    assert report["runs"] == 5
+    assert report["totals"]["calls"] == 10
+    assert report["by_operation"]["Gemini 마케팅 분석"]["avg_prompt_tokens"] == 1300.0
+    assert report["regressions"] == [{
+        "operation": "Gemini 마케팅 분석",
+        "baseline_prompt_tokens": 1000.0,
+        "prompt_tokens": 2500.0,
+        "ratio": 2.5,
+    }]
+    assert store.report(window=2)["runs"] == 2
@@ -0,0 +1,44 @@
+"""
+YouTubeClient 데이터 수집 단위 테스트
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.genesis_ai.infrastructure.clients.youtube_client import YouTubeClient
+
+PRODUCT = {"name": "벅스델타", "target": "바퀴벌레", "category": "살충제"}
+
+
+@pytest.fixture
+def client():
+    """검색/자막/댓글 조회를 가짜로 대체한 클라이언트"""
+    youtube = YouTubeClient(api_key="test")
+    videos = [{"id": "v1", "title": "t", "description": "d"}]
+    comments = [
+        {"comment_id": "c1", "text": "그냥 그래요", "likes": 1, "author": "a", "published_at": ""},
+        {"comment_id": "c2", "text": "냄새가 심해요", "likes": 9, "author": "b", "published_at": ""},
+        {"comment_id": "c3", "text": "효과 최고", "likes": 4, "author": "c", "published_at": ""},
+    ]
+    with patch.object(youtube, "search", return_value=videos), \
+            patch.object(youtube, "get_transcript", return_value=None), \
+            patch.object(youtube, "_collect_comments", return_value=comments):
+        yield youtube
+
+
+def test_top_comments_sorted_by_likes(client):
+    """top_comments는 수집 순서가 아닌 좋아요 순"""
+    data = client.collect_video_data(PRODUCT, max_results=1, incremental=False)
+    assert [c["text"] for c in data["top_comments"]] == ["냄새가 심해요", "효과 최고", "그냥 그래요"]
+
+
+def test_skips_keyword_analysis_without_comments(client):
+    """댓글 미수집 시 키워드 분석을 실행하지 않음"""
+    with patch(
+        "src.genesis_ai.infrastructure.clients.youtube_client.analyze_pain_points"
+    ) as analyze:
+        data = client.collect_video_data(PRODUCT, max_results=1, include_comments=False)
+
+    analyze.assert_not_called()
+    assert data["pain_points"] == []
+    assert data["keyword_stats"] == {}